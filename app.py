@@ -1,23 +1,25 @@
 # app.py
 import streamlit as st
 import os
-import time
 import pandas as pd
 import json
-import multiprocessing
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import math
 from pipeline.pipeline import PipelineOrchestrator
 from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
 from pipeline.state_managers.global_state_manager import GlobalStateManager
-from pipeline.workflows.resume_parser import ResumeParser
-from pipeline.workflows.resume_data_processor import ResumeDataProcessor
-from pipeline.workflows.features_extractor import DataExtractor
-from pipeline.workflows.validators import PreScreeningValidator
-from pipeline.workflows.mandatory_params_matcher import MandatoryParamsMatcher
-from pipeline.workflows.optional_params_matcher import OptionalParamsMatcher
-from pipeline.workflows.score_aggregator import ScoreAggregator
+from pipeline.state_managers.screening_config import ScreeningConfig
 from pipeline.workflows.llm_jd_processor import LLMJobDescriptionProcessor
 from pipeline.workflows.llm_resumes_analyzer import LLMResumesAnalyzer
+from pipeline.engines.extraction_engine import ResumeExtractionEngine
+from pipeline.engines.archive_ingest import ArchiveIngestor, is_archive
+from pipeline.engines.rescoring import ResumeRescorer
+from pipeline.engines.job_runner import ScreeningJobRunner
+from pipeline.engines.screening_job import ScreeningJob
+from pipeline.scoring.leaderboard import ResumeLeaderboard
+from pipeline.scoring.score_matrix import ScoreMatrix
+from pipeline.storage.content_store import ContentStore
+from pipeline.storage.results_store import ResultsStore
+from pipeline.utils.parsed_text_cache import ParsedTextCache
 from pipeline.config import (
     ROLE_MATCHING_DEFINITIONS,
     JOB_DESC_FOR_JAVA_DEVELOPER,
@@ -258,24 +260,31 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-# Create directories
-UPLOAD_DIR = "uploads"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
 MANDATORY_KEYWORDS_INPUT_KEY = "mandatory_keywords_input"
 
+# Resumes kept ranked as results arrive, and shown per page of the results table
+LEADERBOARD_TOP_K = 100
+RESULTS_PAGE_SIZE = 25
+
+# Seconds between refreshes of the top candidates while resumes are screened
+SCREENING_PROGRESS_REFRESH_SECONDS = 1.0
 
-# Initialize session state variables
-if "completed_resumes" not in st.session_state:
-    st.session_state.completed_resumes = 0
 
-if "total_resumes" not in st.session_state:
-    st.session_state.total_resumes = 0
+# Initialize session state variables
+# Background job screening the latest batch of resumes, its id is kept in the URL
+# so a reloaded page picks it up again
+if "screening_job" not in st.session_state:
+    st.session_state.screening_job = None
 
 if "processing_status" not in st.session_state:
     st.session_state.processing_status = ""
 
-if "results" not in st.session_state:
-    st.session_state.results = []
+if "leaderboard" not in st.session_state:
+    st.session_state.leaderboard = ResumeLeaderboard(top_k=LEADERBOARD_TOP_K)
+
+# Columnar copy of the results, rows in the order of the leaderboard entries
+if "results_store" not in st.session_state:
+    st.session_state.results_store = ResultsStore(ContentStore.temporary())
 
 if "global_state" not in st.session_state:
     st.session_state.global_state = GlobalStateManager(
@@ -304,150 +313,260 @@ if "reset_config_btn_clicked" not in st.session_state:
 if "selected_job_role" not in st.session_state:
     st.session_state.selected_job_role = "JAVA_DEVELOPER"
 
-# Configure thread pool
-MAX_WORKERS = 4  # Adjust based on system capabilities
-CHUNK_SIZE = 10  # Process resumes in chunks
-
-
-def save_uploaded_file(uploaded_file):
-    """Save uploaded file to disk and return the path"""
-    file_path = os.path.join(UPLOAD_DIR, uploaded_file.name)
-    with open(file_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
-    return file_path
-
-
-def process_resume_wrapper(file_info, use_default_jd, job_description, global_state):
-    """Process a single resume with proper state management"""
-    resume_name, file_path = file_info
-    try:
-        # Initialize state manager
-        state = PipelineStateManager()
-
-        # Create a copy of global state to avoid threading issues
-        local_global_state = GlobalStateManager(
-            job_role=global_state.job_role,
-            mandatory_screening_params=global_state.mandatory_screening_params,
-            optional_screening_params=global_state.optional_screening_params,
-            job_description=(
-                job_description if not use_default_jd else global_state.job_description
-            ),
-        )
+# Screening config the current results were scored with
+if "results_screening_fingerprint" not in st.session_state:
+    st.session_state.results_screening_fingerprint = None
 
-        # Copy other properties
-        local_global_state.use_partial_matching = global_state.use_partial_matching
-        local_global_state.use_case_sensitive = global_state.use_case_sensitive
-        local_global_state.use_strict_experience_check = (
-            global_state.use_strict_experience_check
-        )
-        local_global_state.working_exp_criteria = global_state.working_exp_criteria
-
-        # Define pipeline stages
-        pipeline_stages = [
-            ("Resume Parser", ResumeParser(path=file_path)),
-            ("Resume Data Processor", ResumeDataProcessor()),
-            ("Data Extractor", DataExtractor()),
-            ("Pre-screening Validator", PreScreeningValidator()),
-            ("Mandatory Keywords Matcher", MandatoryParamsMatcher()),
-            ("Optional Keywords Matcher", OptionalParamsMatcher()),
-            ("Score Aggregator", ScoreAggregator()),
-        ]
 
-        # Create and run pipeline
-        pipeline = PipelineOrchestrator(pipeline_stages)
-        result = pipeline.orchestrate(state=state, global_state=local_global_state)
+@st.cache_resource
+def get_extraction_engine():
+    """Pre-warmed process pool shared across reruns and sessions"""
+    return ResumeExtractionEngine()
+
 
-        # Get viewer path from the file_info
-        view_path = os.path.join("resume_viewer", resume_name)
-        return resume_name, result, view_path, None
-    except Exception as e:
-        return resume_name, None, None, str(e)
+@st.cache_resource
+def get_screening_job_runner():
+    """Background screening jobs, shared across reruns and sessions"""
+    return ScreeningJobRunner(get_extraction_engine())
 
 
-def process_resumes(uploaded_resumes, use_default_jd, job_description, global_state):
-    """Process uploaded resumes in parallel using ThreadPoolExecutor and update session state"""
-    start_time = time.time()
-    # Reset counters
-    st.session_state.completed_resumes = 0
-    st.session_state.total_resumes = len(uploaded_resumes)
-    st.session_state.results = []
+def attach_screening_job(screening_job: ScreeningJob):
+    """Show the progress and results of a screening job in this session"""
+    st.session_state.screening_job = screening_job
+    # Read only while the job runs, the session takes its own copy once it's done
+    st.session_state.leaderboard = screening_job.leaderboard
+    st.session_state.results_store = screening_job.results_store
+    st.session_state.results_screening_fingerprint = (
+        screening_job.screening_config.fingerprint
+    )
+    st.query_params["job"] = screening_job.job_id
+    if not screening_job.is_running:
+        take_screening_job_results(screening_job)
+
 
-    status_placeholder = st.empty()
-    progress_bar = st.progress(0)
+def take_screening_job_results(screening_job: ScreeningJob):
+    """
+    Give the session its own copy of the results of a finished job, so rescoring
+    them doesn't change the results other sessions on the same job see
+    """
+    (
+        st.session_state.leaderboard,
+        st.session_state.results_store,
+    ) = screening_job.copy_results()
+    # The job's results always keep the scores of the config it was started with
+    st.session_state.results_screening_fingerprint = (
+        screening_job.screening_config.fingerprint
+    )
+
+
+if st.session_state.screening_job is None and "job" in st.query_params:
+    reloaded_screening_job = get_screening_job_runner().get(st.query_params["job"])
+    if reloaded_screening_job is not None:
+        attach_screening_job(reloaded_screening_job)
+
+
+def process_resumes(uploaded_resumes, screening_config):
+    """
+    Start a background job screening the uploaded resumes on the extraction engine.
+    The results land in the session's leaderboard and results store as they complete.
+    """
+    uploaded_archives = [
+        upload for upload in uploaded_resumes if is_archive(upload.name)
+    ]
+    uploaded_resumes = [
+        upload for upload in uploaded_resumes if not is_archive(upload.name)
+    ]
+
+    total_resumes = len(uploaded_resumes) + sum(
+        ArchiveIngestor.count_resumes(archive) or 0 for archive in uploaded_archives
+    )
+    st.session_state.pop("results_page", None)
 
-    # Save resumes to disk for processing
-    temp_files = []
+    # Resumes are fed to the pipeline straight from the upload buffers
+    resume_buffers = []
+    # Resumes extracted from archives have no viewer copy on disk
+    view_paths = {}
     viewer_dir = "resume_viewer"
     os.makedirs(viewer_dir, exist_ok=True)
-    os.makedirs(UPLOAD_DIR, exist_ok=True)
 
     for resume in uploaded_resumes:
-        file_path = os.path.join(UPLOAD_DIR, resume.name)
-        with open(file_path, "wb") as f:
-            f.write(resume.getbuffer())
-        temp_files.append((resume.name, file_path))
+        resume_buffers.append((resume.name, resume.getbuffer()))
 
-        # Create permanent copy for viewing
-        view_path = os.path.join(viewer_dir, resume.name)
+        # Create permanent copy for viewing, named and looked up by the content so
+        # that resumes sharing a name don't take each other's copy
+        resume_digest = ParsedTextCache.digest(resume.getbuffer())
+        view_path = os.path.join(viewer_dir, f"{resume_digest}.pdf")
         with open(view_path, "wb") as f:
             f.write(resume.getbuffer())
+        view_paths[resume_digest] = view_path
+
+    # Process resumes on the process pool, results arrive as they complete.
+    # Resumes inside archives are streamed out of the upload member by member.
+    screening_job = get_screening_job_runner().submit(
+        resume_buffers,
+        uploaded_archives,
+        screening_config,
+        ResumeLeaderboard(top_k=LEADERBOARD_TOP_K),
+        ResultsStore(ContentStore.temporary()),
+        total_resumes,
+        view_paths,
+    )
+    attach_screening_job(screening_job)
+
+
+@st.fragment(run_every=SCREENING_PROGRESS_REFRESH_SECONDS)
+def render_screening_progress():
+    """Progress of the running screening job and the top candidates found so far"""
+    screening_job = st.session_state.screening_job
+    with screening_job.lock:
+        progress = screening_job.progress
+        status = screening_job.status
+        processed_resumes = screening_job.processed_resumes
+        rows = st.session_state.results_store.rows(
+            st.session_state.leaderboard.page_indexes(0, RESULTS_PAGE_SIZE)
+        )
 
-    # Determine number of workers (limit based on CPU count)
-    max_workers = min(multiprocessing.cpu_count(), 4)
-
-    # Process resumes using ThreadPoolExecutor
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_resume = {
-            executor.submit(
-                process_resume_wrapper,
-                file_info,
-                use_default_jd,
-                job_description,
-                global_state,
-            ): file_info[0]
-            for file_info in temp_files
+    st.progress(progress)
+    st.text(status or "Starting resume analysis...")
+    if not screening_job.is_cancelled and st.button(
+        "⏹️ Cancel Analysis", key="cancel_analysis_btn"
+    ):
+        get_screening_job_runner().cancel(screening_job.job_id)
+        st.toast("Cancelling the analysis, the resumes screened so far are kept")
+
+    if rows:
+        st.subheader("Screening Analysis Results")
+        st.caption(
+            f"Top candidates among the {processed_resumes} of {screening_job.total_resumes} resumes screened so far"
+        )
+        comparison_df = pd.DataFrame(
+            [{"Rank": i + 1, **build_comparison_row(row)} for i, row in enumerate(rows)]
+        )
+        st.dataframe(
+            comparison_df.drop(columns=["View Path", "Content ID"]),
+            use_container_width=True,
+            hide_index=True,
+        )
+
+    # Done, rerun the whole app for the full results
+    if not screening_job.is_running:
+        st.rerun()
+
+
+def build_comparison_row(row):
+    """Row of the results table for a screened resume, from its results store row"""
+    # Check if pipeline stopped early
+    if row["skipped"]:
+        return {
+            "Resume": row["resume"],
+            "Status": "❌ Failed",
+            "Experience (years)": "N/A",
+            "Matching Score": "0/100",
+            "Core Competencies Matched": "N/A",
+            "Additional Competencies Matched": "N/A",
+            "Screening Outcome": row["screening_outcome"] or "",
+            "View Path": row["view_path"],
+            "Content ID": row["content_id"],
         }
 
-        # Process results as they complete
-        for i, future in enumerate(as_completed(future_to_resume)):
-            resume_name = future_to_resume[future]
-            try:
-                resume_name, result, view_path, error = future.result()
+    # Prepare optional categories string
+    optional_categories_str = ""
+    for group in row["matched_optional_groups"]:
+        optional_categories_str += f"({group['group']}): {', '.join(group['terms'])}"
+        optional_categories_str += "\n\n"
+
+    return {
+        "Resume": row["resume"],
+        "Status": f"{'✅ Passed' if row['passed'] else '❌ Failed'}",
+        "Experience (years)": (
+            str(row["working_experience"]) if row["working_experience"] else "Unknown"
+        ),
+        "Email Address": row["email"] or "Failed to extract email",
+        "Contact Number": row["contact"] or "Failed to extract contact number",
+        "Matching Score": f"{row['score']:.2f}/100",
+        "Core Competencies Matched": f"{', '.join(row['mandatory_keyword_matches'])}",
+        "Additional Competencies Matched": optional_categories_str,
+        "Screening Outcome": row["screening_outcome"] or "N/A",
+        "View Path": row["view_path"],
+        "Content ID": row["content_id"],
+    }
 
-                if error:
-                    status_placeholder.text(
-                        f"❌ Failed to process {resume_name}: {error}"
-                    )
-                else:
-                    st.session_state.results.append((resume_name, result, view_path))
-                    st.session_state.completed_resumes += 1
 
-                # Update progress
-                progress = (i + 1) / len(uploaded_resumes)
-                progress_bar.progress(progress)
+def render_weight_sensitivity_explorer(results, screening_config):
+    """What-if explorer showing how the ranking shifts when the weights change"""
+    screened_results = [
+        (resume_name, result) for resume_name, result, _ in results if result
+    ]
+    if not screened_results or not screening_config.optional_screening_params:
+        return
 
-                # Update status text
-                status_placeholder.text(
-                    f"✅ Completed resume {i+1}/{len(uploaded_resumes)}: {resume_name}"
-                )
-            except Exception as e:
-                status_placeholder.text(f"❌ Error processing {resume_name}: {str(e)}")
+    with st.expander("What-if: Weight Sensitivity"):
+        score_matrix = ScoreMatrix.from_states(
+            [resume_name for resume_name, _ in screened_results],
+            [result for _, result in screened_results],
+            screening_config,
+        )
 
-    # Clean up temporary files
-    for _, file_path in temp_files:
-        if os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-            except:
-                pass
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            group_name = st.selectbox(
+                "Optional parameter group",
+                options=score_matrix.group_names,
+                key="sensitivity_group",
+            )
+            group_weight = st.number_input(
+                "New weight",
+                min_value=0.0,
+                value=float(
+                    score_matrix.group_weights[
+                        score_matrix.group_names.index(group_name)
+                    ]
+                ),
+                step=1.0,
+                key=f"sensitivity_weight_{group_name}",
+            )
+        with col2:
+            mandatory_points = st.number_input(
+                "Points for mandatory parameters",
+                min_value=0.0,
+                value=float(screening_config.reserved_points_for_mandatory_params),
+                step=5.0,
+                key="sensitivity_mandatory_points",
+            )
+        with col3:
+            optional_points = st.number_input(
+                "Points for optional parameters",
+                min_value=0.0,
+                value=float(screening_config.reserved_points_for_optional_params),
+                step=5.0,
+                key="sensitivity_optional_points",
+            )
 
-    # Final status update
-    status_placeholder.text(
-        f"✅ Completed processing {st.session_state.completed_resumes} of {st.session_state.total_resumes} resumes"
-    )
-    end_time = time.time()
-    print(f"Total time taken for processing: {end_time - start_time} seconds")
+        report = score_matrix.sensitivity(
+            score_matrix.weights_with({group_name: group_weight}),
+            reserved_points_for_mandatory_params=mandatory_points,
+            reserved_points_for_optional_params=optional_points,
+        )
+        moved_resumes = report.moved_resumes()
+        if moved_resumes:
+            st.dataframe(
+                pd.DataFrame(moved_resumes)
+                .round({"score": 2, "new_score": 2})
+                .rename(
+                    columns={
+                        "resume": "Resume",
+                        "rank": "Rank",
+                        "new_rank": "New Rank",
+                        "rank_change": "Rank Change",
+                        "score": "Matching Score",
+                        "new_score": "New Matching Score",
+                    }
+                ),
+                use_container_width=True,
+                hide_index=True,
+            )
+        else:
+            st.info("The ranking does not change with these weights")
 
 
 def main():
@@ -732,10 +851,12 @@ def main():
 
     # Upload Resumes section (full width)
     st.subheader("Upload Resume")
-    st.text("You can upload multiple resumes at once")
+    st.text(
+        "You can upload multiple resumes at once, or ZIP archives containing resumes"
+    )
     uploaded_resumes = st.file_uploader(
-        "Choose PDF files",
-        type="pdf",
+        "Choose PDF or ZIP files",
+        type=["pdf", "zip"],
         accept_multiple_files=True,
         key="resume_uploader",
     )
@@ -745,116 +866,94 @@ def main():
     elif "uploaded_resumes" in st.session_state:
         uploaded_resumes = st.session_state.uploaded_resumes
 
+    screening_job = st.session_state.screening_job
+    is_screening = screening_job is not None and screening_job.is_running
+
     # Process button
     if uploaded_resumes:
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
-            if st.button("▶️ Begin Resume Analysis", key="begin_analysis_btn"):
+            if st.button(
+                "▶️ Begin Resume Analysis",
+                key="begin_analysis_btn",
+                disabled=is_screening,
+            ):
                 process_resumes(
                     st.session_state.uploaded_resumes,
-                    use_default_jd,
-                    job_description,
-                    st.session_state.global_state,
+                    ScreeningConfig.from_global_state(st.session_state.global_state),
                 )
+                screening_job = st.session_state.screening_job
+                is_screening = True
+
+    # The results are shown as they come in, the rest of the page waits for the batch
+    if is_screening:
+        render_screening_progress()
+        return
+
+    if (
+        screening_job is not None
+        and st.session_state.leaderboard is screening_job.leaderboard
+    ):
+        take_screening_job_results(screening_job)
+
+    if screening_job is not None and screening_job.finished_at is not None:
+        st.caption(
+            screening_job.status
+            if screening_job.is_cancelled
+            else f"Screened {screening_job.completed_resumes} of {screening_job.total_resumes} resumes in {screening_job.finished_at - screening_job.started_at:.1f}s"
+        )
+
+    # Rescore the results from the stored matches when the screening config changed
+    screening_config = ScreeningConfig.from_global_state(st.session_state.global_state)
+    if (
+        st.session_state.leaderboard
+        and screening_config.fingerprint
+        != st.session_state.results_screening_fingerprint
+    ):
+        rescored_resumes = ResumeRescorer().rescore(
+            (result for _, result, _ in st.session_state.leaderboard.entries),
+            screening_config,
+        )
+        st.session_state.leaderboard.refresh()
+        st.session_state.results_store.update_outcomes(
+            result for _, result, _ in st.session_state.leaderboard.entries
+        )
+        st.session_state.results_screening_fingerprint = screening_config.fingerprint
+        st.toast(
+            f"Rescored {rescored_resumes} resumes with the updated screening parameters"
+        )
 
     # Display results if available
-    if st.session_state.results:
+    leaderboard = st.session_state.leaderboard
+    if leaderboard:
         st.subheader("Screening Analysis Results")
 
-        comparison_data = []
-        for resume_name, result, view_path in st.session_state.results:
-            if result is None:
-                continue
-
-            # Check if pipeline stopped early
-            if result.skip_pipeline_from_execution:
-                comparison_data.append(
-                    {
-                        "Resume": resume_name,
-                        "Status": "❌ Failed",
-                        "Experience (years)": "N/A",
-                        "Matching Score": "0/100",
-                        "Core Competencies Matched": "N/A",
-                        "Additional Competencies Matched": "N/A",
-                        "Screening Outcome": result.pipeline_skip_reason,
-                        "View Path": view_path,
-                        "Processed Content": (
-                            result.processed_content_of_resume
-                            if hasattr(result, "processed_content_of_resume")
-                            else ""
-                        ),
-                    }
+        page_count = math.ceil(len(leaderboard) / RESULTS_PAGE_SIZE)
+        page_number = 0
+        if page_count > 1:
+            page_number = (
+                st.number_input(
+                    f"Page (of {page_count})",
+                    min_value=1,
+                    max_value=page_count,
+                    value=1,
+                    step=1,
+                    key="results_page",
                 )
-                continue
-
-            # Prepare optional categories string
-            optional_categories_str = ""
-            for category, matched_terms in result.matched_optional_groups.items():
-                optional_categories_str += f"({category}): {', '.join(matched_terms)}"
-                optional_categories_str += "\n\n"
-
-            comparison_data.append(
-                {
-                    "Resume": resume_name,
-                    "Status": f"{'✅ Passed' if result.passed else '❌ Failed'}",
-                    "Experience (years)": (
-                        str(result.extracted_working_exp)
-                        if hasattr(result, "extracted_working_exp")
-                        and result.extracted_working_exp
-                        else "Unknown"
-                    ),
-                    "Email Address": (
-                        result.extracted_email
-                        if hasattr(result, "extracted_email") and result.extracted_email
-                        else "Failed to extract email"
-                    ),
-                    "Contact Number": (
-                        result.extracted_contact
-                        if hasattr(result, "extracted_contact")
-                        and result.extracted_contact
-                        else "Failed to extract contact number"
-                    ),
-                    "Matching Score": f"{result.score:.2f}/100",
-                    "Core Competencies Matched": f"{', '.join(result.mandatory_keyword_matches)}",
-                    "Additional Competencies Matched": optional_categories_str,
-                    "Screening Outcome": (
-                        result.pipeline_skip_reason
-                        if hasattr(result, "pipeline_skip_reason")
-                        and result.pipeline_skip_reason
-                        else "N/A"
-                    ),
-                    "View Path": view_path,
-                    "Processed Content": (
-                        result.processed_content_of_resume
-                        if hasattr(result, "processed_content_of_resume")
-                        else ""
-                    ),
-                }
+                - 1
             )
 
-        # Sort comparison_data by matching score first, then by experience (handling 'Unknown' experience)
-        comparison_data = sorted(
-            comparison_data,
-            key=lambda x: (
-                float(
-                    x["Matching Score"].split("/")[0]
-                ),  # Convert "XX.XX/100" to float
-                (
-                    float(x["Experience (years)"])
-                    if not isinstance(x["Experience (years)"], str)
-                    else -1
-                ),
-            ),
-            reverse=True,
-        )
-
-        # Add a rank column to the comparison_data
+        # Only the resumes on the displayed page are turned into table rows
         comparison_data = [
             {
-                "Rank": i + 1,
-                **item,
+                "Rank": page_number * RESULTS_PAGE_SIZE + i + 1,
+                **build_comparison_row(row),
             }
-            for i, item in enumerate(comparison_data)
+            for i, row in enumerate(
+                st.session_state.results_store.rows(
+                    leaderboard.page_indexes(page_number, RESULTS_PAGE_SIZE)
+                )
+            )
         ]
 
         # Convert to DataFrame
@@ -866,7 +965,7 @@ def main():
 
         # Display the DataFrame without on_click parameter
         event = st.dataframe(
-            comparison_df.drop(columns=["View Path", "Processed Content"]),
+            comparison_df.drop(columns=["View Path", "Content ID"]),
             use_container_width=True,
             hide_index=True,
             selection_mode="multi-row",
@@ -890,19 +989,28 @@ def main():
         if selected_rows:
             selected_resumes_content = []
             for i in selected_rows:
-                if (
-                    "Processed Content" in comparison_df.iloc[i]
-                    and comparison_df.iloc[i]["Processed Content"]
-                ):
-                    selected_resumes_content.append(
-                        comparison_df.iloc[i]["Processed Content"]
-                    )
+                processed_content = st.session_state.results_store.content(
+                    comparison_df.iloc[i]["Content ID"]
+                )
+                if processed_content:
+                    selected_resumes_content.append(processed_content)
 
             if selected_resumes_content:
                 st.session_state.global_state.resumes_for_llm_analysis = (
                     selected_resumes_content
                 )
 
+        st.download_button(
+            "Export Results (Parquet)",
+            data=st.session_state.results_store.to_parquet_bytes(),
+            file_name="screening_results.parquet",
+            mime="application/vnd.apache.parquet",
+        )
+
+        render_weight_sensitivity_explorer(
+            st.session_state.leaderboard.entries, screening_config
+        )
+
         # Add a 2-column layout for resume selection and viewing
         st.subheader("View Resumes")
 
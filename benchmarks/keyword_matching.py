@@ -0,0 +1,99 @@
+"""
+Benchmark of the screening keyword scan, against running `regex_based_keyword_matcher`
+once per keyword. Run from the repository root:
+
+    python -m benchmarks.keyword_matching [--resumes 100] [--size-kb 8] [--repeat 5]
+"""
+
+import argparse
+
+from benchmarks.text_processing import best_of, build_resume_like_text
+from pipeline.utils.keyword_matching import CompiledKeywordMatcher, KeywordMatchingUtils
+from pipeline.utils.text_processing import TextProcessingUtils
+
+# Mandatory and optional terms of a typical screening config
+SCREENING_KEYWORDS = (
+    "Java",
+    "Spring Boot",
+    "Hibernate",
+    "SQL",
+    "Docker",
+    "Kubernetes",
+    "AWS",
+    "Kafka",
+    "Node.js",
+    "ReactJS",
+    "HTML5",
+    "CSS3",
+    "TypeScript",
+    "Angular",
+    "GraphQL",
+    "Terraform",
+    "Jenkins",
+    "Redis",
+    "MongoDB",
+    "Python3",
+)
+
+
+def scan_per_keyword(texts, keywords):
+    """First hit of every keyword in every text, one regex search per keyword"""
+    return [
+        {
+            keyword: KeywordMatchingUtils.regex_based_keyword_matcher(keyword, text)[1]
+            for keyword in keywords
+        }
+        for text in texts
+    ]
+
+
+def scan_compiled(texts, keywords):
+    """First hit of every keyword in every text, one scan per text"""
+    matcher = CompiledKeywordMatcher.compile(keywords)
+    hits = []
+    for text in texts:
+        text_hits = matcher.find_all(text)
+        hits.append(
+            {
+                keyword: keyword_hits[0] if keyword_hits else None
+                for keyword, keyword_hits in text_hits.items()
+            }
+        )
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=100)
+    parser.add_argument("--size-kb", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    texts = [
+        TextProcessingUtils.process_content(
+            build_resume_like_text(args.size_kb * 1024, seed=seed)
+        )
+        for seed in range(args.resumes)
+    ]
+    if scan_compiled(texts, SCREENING_KEYWORDS) != scan_per_keyword(
+        texts, SCREENING_KEYWORDS
+    ):
+        raise SystemExit("The hits differ")
+
+    per_keyword_ms = best_of(
+        lambda: scan_per_keyword(texts, SCREENING_KEYWORDS), args.repeat
+    )
+    compiled_ms = best_of(lambda: scan_compiled(texts, SCREENING_KEYWORDS), args.repeat)
+    print(
+        f"Matching {len(SCREENING_KEYWORDS)} keywords in {args.resumes} resumes of "
+        f"{args.size_kb} KB, best of {args.repeat}"
+    )
+    print(
+        f"  regex per keyword {per_keyword_ms:6.1f} ms, "
+        f"CompiledKeywordMatcher {compiled_ms:6.1f} ms "
+        f"({per_keyword_ms / compiled_ms:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
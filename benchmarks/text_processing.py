@@ -0,0 +1,88 @@
+"""
+Benchmark of the resume text normalization, against the three regex passes it
+replaced. Run from the repository root:
+
+    python -m benchmarks.text_processing [--size-kb 1024] [--repeat 5]
+"""
+
+import argparse
+import random
+import re
+import timeit
+
+from pipeline.utils.text_processing import DEFAULT_PRESERVE_CHARS, TextNormalizer
+
+RESUME_WORDS = (
+    "Java Spring Boot Hibernate microservices REST APIs SQL PostgreSQL Docker "
+    "Kubernetes AWS CI/CD Jenkins Git Maven JUnit Kafka React.js Node.js HTML5 CSS3 "
+    "led designed implemented migrated optimized team years experience project"
+).split()
+RESUME_PUNCTUATION = ("", "", "", ",", ".", ":", ";", "(", ")", "•", "|", "–", "/")
+RESUME_SEPARATORS = (" ", " ", " ", " ", "  ", "\n", "\n\n", "\t", " \n ")
+
+
+def build_resume_like_text(size: int, seed: int = 7) -> str:
+    """Text of `size` characters with the words, bullets and line breaks of resumes"""
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        part = (
+            rng.choice(RESUME_WORDS)
+            + rng.choice(RESUME_PUNCTUATION)
+            + rng.choice(RESUME_SEPARATORS)
+        )
+        parts.append(part)
+        length += len(part)
+    return "".join(parts)[:size]
+
+
+def process_content_with_regex_passes(
+    content: str, preserve_chars: str = DEFAULT_PRESERVE_CHARS
+) -> str:
+    """The normalization `TextNormalizer` replaced"""
+    if not content:
+        return ""
+
+    content = re.sub(r"\n+", " ", content)
+    content = re.sub(r"\s+", " ", content)
+    content = re.sub(f"[^\\w\\s{re.escape(preserve_chars)}]", " ", content)
+    return content.strip()
+
+
+def best_of(function, repeat: int) -> float:
+    """Best wall time of `repeat` runs, in milliseconds"""
+    return min(timeit.repeat(function, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-kb", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    normalizer = TextNormalizer.for_preserve_chars(DEFAULT_PRESERVE_CHARS)
+    text = build_resume_like_text(args.size_kb * 1024)
+    texts = {
+        "with bullets and dashes": text,
+        "ASCII only": text.translate({ord("•"): "*", ord("–"): "-"}),
+    }
+
+    print(f"Normalizing {args.size_kb} KB of resume-like text, best of {args.repeat}")
+    for name, text in texts.items():
+        if normalizer.normalize(text) != process_content_with_regex_passes(text):
+            raise SystemExit(f"The outputs differ on the text {name}")
+
+        regex_passes_ms = best_of(
+            lambda: process_content_with_regex_passes(text), args.repeat
+        )
+        normalizer_ms = best_of(lambda: normalizer.normalize(text), args.repeat)
+        print(
+            f"  {name + ':':<25} regex passes {regex_passes_ms:6.1f} ms, "
+            f"TextNormalizer {normalizer_ms:6.1f} ms "
+            f"({regex_passes_ms / normalizer_ms:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,34 @@
 RESERVED_POINTS_FOR_MANDATORY_KEYWORDS = 60
 RESERVED_POINTS_FOR_OPTIONAL_KEYWORDS = 40
 
+# Parsed text cache
+# Bump RESUME_PARSER_VERSION whenever the text extraction logic changes so stale entries are not served
+RESUME_PARSER_VERSION = "3"
+PARSED_TEXT_CACHE_DIR = "__cache__/parsed_text"
+PARSED_TEXT_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+
+# Extraction budgets for oversized PDFs (e.g. resumes with a portfolio attached)
+RESUME_PARSER_MAX_PAGES = 20
+RESUME_PARSER_MAX_CHARACTERS = 200_000
+
+# Resumes with at least this many pages to extract are extracted in ranges of
+# RESUME_PARSER_PAGE_RANGE_SIZE pages, spread over the extraction engine's workers
+RESUME_PARSER_PAGE_PARALLEL_MIN_PAGES = 10
+RESUME_PARSER_PAGE_RANGE_SIZE = 5
+
+# Threads shared by all pipelines for running independent workflow units concurrently
+PIPELINE_CONCURRENT_WORKERS = 4
+
+# Finished screening jobs are kept this long for their sessions to pick up
+SCREENING_JOB_RETENTION_SECONDS = 60 * 60
+
+# How often a batch waiting on its resumes checks whether it was cancelled
+SCREENING_JOB_CANCEL_POLL_SECONDS = 0.1
+
+# Archive (ZIP/TAR) ingest limits
+ARCHIVE_MAX_MEMBER_BYTES = 50 * 1024 * 1024  # 50 MB per resume
+ARCHIVE_MAX_IN_FLIGHT_BYTES = 256 * 1024 * 1024  # 256 MB of resumes held in memory
+
 ROLE_MATCHING_DEFINITIONS = {
     "REACT_DEVELOPER": {
         "mandatory": ["React", "JavaScript", "HTML", "CSS", "Redux", "Git"],
@@ -1,3 +1,4 @@
+import inspect
 import logging
 import time
 from pipeline.state_managers.global_state_manager import GlobalStateManager
@@ -14,8 +15,26 @@ def logger(func):
     Decorator that adds logging functionality to pipeline stage methods.
     Logs start/completion times, duration, and output for each stage.
     Handles errors and provides detailed logging of exceptions.
+    Works for both sync and async (`async def`) stage methods.
     """
 
+    if inspect.iscoroutinefunction(func):
+
+        async def async_wrapper(self, state, global_state: GlobalStateManager = None):
+            logger = logging.getLogger(self.__class__.__name__)
+            start_time = time.time()
+
+            try:
+                state, output_from_stage = await func(self, state, global_state)
+                _log_stage_output(self, logger, output_from_stage, start_time)
+                return state, output_from_stage
+
+            except Exception as e:
+                _log_stage_error(self, logger, e)
+                raise e
+
+        return async_wrapper
+
     def wrapper(self, state, global_state: GlobalStateManager = None):
         # Get logger instance for this class
         logger = logging.getLogger(self.__class__.__name__)
@@ -26,32 +45,36 @@ def logger(func):
         try:
             # Execute the decorated function
             state, output_from_stage = func(self, state, global_state)
-
-            # Calculate and log duration
-            end_time = time.time()
-            duration = end_time - start_time
-
-            # Log the output appropriately based on type
-            if isinstance(output_from_stage, dict):
-                logger.info(f"Stage output from {self.__class__.__name__}\n")
-                logger.info(json.dumps(output_from_stage, indent=2))
-            elif output_from_stage is not None:
-                logger.info(f"Stage output from {self.__class__.__name__}\n")
-                logger.info(output_from_stage)
-
-            logger.info(
-                f"Completed stage: {self.__class__.__name__} in {duration:.2f}s"
-            )
-
+            _log_stage_output(self, logger, output_from_stage, start_time)
             return state, output_from_stage
 
         except Exception as e:
-            # Log detailed error information
-            logger.info(
-                f"Error in stage {self.__class__.__name__}: {str(e)}"
-                # exc_info=True,
-                # stack_info=True,
-            )
+            _log_stage_error(self, logger, e)
             raise e
 
     return wrapper
+
+
+def _log_stage_output(stage, logger: logging.Logger, output_from_stage, start_time):
+    # Calculate and log duration
+    end_time = time.time()
+    duration = end_time - start_time
+
+    # Log the output appropriately based on type
+    if isinstance(output_from_stage, dict):
+        logger.info(f"Stage output from {stage.__class__.__name__}\n")
+        logger.info(json.dumps(output_from_stage, indent=2))
+    elif output_from_stage is not None:
+        logger.info(f"Stage output from {stage.__class__.__name__}\n")
+        logger.info(output_from_stage)
+
+    logger.info(f"Completed stage: {stage.__class__.__name__} in {duration:.2f}s")
+
+
+def _log_stage_error(stage, logger: logging.Logger, e: Exception):
+    # Log detailed error information
+    logger.info(
+        f"Error in stage {stage.__class__.__name__}: {str(e)}"
+        # exc_info=True,
+        # stack_info=True,
+    )
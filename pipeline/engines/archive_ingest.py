@@ -0,0 +1,189 @@
+import os
+import tarfile
+import threading
+import zipfile
+from collections import deque
+from typing import BinaryIO, Deque, Iterator, Optional, Tuple
+
+from pipeline.config import ARCHIVE_MAX_IN_FLIGHT_BYTES, ARCHIVE_MAX_MEMBER_BYTES
+from pipeline.engines.extraction_engine import ResumeExtractionEngine
+from pipeline.state_managers.screening_config import ScreeningConfig
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+
+ZIP_EXTENSIONS = (".zip",)
+TAR_EXTENSIONS = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
+
+def is_archive(file_name: str) -> bool:
+    """Check if a file name looks like a ZIP or TAR archive"""
+    return file_name.lower().endswith(ZIP_EXTENSIONS + TAR_EXTENSIONS)
+
+
+def _is_zip_archive(archive: str | BinaryIO) -> bool:
+    is_zip = zipfile.is_zipfile(archive)
+
+    # `is_zipfile` moves the position of file objects, rewind them for the actual read
+    if not isinstance(archive, str) and archive.seekable():
+        archive.seek(0)
+
+    return is_zip
+
+
+def _is_resume_member(member_name: str) -> bool:
+    base_name = os.path.basename(member_name)
+    return (
+        member_name.lower().endswith(".pdf")
+        # Skip macOS resource forks and hidden files that agencies' zips often carry
+        and not member_name.startswith("__MACOSX/")
+        and not base_name.startswith(".")
+    )
+
+
+class ArchiveIngestor:
+    """
+    Screens the resumes inside a ZIP or TAR archive without unpacking it to disk.
+
+    PDF members are read one at a time straight out of the archive and fed to the
+    extraction engine, which only pulls the next member once the in-memory content
+    queued for processing is below `max_in_flight_bytes`.
+    """
+
+    def __init__(
+        self,
+        engine: ResumeExtractionEngine,
+        max_member_bytes: int = ARCHIVE_MAX_MEMBER_BYTES,
+        max_in_flight_bytes: int = ARCHIVE_MAX_IN_FLIGHT_BYTES,
+    ):
+        self.engine = engine
+        self.max_member_bytes = max_member_bytes
+        self.max_in_flight_bytes = max_in_flight_bytes
+
+    @staticmethod
+    def count_resumes(archive: str | BinaryIO) -> Optional[int]:
+        """
+        Count the PDF members of a ZIP archive from its central directory
+
+        Returns:
+            The number of resumes, or None for TAR archives, which would have to be
+            read in full to be counted
+        """
+        if not _is_zip_archive(archive):
+            return None
+
+        with zipfile.ZipFile(archive) as zip_file:
+            return sum(
+                1
+                for info in zip_file.infolist()
+                if not info.is_dir() and _is_resume_member(info.filename)
+            )
+
+    def ingest(
+        self,
+        archive: str | BinaryIO,
+        screening_config: ScreeningConfig,
+        cancel_event: threading.Event = None,
+    ) -> Iterator[Tuple[str, Optional[PipelineStateManager], Optional[str]]]:
+        """
+        Screen every resume in an archive, yielding per-member results as they complete
+
+        Args:
+            archive: Path of the archive or a binary file object (e.g. an upload)
+            screening_config: Screening configuration shared by the batch
+            cancel_event: Event cancelling the batch, see `ResumeExtractionEngine.process`
+
+        Returns:
+            Iterator of (member_name, state, error) - state is None if the member failed
+        """
+        # Members rejected while reading the archive, reported alongside the results
+        rejected_members: Deque[Tuple[str, str]] = deque()
+
+        results = self.engine.process(
+            self._iter_resumes(archive, rejected_members),
+            screening_config,
+            max_in_flight_bytes=self.max_in_flight_bytes,
+            cancel_event=cancel_event,
+        )
+        for result in results:
+            yield result
+            while rejected_members:
+                member_name, error = rejected_members.popleft()
+                yield member_name, None, error
+
+        while rejected_members:
+            member_name, error = rejected_members.popleft()
+            yield member_name, None, error
+
+    def _iter_resumes(
+        self, archive: str | BinaryIO, rejected_members: Deque[Tuple[str, str]]
+    ) -> Iterator[Tuple[str, bytes]]:
+        """Yield (member_name, content) for every PDF member of the archive"""
+        if _is_zip_archive(archive):
+            yield from self._iter_zip_resumes(archive, rejected_members)
+        else:
+            yield from self._iter_tar_resumes(archive, rejected_members)
+
+    def _iter_zip_resumes(
+        self, archive: str | BinaryIO, rejected_members: Deque[Tuple[str, str]]
+    ) -> Iterator[Tuple[str, bytes]]:
+        with zipfile.ZipFile(archive) as zip_file:
+            for info in zip_file.infolist():
+                if info.is_dir() or not _is_resume_member(info.filename):
+                    continue
+
+                if info.file_size > self.max_member_bytes:
+                    rejected_members.append(
+                        (info.filename, self._oversized_member_error(info.file_size))
+                    )
+                    continue
+
+                try:
+                    with zip_file.open(info) as member:
+                        # Bounded read, in case the declared size does not match the data
+                        content = member.read(self.max_member_bytes + 1)
+                except Exception as e:
+                    rejected_members.append(
+                        (info.filename, f"Error reading archive member: {str(e)}")
+                    )
+                    continue
+
+                if len(content) > self.max_member_bytes:
+                    rejected_members.append(
+                        (info.filename, self._oversized_member_error(len(content)))
+                    )
+                    continue
+
+                yield info.filename, content
+
+    def _iter_tar_resumes(
+        self, archive: str | BinaryIO, rejected_members: Deque[Tuple[str, str]]
+    ) -> Iterator[Tuple[str, bytes]]:
+        # Stream mode ("r|*") reads members sequentially and never seeks, so the
+        # archive can also be a non-seekable stream
+        if isinstance(archive, str):
+            tar_file = tarfile.open(archive, mode="r|*")
+        else:
+            tar_file = tarfile.open(fileobj=archive, mode="r|*")
+
+        with tar_file:
+            for member in tar_file:
+                if not member.isfile() or not _is_resume_member(member.name):
+                    continue
+
+                if member.size > self.max_member_bytes:
+                    rejected_members.append(
+                        (member.name, self._oversized_member_error(member.size))
+                    )
+                    continue
+
+                try:
+                    content = tar_file.extractfile(member).read()
+                except Exception as e:
+                    rejected_members.append(
+                        (member.name, f"Error reading archive member: {str(e)}")
+                    )
+                    continue
+
+                yield member.name, content
+
+    def _oversized_member_error(self, size: int) -> str:
+        return f"Resume is too large ({size} bytes), the limit is {self.max_member_bytes} bytes"
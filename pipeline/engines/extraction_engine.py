@@ -0,0 +1,399 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    InvalidStateError,
+    ProcessPoolExecutor,
+    wait,
+)
+from functools import partial
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from pipeline.config import (
+    RESUME_PARSER_PAGE_PARALLEL_MIN_PAGES,
+    RESUME_PARSER_PAGE_RANGE_SIZE,
+    SCREENING_JOB_CANCEL_POLL_SECONDS,
+)
+from pipeline.pipeline import PipelineOrchestrator, WorkflowUnit
+from pipeline.state_managers.screening_config import ScreeningConfig
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+from pipeline.utils.parsed_text_cache import ParsedTextCache
+from pipeline.workflows.features_extractor import DataExtractor
+from pipeline.workflows.mandatory_params_matcher import MandatoryParamsMatcher
+from pipeline.workflows.optional_params_matcher import OptionalParamsMatcher
+from pipeline.workflows.resume_data_processor import ResumeDataProcessor
+from pipeline.workflows.resume_parser import ResumeParser, extract_page_range
+from pipeline.workflows.score_aggregator import ScoreAggregator
+from pipeline.workflows.validators import PreScreeningValidator
+
+# Default number of resumes queued per worker while a batch is being processed
+IN_FLIGHT_RESUMES_PER_WORKER = 4
+
+# Per-process screening pipeline (and its parsed text cache), built once by the
+# pool initializer and run on every resume the worker gets
+_worker_pipeline: Optional[PipelineOrchestrator] = None
+
+
+def available_cpu_count() -> int:
+    """Number of CPUs this process may run on (respects container/affinity limits)"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return multiprocessing.cpu_count()
+
+
+def build_resume_screening_stages(
+    cache: ParsedTextCache = None,
+    page_parallel_min_pages: Optional[int] = None,
+) -> List[Tuple[str, WorkflowUnit]]:
+    """
+    Workflow units of the resume screening pipeline. The resume to screen is given
+    by the `resume_source` of the state, so the same units screen every resume.
+
+    Args:
+        cache: Parsed text cache used by the resume parser
+        page_parallel_min_pages: Page count from which the resume parser hands the
+            pages back to be extracted in ranges, only set for the engine's workers
+    """
+    return [
+        (
+            "Resume Parser",
+            ResumeParser(cache=cache, page_parallel_min_pages=page_parallel_min_pages),
+        ),
+        ("Resume Data Processor", ResumeDataProcessor()),
+        ("Data Extractor", DataExtractor()),
+        *build_resume_scoring_stages(),
+    ]
+
+
+def build_resume_scoring_stages() -> List[Tuple[str, WorkflowUnit]]:
+    """
+    Workflow units that score an already parsed resume against the screening config,
+    the tail of the resume screening pipeline
+    """
+    return [
+        ("Pre-screening Validator", PreScreeningValidator()),
+        ("Mandatory Keywords Matcher", MandatoryParamsMatcher()),
+        ("Optional Keywords Matcher", OptionalParamsMatcher()),
+        ("Score Aggregator", ScoreAggregator()),
+    ]
+
+
+def _initialize_worker():
+    """Pool initializer, runs once in every worker process"""
+    global _worker_pipeline
+    _worker_pipeline = PipelineOrchestrator(
+        build_resume_screening_stages(
+            cache=ParsedTextCache(),
+            page_parallel_min_pages=RESUME_PARSER_PAGE_PARALLEL_MIN_PAGES,
+        )
+    )
+
+
+def _warm_up_worker() -> int:
+    return os.getpid()
+
+
+def _process_resume_in_worker(
+    resume_name: str,
+    source: str | bytes,
+    screening_config: ScreeningConfig,
+    page_texts: Optional[List[str]] = None,
+) -> Tuple[str, PipelineStateManager]:
+    """
+    Run the screening pipeline for one resume inside a worker process, with the
+    texts of its pages if they were extracted in ranges
+    """
+    state = PipelineStateManager(resume_source=source, resume_file_name=resume_name)
+    state.page_texts = page_texts
+    state = _worker_pipeline.orchestrate(state=state, global_state=screening_config)
+
+    return resume_name, state
+
+
+class _ScreeningFuture(Future):
+    """
+    Future of a resume screened in one or more tasks on the pool: the pipeline,
+    and for long resumes the extraction of their page ranges and the pipeline again
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Tasks of the current step
+        self.tasks: List[Future] = []
+
+    def cancel(self) -> bool:
+        # Cancelled only while none of its tasks has started, like a single task
+        if not all([task.cancel() for task in self.tasks]):
+            return False
+        return super().cancel()
+
+    def resolve(self, result=None, exception: BaseException = None):
+        try:
+            if exception is not None:
+                self.set_exception(exception)
+            else:
+                self.set_result(result)
+        except InvalidStateError:
+            # Cancelled meanwhile
+            pass
+
+
+class ResumeExtractionEngine:
+    """
+    Process pool that runs the resume screening pipeline on every available core.
+
+    Workers are spawned and warmed up when the engine is created, so the cost of
+    starting processes and importing PyMuPDF is paid once rather than per batch.
+    Batches processed at the same time (e.g. jobs of several users) share a budget
+    of `max_total_in_flight` queued resumes, so no batch can take the whole pool.
+    """
+
+    def __init__(self, max_workers: int = None, max_total_in_flight: int = None):
+        self.max_workers = max_workers or available_cpu_count()
+        self._in_flight_budget = threading.BoundedSemaphore(
+            max_total_in_flight or self.max_workers * IN_FLIGHT_RESUMES_PER_WORKER
+        )
+
+        # `spawn` avoids forking a multi-threaded parent (e.g. the Streamlit server)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+        )
+        self._warm_up()
+
+    def _warm_up(self):
+        """Start every worker process up front by giving each one a trivial task"""
+        futures = [
+            self._executor.submit(_warm_up_worker) for _ in range(self.max_workers)
+        ]
+        for future in futures:
+            future.result()
+
+    def submit(
+        self,
+        resume_name: str,
+        source: str | bytes | memoryview,
+        screening_config: ScreeningConfig,
+    ) -> Future:
+        """
+        Schedule a single resume, the future resolves to (resume_name, state)
+
+        `source` is either a path or the PDF content. Buffers such as the memoryview
+        returned by `UploadedFile.getbuffer()` are pickled to the worker as bytes.
+        Resumes with many pages come back from the worker unparsed, their page
+        ranges are then extracted by several workers and the resume is screened
+        again with the texts of its pages.
+        """
+        if not isinstance(source, (str, bytes)):
+            source = bytes(source)
+
+        screened = _ScreeningFuture()
+        self._screen_in_worker(screened, resume_name, source, screening_config)
+        return screened
+
+    def _screen_in_worker(
+        self,
+        screened: _ScreeningFuture,
+        resume_name: str,
+        source: str | bytes,
+        screening_config: ScreeningConfig,
+        page_texts: Optional[List[str]] = None,
+    ):
+        task = self._executor.submit(
+            _process_resume_in_worker,
+            resume_name,
+            source,
+            screening_config,
+            page_texts,
+        )
+        screened.tasks = [task]
+        task.add_done_callback(
+            partial(
+                self._on_screened_in_worker,
+                screened,
+                resume_name,
+                source,
+                screening_config,
+            )
+        )
+
+    def _on_screened_in_worker(
+        self,
+        screened: _ScreeningFuture,
+        resume_name: str,
+        source: str | bytes,
+        screening_config: ScreeningConfig,
+        task: Future,
+    ):
+        try:
+            _, state = task.result()
+        except BaseException as e:
+            screened.resolve(exception=e)
+            return
+
+        if not state.pages_to_split:
+            screened.resolve((resume_name, state))
+            return
+
+        try:
+            range_tasks = [
+                self._executor.submit(
+                    extract_page_range,
+                    source,
+                    start,
+                    min(start + RESUME_PARSER_PAGE_RANGE_SIZE, state.pages_to_split),
+                )
+                for start in range(
+                    0, state.pages_to_split, RESUME_PARSER_PAGE_RANGE_SIZE
+                )
+            ]
+        except BaseException as e:
+            screened.resolve(exception=e)
+            return
+
+        screened.tasks = range_tasks
+        pending_ranges = [len(range_tasks)]
+        pending_ranges_lock = threading.Lock()
+
+        def on_range_extracted(_: Future):
+            with pending_ranges_lock:
+                pending_ranges[0] -= 1
+                if pending_ranges[0]:
+                    return
+
+            try:
+                # In page order, whichever range finished first
+                page_texts = [
+                    page_text
+                    for range_task in range_tasks
+                    for page_text in range_task.result()
+                ]
+                self._screen_in_worker(
+                    screened, resume_name, source, screening_config, page_texts
+                )
+            except BaseException as e:
+                screened.resolve(exception=e)
+
+        for range_task in range_tasks:
+            range_task.add_done_callback(on_range_extracted)
+
+    def process(
+        self,
+        resumes: Iterable[Tuple[str, str | bytes | memoryview]],
+        screening_config: ScreeningConfig,
+        max_in_flight: int = None,
+        max_in_flight_bytes: int = None,
+        cancel_event: threading.Event = None,
+    ) -> Iterator[Tuple[str, Optional[PipelineStateManager], Optional[str]]]:
+        """
+        Screen a batch of resumes, yielding results as they complete
+
+        `resumes` is consumed lazily: a new resume is only pulled from it once the
+        number (and total size of in-memory content) of queued resumes drops below
+        the limits, so generators reading from an archive stay bounded in memory.
+
+        Setting `cancel_event` ends the batch within SCREENING_JOB_CANCEL_POLL_SECONDS,
+        even while it waits for a result or a slot of the budget, and drops the
+        resumes not started yet.
+
+        Args:
+            resumes: (resume_name, path or PDF content) pairs
+            screening_config: Screening configuration shared by the batch
+            max_in_flight: Maximum number of resumes queued or running at once
+            max_in_flight_bytes: Maximum total size of in-memory content queued at once
+            cancel_event: Event cancelling the batch, e.g. shared with its job
+
+        Returns:
+            Iterator of (resume_name, state, error) - state is None if the resume failed
+        """
+        max_in_flight = max_in_flight or self.max_workers * IN_FLIGHT_RESUMES_PER_WORKER
+        resumes = iter(resumes)
+        in_flight = {}  # future -> (resume_name, size of the content in bytes)
+        in_flight_bytes = 0
+        exhausted = False
+        pending = None  # resume pulled from `resumes`, waiting for a slot of the budget
+        # Waits are bounded when the batch can be cancelled, to notice it in time
+        poll_timeout = (
+            None if cancel_event is None else SCREENING_JOB_CANCEL_POLL_SECONDS
+        )
+
+        try:
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+
+                while (
+                    not exhausted
+                    and len(in_flight) < max_in_flight
+                    and (
+                        max_in_flight_bytes is None
+                        or in_flight_bytes < max_in_flight_bytes
+                        or not in_flight
+                    )
+                ):
+                    if pending is None:
+                        try:
+                            pending = next(resumes)
+                        except StopIteration:
+                            exhausted = True
+                            break
+
+                    # The budget is shared with other batches, only wait for a slot
+                    # when there are no results of this batch to yield meanwhile
+                    if in_flight:
+                        acquired = self._in_flight_budget.acquire(blocking=False)
+                    else:
+                        acquired = self._in_flight_budget.acquire(timeout=poll_timeout)
+                    if not acquired:
+                        break
+
+                    resume_name, source = pending
+                    pending = None
+                    size = 0 if isinstance(source, str) else memoryview(source).nbytes
+                    try:
+                        future = self.submit(resume_name, source, screening_config)
+                    except Exception:
+                        # E.g. a broken pool, don't take the slot from the other batches
+                        self._in_flight_budget.release()
+                        raise
+                    future.add_done_callback(self._release_in_flight_slot)
+                    in_flight[future] = (resume_name, size)
+                    in_flight_bytes += size
+
+                if not in_flight:
+                    if exhausted:
+                        break
+                    # Timed out waiting for a slot, check for a cancel and wait again
+                    continue
+
+                done, _ = wait(
+                    in_flight, timeout=poll_timeout, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    resume_name, size = in_flight.pop(future)
+                    in_flight_bytes -= size
+                    try:
+                        _, state = future.result()
+                        yield resume_name, state, None
+                    except Exception as e:
+                        yield resume_name, None, str(e)
+
+        finally:
+            # Stopped early (e.g. a cancelled job), drop the resumes not started yet
+            for future in in_flight:
+                future.cancel()
+
+    def _release_in_flight_slot(self, future: Future):
+        self._in_flight_budget.release()
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
@@ -0,0 +1,120 @@
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pipeline.config import SCREENING_JOB_RETENTION_SECONDS
+from pipeline.engines.archive_ingest import ArchiveIngestor
+from pipeline.engines.extraction_engine import ResumeExtractionEngine
+from pipeline.engines.screening_job import ScreeningJob
+from pipeline.scoring.leaderboard import ResumeLeaderboard
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+from pipeline.state_managers.screening_config import ScreeningConfig
+from pipeline.storage.results_store import ResultsStore
+
+
+class ScreeningJobRunner:
+    """
+    Runs screening jobs in the background, for every session of the app.
+
+    Jobs are looked up by their id, so a session can poll the progress of its job,
+    cancel it, or pick it up again after the page was reloaded. Jobs run at the
+    same time share the engine, and with it its budget of queued resumes. Finished
+    jobs are dropped `retention_seconds` after they finished.
+    """
+
+    def __init__(
+        self,
+        engine: ResumeExtractionEngine,
+        retention_seconds: float = SCREENING_JOB_RETENTION_SECONDS,
+    ):
+        self.engine = engine
+        self.retention_seconds = retention_seconds
+        self._jobs: Dict[str, ScreeningJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        resumes: Iterable[Tuple[str, str | bytes | memoryview]],
+        archives: Iterable,
+        screening_config: ScreeningConfig,
+        leaderboard: ResumeLeaderboard,
+        results_store: ResultsStore,
+        total_resumes: int,
+        view_paths: Dict[str, str] = None,
+    ) -> ScreeningJob:
+        """
+        Start screening resumes and the resumes inside archives in the background
+
+        Args:
+            resumes: (resume_name, path or PDF content) pairs
+            archives: Paths or binary file objects of ZIP or TAR archives
+            screening_config: Screening configuration shared by the batch
+            leaderboard: Leaderboard the results are ranked in
+            results_store: Store the results are appended to
+            total_resumes: Number of resumes in the batch, for the progress
+            view_paths: Path of the viewer copy of the resumes that have one, by the
+                SHA-256 of their content
+        """
+        # Shared by the job and the batches it consumes, which stop waiting for
+        # their resumes as soon as the job is cancelled
+        cancel_event = threading.Event()
+        job = ScreeningJob(
+            self._screen(list(resumes), list(archives), screening_config, cancel_event),
+            leaderboard,
+            results_store,
+            total_resumes,
+            view_paths,
+            screening_config,
+            cancel_event,
+        )
+        with self._lock:
+            self._drop_expired_jobs()
+            self._jobs[job.job_id] = job
+
+        return job.start()
+
+    def get(self, job_id: str) -> Optional[ScreeningJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job, returns False if there is no such job running"""
+        job = self.get(job_id)
+        if job is None or not job.is_running:
+            return False
+
+        job.cancel()
+        return True
+
+    @property
+    def running_jobs(self) -> List[ScreeningJob]:
+        with self._lock:
+            return [job for job in self._jobs.values() if job.is_running]
+
+    def _screen(
+        self,
+        resumes: List[Tuple[str, str | bytes | memoryview]],
+        archives: List,
+        screening_config: ScreeningConfig,
+        cancel_event: threading.Event,
+    ) -> Iterator[Tuple[str, Optional[PipelineStateManager], Optional[str]]]:
+        # A generator rather than a chain, so closing it (on cancel) closes the
+        # engine batch being consumed
+        yield from self.engine.process(
+            resumes, screening_config, cancel_event=cancel_event
+        )
+
+        ingestor = ArchiveIngestor(self.engine)
+        for archive in archives:
+            if cancel_event.is_set():
+                return
+            yield from ingestor.ingest(archive, screening_config, cancel_event)
+
+    def _drop_expired_jobs(self):
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if (
+                job.finished_at is not None
+                and now - job.finished_at > self.retention_seconds
+            ):
+                del self._jobs[job_id]
@@ -0,0 +1,52 @@
+from typing import Iterable
+
+from pipeline.engines.extraction_engine import build_resume_scoring_stages
+from pipeline.pipeline import PipelineOrchestrator
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+from pipeline.state_managers.screening_config import ScreeningConfig
+
+RESCORE_BATCH_SIZE = 256
+
+
+class ResumeRescorer:
+    """
+    Scores already screened resumes again after the screening config changed.
+
+    Only the scoring stages run, on the processed text and extracted features kept
+    on each state, so nothing is parsed again. The keyword matchers reuse the hits
+    stored on the state and only scan for keywords the state has not seen yet, and
+    the optional matcher scores each batch of resumes in one go.
+    """
+
+    def __init__(self):
+        self.pipeline = PipelineOrchestrator(build_resume_scoring_stages())
+
+    @staticmethod
+    def can_be_rescored(state: PipelineStateManager) -> bool:
+        # Resumes that never got past text processing (e.g. scanned documents) were
+        # not scored in the first place. Decided from the state's metadata, so the
+        # spilled texts are not all read back before the first batch is scored.
+        return state.has_processed_content
+
+    def rescore(
+        self, states: Iterable[PipelineStateManager], screening_config: ScreeningConfig
+    ) -> int:
+        """
+        Score the given resumes against the current screening config, in place
+
+        Returns:
+            Number of resumes that were scored again
+        """
+        rescorable_states = [state for state in states if self.can_be_rescored(state)]
+        # Stage by stage over batches, which keeps the views (or the spilled texts
+        # read back) of one batch in memory rather than of every resume
+        for start in range(0, len(rescorable_states), RESCORE_BATCH_SIZE):
+            batch = rescorable_states[start : start + RESCORE_BATCH_SIZE]
+            for state in batch:
+                state.reset_screening_outcome()
+
+            self.pipeline.orchestrate_many(states=batch, global_state=screening_config)
+            for state in batch:
+                state.release_content_views()
+
+        return len(rescorable_states)
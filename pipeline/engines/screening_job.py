@@ -0,0 +1,146 @@
+import threading
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pipeline.scoring.leaderboard import ResumeLeaderboard
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+from pipeline.state_managers.screening_config import ScreeningConfig
+from pipeline.storage.results_store import ResultsStore
+
+
+class ScreeningJob:
+    """
+    Collects the results of a screening batch on a background thread.
+
+    Every result is ranked in the leaderboard and appended to the results store as
+    soon as it arrives, so the top candidates found so far can be shown while the
+    rest of the batch is still being screened. Readers hold `lock` while reading the
+    leaderboard or the results store of a running job. A cancelled job stops taking
+    results and closes `results`, keeping what it collected so far. Sharing
+    `cancel_event` with the producer of `results` lets it stop waiting right away.
+    """
+
+    def __init__(
+        self,
+        results: Iterable[Tuple[str, Optional[PipelineStateManager], Optional[str]]],
+        leaderboard: ResumeLeaderboard,
+        results_store: ResultsStore,
+        total_resumes: int,
+        view_paths: Dict[str, str] = None,
+        screening_config: ScreeningConfig = None,
+        cancel_event: threading.Event = None,
+    ):
+        """
+        Args:
+            results: (resume_name, state, error) of every resume as it completes,
+                e.g. from `ResumeExtractionEngine.process`
+            leaderboard: Leaderboard the results are ranked in
+            results_store: Store the results are appended to, which also takes the
+                spilled texts
+            total_resumes: Number of resumes in the batch, for the progress
+            view_paths: Path of the viewer copy of the resumes that have one, by the
+                SHA-256 of their content (as in `state.resume_digest`), since two
+                resumes (e.g. an upload and an archive member) may share a name
+            screening_config: Screening config the resumes are screened with
+            cancel_event: Event set on cancel, e.g. also given to
+                `ResumeExtractionEngine.process` for the results
+        """
+        self.job_id = uuid.uuid4().hex
+        self.screening_config = screening_config
+        self.leaderboard = leaderboard
+        self.results_store = results_store
+        self.total_resumes = total_resumes
+        self.view_paths = view_paths or {}
+        self.lock = threading.Lock()
+
+        self.processed_resumes = 0
+        self.completed_resumes = 0
+        self.errors: List[Tuple[str, str]] = []
+        self.status = ""
+        # Unexpected error that ended the job before the batch was done
+        self.failure: Optional[str] = None
+
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self._cancelled = (
+            cancel_event if cancel_event is not None else threading.Event()
+        )
+        self._thread = threading.Thread(
+            target=self._collect, args=(results,), name="screening-job", daemon=True
+        )
+
+    def start(self) -> "ScreeningJob":
+        self._thread.start()
+        return self
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread.is_alive()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """
+        Stop the job, right away if `results` watches the cancel event, otherwise
+        once the result being screened arrives
+        """
+        self._cancelled.set()
+
+    @property
+    def progress(self) -> float:
+        return min(self.processed_resumes / max(self.total_resumes, 1), 1.0)
+
+    def copy_results(self) -> Tuple[ResumeLeaderboard, ResultsStore]:
+        """
+        Copy of the leaderboard and results store, for a session to rescore with its
+        own settings. The job's results keep the scores of its screening config, so
+        every session attaching to the job starts from the same results.
+        """
+        with self.lock:
+            return self.leaderboard.copy(), self.results_store.copy()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Wait for the batch to be done, returns False if it still runs after `timeout`"""
+        self._thread.join(timeout)
+        return not self.is_running
+
+    def _collect(self, results):
+        try:
+            for resume_name, result, error in results:
+                if self.is_cancelled:
+                    break
+
+                with self.lock:
+                    self.processed_resumes += 1
+                    if error:
+                        self.errors.append((resume_name, error))
+                        self.status = f"❌ Failed to process {resume_name}: {error}"
+                        continue
+
+                    # Scored, the text is only read again by a rescore or the LLM
+                    # analysis. Spilled first, so the results row reuses its content id
+                    result.spill_processed_content(self.results_store.content_store)
+                    view_path = self.view_paths.get(result.resume_digest)
+                    self.leaderboard.add(resume_name, result, view_path)
+                    self.results_store.append(resume_name, result, view_path)
+                    self.completed_resumes += 1
+                    self.status = f"✅ Completed resume {self.processed_resumes}/{self.total_resumes}: {resume_name}"
+
+        except Exception as e:
+            with self.lock:
+                self.failure = str(e)
+                self.status = f"❌ Screening stopped: {str(e)}"
+
+        finally:
+            # Let the producer drop the resumes it hasn't started yet
+            close = getattr(results, "close", None)
+            if close is not None:
+                close()
+
+            with self.lock:
+                if self.is_cancelled:
+                    self.status = f"⏹️ Cancelled after {self.processed_resumes} of {self.total_resumes} resumes"
+            self.finished_at = time.time()
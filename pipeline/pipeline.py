@@ -1,15 +1,51 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import inspect
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from pipeline.config import PIPELINE_CONCURRENT_WORKERS
 from pipeline.state_managers.global_state_manager import GlobalStateManager
 from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+from pipeline.state_managers.screening_config import ScreeningConfig
 from pipeline.exceptions import PipelineFailedException
-from typing import List, Tuple
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Tuple
 from pipeline.decorators import logger
 
+# Units that may set this field stop every unit listed after them
+PIPELINE_SKIP_FIELD = "skip_pipeline_from_execution"
+
+# Thread pool shared by the orchestrators which are not given an executor, created
+# on first use, so no threads are started per resume
+_workflow_unit_executor: ThreadPoolExecutor = None
+_workflow_unit_executor_lock = threading.Lock()
+
+
+def _get_workflow_unit_executor() -> ThreadPoolExecutor:
+    global _workflow_unit_executor
+    with _workflow_unit_executor_lock:
+        if _workflow_unit_executor is None:
+            _workflow_unit_executor = ThreadPoolExecutor(
+                max_workers=PIPELINE_CONCURRENT_WORKERS,
+                thread_name_prefix="workflow-unit",
+            )
+        return _workflow_unit_executor
+
 
 class WorkflowUnit:
+    # Names of the state fields the unit reads and writes. The orchestrator runs
+    # units that don't touch each other's fields concurrently. A unit without
+    # declarations runs on its own, in its place in the list.
+    reads: Tuple[str, ...] = None
+    writes: Tuple[str, ...] = None
+
     def execute_workflow_unit(self, state, global_state: GlobalStateManager = None):
         """
-        Process the pipeline stage
+        Process the pipeline stage, may be an `async def` for I/O-bound units
         """
         raise NotImplementedError(
             f"{self.__class__.__name__} should implement `execute_workflow_unit` method"
@@ -23,25 +59,180 @@ class WorkflowUnit:
         )
 
     def abort_workflow_unit_from_execution(self, reason):
-        self.skip_pipeline_from_execution = True
-        self.pipeline_skip_reason = reason
+        # Units are shared by every run of a pipeline, so nothing is recorded on the unit
         raise PipelineFailedException(reason)
 
 
+class _UnexpectedWorkflowUnitError(Exception):
+    """Unexpected error of a unit run concurrently, with the name of the unit"""
+
+    def __init__(self, workflow_unit_name: str, exc: Exception):
+        super().__init__(str(exc))
+        self.workflow_unit_name = workflow_unit_name
+        self.exc = exc
+
+
 class ConcurrentWorkflowUnitsCluster:
     def __init__(self, workflow_units: List[WorkflowUnit]):
         self.workflow_units = workflow_units
 
 
 class PipelineOrchestrator:
-    def __init__(self, workflow_units: List[Tuple[str, WorkflowUnit]]):
+    """
+    Runs the workflow units of a pipeline on a state.
+
+    Independent units (see `WorkflowUnit.reads`) and the units of a
+    `ConcurrentWorkflowUnitsCluster` run on `executor`, a long lived executor that
+    can be shared by any number of orchestrators. Without one, the orchestrator
+    uses a thread pool shared by the whole process. Orchestrations must not run
+    on the threads of their own executor, where they would wait on themselves.
+
+    Units may be async (I/O-bound units such as the LLM calls). `orchestrate_async`
+    awaits them on the running event loop and offloads the sync units to the
+    executor, so many states can be in flight on one loop. `orchestrate` runs an
+    async unit to completion on an event loop of its own.
+
+    The units are validated and scheduled once, when the orchestrator is built.
+    Units take their inputs from the state and keep nothing per run, so one
+    orchestrator can run any number of states, from any number of threads.
+    """
+
+    def __init__(
+        self,
+        workflow_units: List[Tuple[str, WorkflowUnit]],
+        executor: Executor = None,
+    ):
         self.workflow_units = workflow_units
         self.stopped_at_workflow_unit = None
         self.stop_reason = None
         self.pipeline_status = None
         self.error_type = None
-        self.max_workers = 4
-        self.workflow_unit_name = None
+        self.executor = executor
+        self.__validate_workflow_units(workflow_units)
+        self.dependencies = self.__resolve_dependencies()
+        self.execution_levels = self.__schedule_execution_levels()
+
+    @staticmethod
+    def __validate_workflow_units(workflow_units: List[Tuple[str, WorkflowUnit]]):
+        for __definition__, workflow_unit in workflow_units:
+            if isinstance(workflow_unit, ConcurrentWorkflowUnitsCluster):
+                PipelineOrchestrator.__validate_workflow_units(
+                    workflow_unit.workflow_units
+                )
+            elif not isinstance(workflow_unit, WorkflowUnit):
+                raise ValueError(
+                    f"Workflow unit `{__definition__ or workflow_unit.__class__.__name__}` is not a valid workflow unit"
+                )
+
+    def __resolve_dependencies(self) -> List[FrozenSet[int]]:
+        """
+        Indexes of the units each unit has to wait for, from the declared state fields:
+        a unit reading a field waits for every unit writing it, while units writing
+        the same field, and units listed after a unit that may skip the pipeline,
+        keep their order in the list
+        """
+        declarations = []
+        for _, workflow_unit in self.workflow_units:
+            if (
+                isinstance(workflow_unit, WorkflowUnit)
+                and workflow_unit.reads is not None
+                and workflow_unit.writes is not None
+            ):
+                declarations.append(
+                    (frozenset(workflow_unit.reads), frozenset(workflow_unit.writes))
+                )
+            else:
+                declarations.append(None)
+
+        dependencies = []
+        for index, declared in enumerate(declarations):
+            depends_on = set()
+            for other_index, other_declared in enumerate(declarations):
+                if other_index == index:
+                    continue
+
+                is_listed_before = other_index < index
+                if declared is None or other_declared is None:
+                    if is_listed_before:
+                        depends_on.add(other_index)
+                    continue
+
+                reads, writes = declared
+                other_reads, other_writes = other_declared
+                if other_writes & (reads - writes):
+                    depends_on.add(other_index)
+                elif is_listed_before and (
+                    other_writes & writes or PIPELINE_SKIP_FIELD in other_writes
+                ):
+                    depends_on.add(other_index)
+
+            dependencies.append(frozenset(depends_on))
+
+        return dependencies
+
+    def __schedule_execution_levels(self) -> List[List[int]]:
+        """
+        Group the units into levels, each level holding the units whose dependencies
+        all ran in earlier levels (Kahn's algorithm)
+        """
+        remaining = {index: set(deps) for index, deps in enumerate(self.dependencies)}
+        levels = []
+        while remaining:
+            level = sorted(index for index, deps in remaining.items() if not deps)
+            if not level:
+                names = [
+                    self.__workflow_unit_name(index) for index in sorted(remaining)
+                ]
+                raise ValueError(
+                    f"Workflow units {', '.join(names)} have cyclic dependencies"
+                )
+
+            for index in level:
+                del remaining[index]
+            for deps in remaining.values():
+                deps.difference_update(level)
+            levels.append(level)
+
+        return levels
+
+    def __workflow_unit_name(self, index: int) -> str:
+        __definition__, workflow_unit = self.workflow_units[index]
+        return __definition__ or workflow_unit.__class__.__name__
+
+    def __get_executor(self) -> Executor:
+        return self.executor or _get_workflow_unit_executor()
+
+    def __wait_for_workflow_units(
+        self, names: List[str], futures: List[Future]
+    ) -> List[int]:
+        """
+        Wait for all the futures, so no unit is still running on the state afterwards
+
+        Outcomes are checked in list order, so the same unit is blamed for an
+        unexpected error whichever finished first.
+
+        Returns:
+            Positions of the units that failed with an expected pipeline failure
+        """
+        wait(futures)
+
+        failed = []
+        for position, (name, future) in enumerate(zip(names, futures)):
+            try:
+                future.result()
+            except PipelineFailedException:
+                failed.append(position)
+            except Exception as e:
+                raise _UnexpectedWorkflowUnitError(name, e) from e
+
+        return failed
+
+    def __may_skip_pipeline(self, index: int) -> bool:
+        workflow_unit = self.workflow_units[index][1]
+        if not isinstance(workflow_unit, WorkflowUnit) or workflow_unit.writes is None:
+            return True
+
+        return PIPELINE_SKIP_FIELD in workflow_unit.writes
 
     def set_failure(self, name: str, reason: str, exc: Exception = None):
         raise PipelineFailedException(
@@ -55,23 +246,33 @@ class PipelineOrchestrator:
         workflow_unit: WorkflowUnit,
         state: PipelineStateManager = None,
         global_state: GlobalStateManager = None,
+        workflow_unit_name: str = None,
     ):
-        if not isinstance(workflow_unit, WorkflowUnit):
-            raise ValueError(
-                f"Workflow unit `{self.workflow_unit_name}` is not a valid workflow unit"
-            )
+        self.__assert_prerequisites(
+            workflow_unit, state, global_state, workflow_unit_name
+        )
+        result = workflow_unit.execute_workflow_unit(state, global_state)
+        if inspect.isawaitable(result):
+            result = asyncio.run(result)
+
+        return result
 
+    def __assert_prerequisites(
+        self,
+        workflow_unit: WorkflowUnit,
+        state: PipelineStateManager,
+        global_state: GlobalStateManager,
+        workflow_unit_name: str,
+    ):
         # Validate prerequisites for the workflow unit
-        if workflow_unit.assert_prerequisites_for_workflow_unit(state, global_state):
-            result = workflow_unit.execute_workflow_unit(state, global_state)
-        else:
+        if not workflow_unit.assert_prerequisites_for_workflow_unit(
+            state, global_state
+        ):
             self.set_failure(
-                self.workflow_unit_name,
+                workflow_unit_name,
                 "Prerequisites not met for workflow unit",
             )
 
-        return result
-
     def orchestrate(
         self,
         state: PipelineStateManager = None,
@@ -86,32 +287,41 @@ class PipelineOrchestrator:
             state = PipelineStateManager()  # Initialize the state if it is not provided
 
         if global_state is None:
-            global_state = (
-                GlobalStateManager()
-            )  # Initialize the global state if it is not provided
+            # Default screening config if it is not provided, a global state can't be
+            # built without a job role
+            global_state = ScreeningConfig()
 
+        workflow_unit_name = None
         try:
-            for __definition__, workflow_unit in self.workflow_units:
+            # Units that stopped the pipeline, or were not run because a unit they
+            # depend on did. Independent units are not affected, so the outcome
+            # doesn't depend on which of the concurrent units finishes first.
+            halted = set()
+            for level in self.execution_levels:
+                runnable = []
+                for index in level:
+                    if self.dependencies[index] & halted:
+                        halted.add(index)
+                    else:
+                        runnable.append(index)
 
-                __workflow_unit_name__ = (
-                    __definition__ or workflow_unit.__class__.__name__
-                )
-                self.workflow_unit_name = __workflow_unit_name__
-                if isinstance(workflow_unit, ConcurrentWorkflowUnitsCluster):
-                    self.orchestrate_concurrent_cluster(
-                        workflow_unit.workflow_units, state, global_state
+                if len(runnable) == 1:
+                    index = runnable[0]
+                    workflow_unit_name = self.__workflow_unit_name(index)
+                    try:
+                        self.__run_scheduled_workflow_unit(index, state, global_state)
+                    except PipelineFailedException:
+                        halted.add(index)
+                elif runnable:
+                    halted.update(
+                        self.__run_concurrent_level(runnable, state, global_state)
                     )
-                    continue
-
-                self.__process_workflow_unit(
-                    workflow_unit=workflow_unit,
-                    state=state,
-                    global_state=global_state,
-                )
 
-                # If the pipeline is skipped, stop the pipeline and resume for next data in the queue
+                # If the pipeline is skipped, stop the units depending on the one that skipped it
                 if state.skip_pipeline_from_execution:
-                    break
+                    halted.update(
+                        index for index in runnable if self.__may_skip_pipeline(index)
+                    )
 
         # Ignore pipeline failures which are expected and continue with next data in the queue
         except PipelineFailedException as e:
@@ -119,8 +329,11 @@ class PipelineOrchestrator:
 
         # Handle pipeline failures which are not expected
         except Exception as e:
+            if isinstance(e, _UnexpectedWorkflowUnitError):
+                workflow_unit_name, e = e.workflow_unit_name, e.exc
+
             self.set_failure(
-                self.workflow_unit_name,
+                workflow_unit_name,
                 f"Pipeline failed due to unexpected error: {str(e)}",
                 exc=e,
             )
@@ -128,26 +341,402 @@ class PipelineOrchestrator:
 
         return state
 
+    def orchestrate_many(
+        self,
+        states: List[PipelineStateManager],
+        global_state: GlobalStateManager = None,
+    ) -> List[PipelineStateManager]:
+        """
+        Run the pipeline on a batch of states, stage by stage: every unit runs on all
+        the states before the next unit starts, so per-unit setup is paid once per batch.
+
+        Units implementing `execute_workflow_unit_batch(states, global_state)` get all
+        the states that passed their prerequisites at once, the others run on each
+        state in turn. A state stops (or skips) the pipeline for itself only, with
+        the same outcome as `orchestrate` on that state.
+        """
+        if not self.workflow_units:
+            raise ValueError("Workflow units cannot be empty")
+
+        if global_state is None:
+            global_state = ScreeningConfig()
+
+        # Units halted for each state, as in `orchestrate`
+        halted = [set() for _ in states]
+        workflow_unit_name = None
+        try:
+            for level in self.execution_levels:
+                for index in level:
+                    workflow_unit_name = self.__workflow_unit_name(index)
+                    positions = []
+                    for position, state_halted in enumerate(halted):
+                        if self.dependencies[index] & state_halted:
+                            state_halted.add(index)
+                        else:
+                            positions.append(position)
+
+                    for position in self.__run_workflow_unit_on_batch(
+                        index,
+                        [states[position] for position in positions],
+                        global_state,
+                    ):
+                        halted[positions[position]].add(index)
+
+                    if self.__may_skip_pipeline(index):
+                        for position in positions:
+                            if states[position].skip_pipeline_from_execution:
+                                halted[position].add(index)
+
+        # Handle pipeline failures which are not expected
+        except Exception as e:
+            if isinstance(e, _UnexpectedWorkflowUnitError):
+                workflow_unit_name, e = e.workflow_unit_name, e.exc
+
+            self.set_failure(
+                workflow_unit_name,
+                f"Pipeline failed due to unexpected error: {str(e)}",
+                exc=e,
+            )
+            raise e
+
+        return states
+
+    def orchestrate_iter(
+        self,
+        states: Iterable[PipelineStateManager],
+        global_state: GlobalStateManager = None,
+        max_in_flight: int = PIPELINE_CONCURRENT_WORKERS,
+    ) -> Iterator[Tuple[PipelineStateManager, Optional[PipelineFailedException]]]:
+        """
+        Run the pipeline on a stream of states, yielding each state as it finishes
+
+        `states` is consumed lazily: a new state is only pulled from it while fewer
+        than `max_in_flight` states are running, and finished states wait for the
+        consumer to take them. A slow consumer (e.g. writing to a database) holds
+        back the input, so memory stays bounded by `max_in_flight`.
+
+        States run on threads, so this suits pipelines of thread safe units. The
+        screening pipeline isn't one (PyMuPDF is not thread safe), it is streamed
+        from worker processes by `ResumeExtractionEngine.process` instead, and
+        rescoring goes through `orchestrate_many` for the batched matchers.
+
+        Returns:
+            Iterator of (state, error) in completion order - error is the failure
+            `orchestrate` raised for the state, if any
+        """
+        if not self.workflow_units:
+            raise ValueError("Workflow units cannot be empty")
+
+        if global_state is None:
+            global_state = ScreeningConfig()
+
+        states = iter(states)
+        in_flight = {}  # future -> state
+        exhausted = False
+
+        # States run on threads of their own, the shared executor is left to the
+        # units, which would otherwise wait on the states holding its threads
+        executor = ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="pipeline-state"
+        )
+        try:
+            while True:
+                while not exhausted and len(in_flight) < max_in_flight:
+                    try:
+                        state = next(states)
+                    except StopIteration:
+                        exhausted = True
+                        break
+
+                    future = executor.submit(self.orchestrate, state, global_state)
+                    in_flight[future] = state
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    state = in_flight.pop(future)
+                    try:
+                        yield future.result(), None
+                    except PipelineFailedException as e:
+                        yield state, e
+
+        finally:
+            # Also reached when the consumer stops early, queued states are dropped
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __run_workflow_unit_on_batch(
+        self,
+        index: int,
+        states: List[PipelineStateManager],
+        global_state: GlobalStateManager = None,
+    ) -> List[int]:
+        """
+        Run one unit on the given states
+
+        Returns:
+            Positions of the states on which the unit failed with an expected pipeline failure
+        """
+        workflow_unit = self.workflow_units[index][1]
+        if not hasattr(workflow_unit, "execute_workflow_unit_batch"):
+            failed = []
+            for position, state in enumerate(states):
+                try:
+                    self.__run_scheduled_workflow_unit(index, state, global_state)
+                except PipelineFailedException:
+                    failed.append(position)
+            return failed
+
+        failed = []
+        ready_states = []
+        for position, state in enumerate(states):
+            try:
+                self.__assert_prerequisites(
+                    workflow_unit,
+                    state,
+                    global_state,
+                    self.__workflow_unit_name(index),
+                )
+                ready_states.append(state)
+            except PipelineFailedException:
+                failed.append(position)
+
+        if ready_states:
+            workflow_unit.execute_workflow_unit_batch(ready_states, global_state)
+
+        return failed
+
+    def __run_scheduled_workflow_unit(
+        self,
+        index: int,
+        state: PipelineStateManager,
+        global_state: GlobalStateManager = None,
+    ):
+        __workflow_unit_name__ = self.__workflow_unit_name(index)
+        workflow_unit = self.workflow_units[index][1]
+        if isinstance(workflow_unit, ConcurrentWorkflowUnitsCluster):
+            return self.orchestrate_concurrent_cluster(
+                workflow_unit.workflow_units, state, global_state
+            )
+
+        return self.__process_workflow_unit(
+            workflow_unit=workflow_unit,
+            state=state,
+            global_state=global_state,
+            workflow_unit_name=__workflow_unit_name__,
+        )
+
+    def __run_concurrent_level(
+        self,
+        indexes: List[int],
+        state: PipelineStateManager,
+        global_state: GlobalStateManager = None,
+    ) -> List[int]:
+        """
+        Run independent units concurrently
+
+        Returns:
+            Indexes of the units that failed with an expected pipeline failure
+        """
+        executor = self.__get_executor()
+        futures = [
+            executor.submit(
+                self.__run_scheduled_workflow_unit, index, state, global_state
+            )
+            for index in indexes
+        ]
+
+        failed = self.__wait_for_workflow_units(
+            [self.__workflow_unit_name(index) for index in indexes], futures
+        )
+        return [indexes[position] for position in failed]
+
     def orchestrate_concurrent_cluster(
         self,
         stages: List[Tuple[str, WorkflowUnit]],
         state,
         global_state: GlobalStateManager = None,
     ):
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = []
-            for __definition__, stage in stages:
-                self.workflow_unit_name = __definition__
-
-                future = executor.submit(
+        executor = self.__get_executor()
+        names = []
+        futures = []
+        for __definition__, stage in stages:
+            # Each future gets the name of its own unit, for attributing its errors
+            __workflow_unit_name__ = __definition__ or stage.__class__.__name__
+            names.append(__workflow_unit_name__)
+            futures.append(
+                executor.submit(
                     self.__process_workflow_unit,
                     workflow_unit=stage,
                     state=state,
                     global_state=global_state,
+                    workflow_unit_name=__workflow_unit_name__,
                 )
-                futures.append(future)
+            )
 
-            for future in as_completed(futures):
-                future.result()
+        failed = self.__wait_for_workflow_units(names, futures)
+        if failed:
+            # Expected failures stop the pipeline, as they do outside a cluster
+            futures[failed[0]].result()
 
         return state
+
+    async def orchestrate_async(
+        self,
+        state: PipelineStateManager = None,
+        global_state: GlobalStateManager = None,
+    ):
+        """
+        `orchestrate` for the event loop: async units are awaited on the running loop,
+        sync units run on the executor, so the loop is never blocked. Halting and
+        error attribution are the same as with `orchestrate`.
+        """
+        # Guard Rails
+        if not self.workflow_units:
+            raise ValueError("Workflow units cannot be empty")
+
+        if state is None:
+            state = PipelineStateManager()
+
+        if global_state is None:
+            global_state = ScreeningConfig()
+
+        workflow_unit_name = None
+        try:
+            halted = set()
+            for level in self.execution_levels:
+                runnable = []
+                for index in level:
+                    if self.dependencies[index] & halted:
+                        halted.add(index)
+                    else:
+                        runnable.append(index)
+
+                outcomes = await asyncio.gather(
+                    *(
+                        self.__run_workflow_unit_async(index, state, global_state)
+                        for index in runnable
+                    ),
+                    return_exceptions=True,
+                )
+                # Checked in list order, as in `orchestrate`
+                for index, outcome in zip(runnable, outcomes):
+                    if isinstance(outcome, PipelineFailedException):
+                        halted.add(index)
+                    elif isinstance(outcome, _UnexpectedWorkflowUnitError):
+                        raise outcome
+                    elif isinstance(outcome, Exception):
+                        raise _UnexpectedWorkflowUnitError(
+                            self.__workflow_unit_name(index), outcome
+                        ) from outcome
+                    elif isinstance(outcome, BaseException):
+                        raise outcome
+
+                if state.skip_pipeline_from_execution:
+                    halted.update(
+                        index for index in runnable if self.__may_skip_pipeline(index)
+                    )
+
+        # Handle pipeline failures which are not expected
+        except Exception as e:
+            if isinstance(e, _UnexpectedWorkflowUnitError):
+                workflow_unit_name, e = e.workflow_unit_name, e.exc
+
+            self.set_failure(
+                workflow_unit_name,
+                f"Pipeline failed due to unexpected error: {str(e)}",
+                exc=e,
+            )
+            raise e
+
+        return state
+
+    async def orchestrate_many_async(
+        self,
+        states: List[PipelineStateManager],
+        global_state: GlobalStateManager = None,
+        max_in_flight: int = None,
+    ) -> List[PipelineStateManager]:
+        """
+        Run the pipeline on many states concurrently on the running event loop,
+        with at most `max_in_flight` states at once (unbounded by default)
+
+        Raises the first unexpected error of any state.
+        """
+        if global_state is None:
+            global_state = ScreeningConfig()
+
+        semaphore = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+
+        async def orchestrate_state(state: PipelineStateManager):
+            if semaphore is None:
+                return await self.orchestrate_async(state, global_state)
+
+            async with semaphore:
+                return await self.orchestrate_async(state, global_state)
+
+        return list(
+            await asyncio.gather(*(orchestrate_state(state) for state in states))
+        )
+
+    async def __run_workflow_unit_async(
+        self,
+        index: int,
+        state: PipelineStateManager,
+        global_state: GlobalStateManager = None,
+    ):
+        __workflow_unit_name__ = self.__workflow_unit_name(index)
+        workflow_unit = self.workflow_units[index][1]
+        if not isinstance(workflow_unit, ConcurrentWorkflowUnitsCluster):
+            return await self.__process_workflow_unit_async(
+                workflow_unit, state, global_state, __workflow_unit_name__
+            )
+
+        # The units of a cluster are awaited here rather than through
+        # `orchestrate_concurrent_cluster`, which would block an executor thread
+        names = [
+            __definition__ or stage.__class__.__name__
+            for __definition__, stage in workflow_unit.workflow_units
+        ]
+        outcomes = await asyncio.gather(
+            *(
+                self.__process_workflow_unit_async(stage, state, global_state, name)
+                for name, (_, stage) in zip(names, workflow_unit.workflow_units)
+            ),
+            return_exceptions=True,
+        )
+        # Unexpected errors first, as in `orchestrate_concurrent_cluster`
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, Exception) and not isinstance(
+                outcome, PipelineFailedException
+            ):
+                raise _UnexpectedWorkflowUnitError(name, outcome) from outcome
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        return state
+
+    async def __process_workflow_unit_async(
+        self,
+        workflow_unit: WorkflowUnit,
+        state: PipelineStateManager,
+        global_state: GlobalStateManager,
+        workflow_unit_name: str,
+    ):
+        if inspect.iscoroutinefunction(workflow_unit.execute_workflow_unit):
+            self.__assert_prerequisites(
+                workflow_unit, state, global_state, workflow_unit_name
+            )
+            return await workflow_unit.execute_workflow_unit(state, global_state)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self.__get_executor(),
+            lambda: self.__process_workflow_unit(
+                workflow_unit=workflow_unit,
+                state=state,
+                global_state=global_state,
+                workflow_unit_name=workflow_unit_name,
+            ),
+        )
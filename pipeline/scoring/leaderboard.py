@@ -0,0 +1,121 @@
+import heapq
+from typing import List, Optional, Tuple
+
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+
+# (resume_name, state, view_path)
+LeaderboardEntry = Tuple[str, PipelineStateManager, Optional[str]]
+
+
+class ResumeLeaderboard:
+    """
+    Ranking of screened resumes that is maintained as results arrive.
+
+    Resumes are ordered by score and then experience, both descending, ties keeping
+    the order in which the resumes were added. The best `top_k` resumes are kept in
+    a bounded heap, so reading the top of the ranking costs O(K log K) no matter how
+    many resumes were added. The rest is only sorted when a page beyond the top K is
+    requested, and that order is kept until the next resume is added.
+    """
+
+    def __init__(self, top_k: int = 100):
+        self.top_k = top_k
+        self.entries: List[LeaderboardEntry] = []
+
+        # Min-heap of (score, experience, -index, index) for the best `top_k`
+        # entries, the root being the lowest ranked of them
+        self._top_heap: List[Tuple[float, float, int, int]] = []
+        # Keys of the entries that didn't make it into the top K
+        self._rest: List[Tuple[float, float, int, int]] = []
+
+        self._sorted_top: Optional[List[int]] = None
+        self._sorted_rest: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(
+        self,
+        resume_name: str,
+        state: PipelineStateManager,
+        view_path: Optional[str] = None,
+    ):
+        """Add a screened resume, O(log K)"""
+        index = len(self.entries)
+        self.entries.append((resume_name, state, view_path))
+        self._push(self._ranking_key(state, index))
+
+    def copy(self) -> "ResumeLeaderboard":
+        """Copy of the ranking, with copies of the states so it can be rescored on its own"""
+        leaderboard = ResumeLeaderboard(self.top_k)
+        leaderboard.entries = [
+            (resume_name, state.copy(), view_path)
+            for resume_name, state, view_path in self.entries
+        ]
+        leaderboard._top_heap = list(self._top_heap)
+        leaderboard._rest = list(self._rest)
+        return leaderboard
+
+    def refresh(self):
+        """Rank all resumes again, after their scores changed (e.g. a rescore)"""
+        self._top_heap = []
+        self._rest = []
+        self._sorted_top = None
+        self._sorted_rest = None
+
+        for index, (_, state, _) in enumerate(self.entries):
+            self._push(self._ranking_key(state, index))
+
+    def top(self) -> List[LeaderboardEntry]:
+        """The best `top_k` resumes, best first"""
+        return [self.entries[index] for index in self._top_indexes()]
+
+    def page(self, page_number: int, page_size: int) -> List[LeaderboardEntry]:
+        """
+        Resumes on a page of the ranking, best first
+
+        Args:
+            page_number: 0-based page number
+            page_size: Number of resumes per page
+        """
+        return [
+            self.entries[index] for index in self.page_indexes(page_number, page_size)
+        ]
+
+    def page_indexes(self, page_number: int, page_size: int) -> List[int]:
+        """Like `page`, the indexes (in order of addition) of the resumes on the page"""
+        start = page_number * page_size
+        stop = start + page_size
+
+        # Pages within the top K never touch the rest of the resumes
+        top_indexes = self._top_indexes()
+        if stop <= len(top_indexes):
+            return top_indexes[start:stop]
+        return (top_indexes + self._rest_indexes())[start:stop]
+
+    def _push(self, key: Tuple[float, float, int, int]):
+        self._sorted_top = None
+        self._sorted_rest = None
+
+        if len(self._top_heap) < self.top_k:
+            heapq.heappush(self._top_heap, key)
+        else:
+            # The new entry and the lowest ranked of the top K compete for a place
+            self._rest.append(heapq.heappushpop(self._top_heap, key))
+
+    def _top_indexes(self) -> List[int]:
+        if self._sorted_top is None:
+            self._sorted_top = [key[3] for key in sorted(self._top_heap, reverse=True)]
+        return self._sorted_top
+
+    def _rest_indexes(self) -> List[int]:
+        if self._sorted_rest is None:
+            self._sorted_rest = [key[3] for key in sorted(self._rest, reverse=True)]
+        return self._sorted_rest
+
+    @staticmethod
+    def _ranking_key(
+        state: PipelineStateManager, index: int
+    ) -> Tuple[float, float, int, int]:
+        # Higher keys rank first, -index puts earlier resumes first on ties
+        return state.score, state.extracted_working_exp, -index, index
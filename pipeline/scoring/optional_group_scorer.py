@@ -0,0 +1,159 @@
+import itertools
+from typing import Dict, List, Sequence
+
+import numpy as np
+from scipy import sparse
+
+from pipeline.state_managers.screening_config import ScreeningConfig, ScreeningGroup
+
+# Upper bound of the experience boost applied to the optional score
+MAX_EXPERIENCE_FACTOR = 1.5
+
+
+class OptionalGroupScorer:
+    """
+    Vectorized scoring of the optional keyword groups for a batch of resumes.
+
+    Keyword hits are turned into a sparse resume x term presence matrix, which is
+    multiplied with a term x group incidence matrix to count the matched terms of
+    every group. The group contributions, experience boost and normalization are
+    then computed on whole columns, giving the same scores as
+    `OptionalParamsMatcher` does one resume at a time.
+    """
+
+    def __init__(
+        self,
+        optional_screening_params: Sequence[ScreeningGroup],
+        reserved_points_for_optional_params: float,
+    ):
+        self.reserved_points = reserved_points_for_optional_params
+        self.group_names = [group.name for group in optional_screening_params]
+        self.group_weights = np.array(
+            [group.weight for group in optional_screening_params], dtype=np.float64
+        )
+        # Summed in Python like the sequential matcher, so the totals are identical
+        self.total_weight = sum(group.weight for group in optional_screening_params)
+
+        self._groups = [
+            [term.strip() for term in group.terms]
+            for group in optional_screening_params
+        ]
+
+        # Column of every distinct (stripped) term
+        self.terms = list(
+            dict.fromkeys(term for group in self._groups for term in group)
+        )
+        self.term_columns = {term: column for column, term in enumerate(self.terms)}
+
+        # Number of times each term is listed in each group, a term listed twice in
+        # a group counts as two matched terms there
+        rows = [self.term_columns[term] for group in self._groups for term in group]
+        columns = [
+            group_index for group_index, group in enumerate(self._groups) for _ in group
+        ]
+        self.term_group_matrix = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, columns)),
+            shape=(len(self.terms), len(self.group_names)),
+        )
+
+    @staticmethod
+    def from_screening_config(
+        screening_config: ScreeningConfig,
+    ) -> "OptionalGroupScorer":
+        return OptionalGroupScorer(
+            screening_config.optional_screening_params,
+            screening_config.reserved_points_for_optional_params,
+        )
+
+    def presence_matrix(
+        self,
+        keyword_hits: Sequence[Dict[str, Sequence[str]]],
+        hit_keywords: Sequence[str],
+    ) -> sparse.csr_matrix:
+        """
+        Build the resume x term presence matrix from per-resume keyword hits
+
+        Args:
+            keyword_hits: Hits of every resume, each listing all of `hit_keywords` in
+                that order (as returned by `KeywordMatchingUtils.find_keyword_hits`)
+            hit_keywords: The keywords of the hits, which include all optional terms
+        """
+        keyword_presence = np.fromiter(
+            itertools.chain.from_iterable(
+                map(bool, hits.values()) for hits in keyword_hits
+            ),
+            dtype=bool,
+            count=len(keyword_hits) * len(hit_keywords),
+        ).reshape(len(keyword_hits), len(hit_keywords))
+
+        keyword_columns = {
+            keyword: column for column, keyword in enumerate(hit_keywords)
+        }
+        term_columns = [keyword_columns[term] for term in self.terms]
+
+        return sparse.csr_matrix(keyword_presence[:, term_columns], dtype=np.float64)
+
+    def group_match_counts(self, presence: sparse.csr_matrix) -> np.ndarray:
+        """Number of matched terms per resume and group"""
+        return (presence @ self.term_group_matrix).toarray()
+
+    def score(
+        self, group_match_counts: np.ndarray, working_experience: np.ndarray
+    ) -> np.ndarray:
+        """
+        Optional keyword scores of a batch
+
+        Args:
+            group_match_counts: Resume x group matched term counts, see
+                `group_match_counts`
+            working_experience: Extracted years of experience per resume
+
+        Returns:
+            Array with the optional keywords score of every resume
+        """
+        # Each matched group adds its weight divided by the number of matched terms.
+        # Groups are added column by column in their configured order, so the float
+        # sums round exactly like the sequential matcher
+        optional_scores = np.zeros(group_match_counts.shape[0])
+        for group_index, group_weight in enumerate(self.group_weights):
+            counts = group_match_counts[:, group_index]
+            matched = counts > 0
+            optional_scores[matched] += group_weight / counts[matched]
+
+        if self.total_weight > 0:
+            base_percentages = optional_scores / self.total_weight
+        else:
+            base_percentages = np.zeros_like(optional_scores)
+
+        experience_factors = np.minimum(
+            MAX_EXPERIENCE_FACTOR,
+            1 + np.asarray(working_experience, dtype=np.float64) / 10,
+        )
+        boosted_percentages = np.minimum(1.0, base_percentages * experience_factors)
+
+        return np.minimum(
+            boosted_percentages * self.reserved_points, self.reserved_points
+        )
+
+    def matched_groups(
+        self,
+        keyword_hits: Dict[str, Sequence[str]],
+        group_match_counts: Sequence[float],
+    ) -> Dict[str, List[str]]:
+        """
+        Matched terms per group of a single resume, as stored on the state
+
+        Args:
+            keyword_hits: Hits of the resume
+            group_match_counts: The resume's row of `group_match_counts`
+        """
+        found_groups = {}
+        for group_index, count in enumerate(group_match_counts):
+            if not count:
+                continue
+            found_groups[self.group_names[group_index]] = [
+                keyword_hits[term][0].capitalize()
+                for term in self._groups[group_index]
+                if keyword_hits[term]
+            ]
+        return found_groups
@@ -0,0 +1,241 @@
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from pipeline.scoring.optional_group_scorer import (
+    MAX_EXPERIENCE_FACTOR,
+    OptionalGroupScorer,
+)
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+from pipeline.state_managers.screening_config import ScreeningConfig
+from pipeline.utils.keyword_matching import KeywordMatchingUtils
+
+
+class SensitivityReport:
+    """Scores and ranks of a batch under a reference and several candidate weightings"""
+
+    def __init__(
+        self,
+        resume_names: List[str],
+        reference_scores: np.ndarray,
+        reference_ranks: np.ndarray,
+        candidate_scores: np.ndarray,
+        candidate_ranks: np.ndarray,
+    ):
+        self.resume_names = resume_names
+        self.reference_scores = reference_scores  # (resumes,)
+        self.reference_ranks = reference_ranks  # (resumes,)
+        self.candidate_scores = candidate_scores  # (resumes, candidates)
+        self.candidate_ranks = candidate_ranks  # (resumes, candidates)
+
+    @property
+    def rank_changes(self) -> np.ndarray:
+        """Places gained (positive) or lost (negative) per resume and candidate"""
+        return self.reference_ranks[:, None] - self.candidate_ranks
+
+    def moved_resumes(self, candidate: int = 0) -> List[Dict]:
+        """Resumes whose rank changes under a candidate weighting, biggest moves first"""
+        changes = self.rank_changes[:, candidate]
+        moved = np.flatnonzero(changes)
+        moved = moved[np.argsort(-np.abs(changes[moved]), kind="stable")]
+
+        return [
+            {
+                "resume": self.resume_names[index],
+                "rank": int(self.reference_ranks[index]),
+                "new_rank": int(self.candidate_ranks[index, candidate]),
+                "rank_change": int(changes[index]),
+                "score": float(self.reference_scores[index]),
+                "new_score": float(self.candidate_scores[index, candidate]),
+            }
+            for index in moved
+        ]
+
+
+class ScoreMatrix:
+    """
+    Per-resume inputs of the final score, kept as arrays so that the scores of a whole
+    batch can be evaluated for many weightings of the optional groups and of the
+    mandatory/optional points at once.
+
+    For each resume it holds the matched term count of every optional group, the
+    extracted experience and whether the mandatory keywords matched, which together
+    with the weights fully determine the `ScoreAggregator` output.
+    """
+
+    def __init__(
+        self,
+        resume_names: List[str],
+        group_names: List[str],
+        group_weights: Sequence[float],
+        group_match_counts: np.ndarray,
+        working_experience: np.ndarray,
+        mandatory_passed: np.ndarray,
+        reserved_points_for_mandatory_params: float,
+        reserved_points_for_optional_params: float,
+    ):
+        self.resume_names = resume_names
+        self.group_names = group_names
+        self.group_weights = np.asarray(group_weights, dtype=np.float64)
+        self.group_match_counts = np.asarray(group_match_counts, dtype=np.float64)
+        self.working_experience = np.asarray(working_experience, dtype=np.float64)
+        self.mandatory_passed = np.asarray(mandatory_passed, dtype=bool)
+        self.reserved_points_for_mandatory_params = reserved_points_for_mandatory_params
+        self.reserved_points_for_optional_params = reserved_points_for_optional_params
+
+        # Inverse of the matched term counts, 0 for groups without matches, so that
+        # the group contributions of many weightings are a single matrix product
+        self._inverse_match_counts = np.divide(
+            1.0,
+            self.group_match_counts,
+            out=np.zeros_like(self.group_match_counts),
+            where=self.group_match_counts > 0,
+        )
+        self._experience_factors = np.minimum(
+            MAX_EXPERIENCE_FACTOR, 1 + self.working_experience / 10
+        )
+
+    @staticmethod
+    def from_states(
+        resume_names: List[str],
+        states: List[PipelineStateManager],
+        screening_config: ScreeningConfig,
+    ) -> "ScoreMatrix":
+        """Build the matrix from screened resumes and the config they were scored with"""
+        scorer = OptionalGroupScorer.from_screening_config(screening_config)
+        signature = KeywordMatchingUtils.screening_matcher_signature(screening_config)
+
+        # Resumes failing the mandatory keywords score 0 whatever the weights, so
+        # only the ones that passed need their optional matches
+        mandatory_passed = np.array([state.passed for state in states], dtype=bool)
+        group_match_counts = np.zeros((len(states), len(scorer.group_names)))
+
+        passed_indexes = np.flatnonzero(mandatory_passed)
+        if len(passed_indexes):
+            keyword_hits = [
+                KeywordMatchingUtils.find_keyword_hits(states[index], signature)
+                for index in passed_indexes
+            ]
+            group_match_counts[passed_indexes] = scorer.group_match_counts(
+                scorer.presence_matrix(keyword_hits, signature[0])
+            )
+
+        return ScoreMatrix(
+            resume_names=resume_names,
+            group_names=scorer.group_names,
+            group_weights=scorer.group_weights,
+            group_match_counts=group_match_counts,
+            working_experience=[state.extracted_working_exp for state in states],
+            mandatory_passed=mandatory_passed,
+            reserved_points_for_mandatory_params=screening_config.reserved_points_for_mandatory_params,
+            reserved_points_for_optional_params=screening_config.reserved_points_for_optional_params,
+        )
+
+    def weights_with(self, weight_overrides: Dict[str, float]) -> np.ndarray:
+        """Current group weights with some groups changed, e.g. {"Testing": 15}"""
+        weights = self.group_weights.copy()
+        for group_name, weight in weight_overrides.items():
+            weights[self.group_names.index(group_name)] = weight
+        return weights
+
+    def scores(
+        self,
+        group_weights: np.ndarray = None,
+        reserved_points_for_mandatory_params=None,
+        reserved_points_for_optional_params=None,
+    ) -> np.ndarray:
+        """
+        Final scores of every resume under one or many weightings
+
+        Args:
+            group_weights: Optional group weights, (groups,) or (candidates, groups),
+                defaults to the current weights
+            reserved_points_for_mandatory_params: Scalar or one value per candidate
+            reserved_points_for_optional_params: Scalar or one value per candidate
+
+        Returns:
+            Scores of shape (resumes, candidates)
+        """
+        if group_weights is None:
+            group_weights = self.group_weights
+        group_weights = np.atleast_2d(np.asarray(group_weights, dtype=np.float64))
+
+        if reserved_points_for_mandatory_params is None:
+            reserved_points_for_mandatory_params = (
+                self.reserved_points_for_mandatory_params
+            )
+        if reserved_points_for_optional_params is None:
+            reserved_points_for_optional_params = (
+                self.reserved_points_for_optional_params
+            )
+        mandatory_points = np.broadcast_to(
+            np.asarray(reserved_points_for_mandatory_params, dtype=np.float64),
+            (len(group_weights),),
+        )
+        optional_points = np.broadcast_to(
+            np.asarray(reserved_points_for_optional_params, dtype=np.float64),
+            (len(group_weights),),
+        )
+
+        # (resumes, candidates): sum over groups of weight / matched term count
+        optional_scores = self._inverse_match_counts @ group_weights.T
+
+        total_weights = group_weights.sum(axis=1)
+        base_percentages = np.divide(
+            optional_scores,
+            total_weights,
+            out=np.zeros_like(optional_scores),
+            where=total_weights > 0,
+        )
+        boosted_percentages = np.minimum(
+            1.0, base_percentages * self._experience_factors[:, None]
+        )
+        optional_scores = np.minimum(
+            boosted_percentages * optional_points, optional_points
+        )
+
+        return np.where(
+            self.mandatory_passed[:, None], mandatory_points + optional_scores, 0.0
+        )
+
+    def ranks(self, scores: np.ndarray) -> np.ndarray:
+        """
+        1-based rank of every resume per column of `scores`, ordered by score and
+        then experience, both descending, ties keeping the batch order
+        """
+        experience = np.broadcast_to(-self.working_experience[:, None], scores.shape)
+        order = np.lexsort((experience, -scores), axis=0)
+
+        ranks = np.empty(scores.shape, dtype=np.int64)
+        np.put_along_axis(ranks, order, np.arange(1, len(scores) + 1)[:, None], axis=0)
+        return ranks
+
+    def sensitivity(
+        self,
+        group_weights: np.ndarray,
+        reserved_points_for_mandatory_params=None,
+        reserved_points_for_optional_params=None,
+    ) -> SensitivityReport:
+        """
+        Compare the ranking under candidate weightings against the current one
+
+        Args:
+            group_weights: Candidate optional group weights, (groups,) or
+                (candidates, groups)
+            reserved_points_for_mandatory_params: Scalar or one value per candidate
+            reserved_points_for_optional_params: Scalar or one value per candidate
+        """
+        reference_scores = self.scores()
+        candidate_scores = self.scores(
+            group_weights,
+            reserved_points_for_mandatory_params,
+            reserved_points_for_optional_params,
+        )
+
+        return SensitivityReport(
+            resume_names=self.resume_names,
+            reference_scores=reference_scores[:, 0],
+            reference_ranks=self.ranks(reference_scores)[:, 0],
+            candidate_scores=candidate_scores,
+            candidate_ranks=self.ranks(candidate_scores),
+        )
@@ -6,8 +6,6 @@ from pipeline.type_defs import MandatoryScreeningParams, OptionalScreeningParams
 class GlobalStateManager:
     """Global state manager for the pipeline."""
 
-    __instance = None
-
     def __init__(
         self,
         job_role: str,
@@ -41,9 +39,3 @@ class GlobalStateManager:
         self.years_of_experience_from_llm: float = 2.0
         self.reserved_points_for_mandatory_params: int = 60
         self.reserved_points_for_optional_params: int = 40
-
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super(GlobalStateManager, cls).__new__(cls)
-
-        return cls.__instance
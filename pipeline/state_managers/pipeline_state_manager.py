@@ -1,16 +1,93 @@
-from typing import List, Dict
+import copy
+import hashlib
+import re
+from typing import List, Dict, Optional, Tuple
+
+TOKEN_REGEX = re.compile(r"\w+")
+TRAILING_DIGITS_REGEX = re.compile(r"\d+$")
+
+# Content id of the empty text, as a `ContentStore` keys it
+EMPTY_CONTENT_ID = hashlib.sha256(b"").hexdigest()
 
 
 class PipelineStateManager:
-    """State manager for the pipeline."""
+    """
+    State manager for the pipeline.
+
+    The state is slotted, thousands of them are kept for a screened batch. Its texts
+    are released along the way: the raw text once it is processed, and the processed
+    text once the resume is scored, when it is spilled to a content store and read
+    back only if a stage needs it again.
+    """
 
     __instance = None
 
-    def __init__(self):
+    __slots__ = (
+        "resume_source",
+        "resume_file_name",
+        "resume_digest",
+        "raw_content_of_resume",
+        "_content_views",
+        "_processed_content_of_resume",
+        "_content_store",
+        "_content_id",
+        "is_content_truncated",
+        "content_truncation_reason",
+        "is_scanned_document",
+        "page_texts",
+        "pages_to_split",
+        "extracted_working_exp",
+        "extracted_email",
+        "extracted_contact",
+        "missing_mandatory_keywords",
+        "keyword_hits",
+        "keyword_hits_signature",
+        "scanned_keyword_hits",
+        "mandatory_keyword_matches",
+        "optional_keywords_score",
+        "mandatory_keywords_score",
+        "matched_optional_groups",
+        "score",
+        "passed",
+        "semantic_similarity_score",
+        "skip_pipeline_from_execution",
+        "pipeline_skip_reason",
+        "experience_check_message",
+    )
+
+    def __init__(self, resume_source: str | bytes = None, resume_file_name: str = ""):
+        # Input of the pipeline: the path of the resume PDF, or its content (bytes,
+        # memoryview or mmap) which is released once parsed, and the resume name
+        self.resume_source = resume_source
+        self.resume_file_name: str = resume_file_name
+        # SHA-256 of the PDF, set once parsed, identifies the resume whatever its name
+        self.resume_digest: str = ""
+
         # Content of the resume
         self.raw_content_of_resume: str = ""
+
+        # Views derived from the processed content, built lazily and reset whenever
+        # the processed content is set
+        self._content_views: dict = {}
         self.processed_content_of_resume: str = ""
 
+        # Content store holding the processed content once it was spilled
+        self._content_store = None
+        self._content_id: Optional[str] = None
+
+        # Set when the extraction budgets cut the resume content short
+        self.is_content_truncated: bool = False
+        self.content_truncation_reason: str = ""
+
+        # Set when the resume has no text layer (e.g. a scanned document)
+        self.is_scanned_document: bool = False
+
+        # Page-parallel extraction of long resumes: the parser asks for the first
+        # `pages_to_split` pages to be extracted in ranges, and is given their texts
+        # in `page_texts` on the next run
+        self.page_texts: Optional[List[str]] = None
+        self.pages_to_split: int = 0
+
         # Extracted Features
         self.extracted_working_exp: float = 0.0
         self.extracted_email: str = ""
@@ -19,6 +96,17 @@ class PipelineStateManager:
         # Missing mandatory keywords
         self.missing_mandatory_keywords: List[str] = []
 
+        # First hit (if any) of every screening keyword, shared by the keyword matchers,
+        # and the (keywords, case_sensitive, use_partial_matching) they were computed for
+        self.keyword_hits: Dict[str, Tuple[str, ...]] = {}
+        self.keyword_hits_signature: tuple = ()
+
+        # Hits of every keyword scanned so far, per (case_sensitive, use_partial_matching),
+        # so that a changed screening config only scans its new keywords
+        self.scanned_keyword_hits: Dict[
+            Tuple[bool, bool], Dict[str, Tuple[str, ...]]
+        ] = {}
+
         # Mandatory keyword matches
         self.mandatory_keyword_matches: List[str] = []
 
@@ -39,3 +127,150 @@ class PipelineStateManager:
         # Skip Pipeline Flag
         self.skip_pipeline_from_execution: bool = False
         self.pipeline_skip_reason: str = ""
+
+        # Note of the pre-screening validator on the experience, kept apart from the
+        # skip reason so the validator doesn't have to run in line with the matchers
+        self.experience_check_message: str = ""
+
+    @property
+    def screening_outcome(self) -> str:
+        """Why the resume was skipped, or else the note on its experience"""
+        return self.pipeline_skip_reason or self.experience_check_message
+
+    @property
+    def processed_content_of_resume(self) -> str:
+        if self._processed_content_of_resume is not None:
+            return self._processed_content_of_resume
+
+        # Spilled, read back once and kept with the other views until they're released
+        if "processed" not in self._content_views:
+            self._content_views["processed"] = self._content_store.get(self._content_id)
+        return self._content_views["processed"]
+
+    @processed_content_of_resume.setter
+    def processed_content_of_resume(self, content: str):
+        self._processed_content_of_resume = content
+        self._content_store = None
+        self._content_id = None
+        self._content_views = {}
+        self.keyword_hits_signature = ()
+        self.scanned_keyword_hits = {}
+
+    @property
+    def lowered_content(self) -> str:
+        """Lowercased processed content, as matched by case-insensitive stages"""
+        if "lowered" not in self._content_views:
+            self.build_lowered_content()
+        return self._content_views["lowered"]
+
+    def build_lowered_content(self):
+        """
+        Build `lowered_content` now instead of on first use, so that stages running
+        concurrently only read it
+        """
+        self._content_views["lowered"] = self.processed_content_of_resume.lower()
+
+    @property
+    def token_set(self) -> frozenset:
+        """Distinct lowered tokens, for cheap membership checks"""
+        if "token_set" not in self._content_views:
+            self._content_views["token_set"] = frozenset(
+                TOKEN_REGEX.findall(self.lowered_content)
+            )
+        return self._content_views["token_set"]
+
+    @property
+    def versionless_token_set(self) -> frozenset:
+        """`token_set` plus its tokens without version digits ("html5" -> "html")"""
+        if "versionless_token_set" not in self._content_views:
+            self._content_views["versionless_token_set"] = self.token_set.union(
+                TRAILING_DIGITS_REGEX.sub("", token)
+                for token in self.token_set
+                if token[-1].isdecimal()
+            )
+        return self._content_views["versionless_token_set"]
+
+    @property
+    def is_content_spilled(self) -> bool:
+        return self._processed_content_of_resume is None
+
+    @property
+    def content_id(self) -> Optional[str]:
+        """Content id of the spilled processed text, None while it is in memory"""
+        return self._content_id
+
+    @property
+    def has_processed_content(self) -> bool:
+        """Whether the processed text is not empty, without reading a spilled one back"""
+        if self.is_content_spilled:
+            return self._content_id != EMPTY_CONTENT_ID
+        return bool(self._processed_content_of_resume)
+
+    def release_resume_source(self):
+        """Drop the in-memory content of the resume, called once it has been parsed"""
+        if not isinstance(self.resume_source, str):
+            self.resume_source = None
+
+    def release_raw_content(self):
+        """Drop the raw text, called once it has been processed"""
+        self.raw_content_of_resume = ""
+
+    def spill_processed_content(self, content_store) -> str:
+        """
+        Move the processed text to a content store, called once the resume is scored
+
+        Args:
+            content_store: `ContentStore` the text is put in, typically the one
+                backing the results
+
+        Returns:
+            The content id of the text in the store
+        """
+        if self.is_content_spilled:
+            return self._content_id
+
+        self._content_id = content_store.put(self._processed_content_of_resume)
+        self._content_store = content_store
+        self._processed_content_of_resume = None
+        self._content_views = {}
+        return self._content_id
+
+    def release_content_views(self):
+        """Drop the derived views (and a text read back after spilling)"""
+        self._content_views = {}
+
+    def reset_screening_outcome(self):
+        """Clear the results of the scoring stages, so the resume can be scored again"""
+        self.missing_mandatory_keywords = []
+        self.mandatory_keyword_matches = []
+        self.optional_keywords_score = 0.0
+        self.mandatory_keywords_score = 0.0
+        self.matched_optional_groups = {}
+        self.score = 0.0
+        self.passed = False
+        self.skip_pipeline_from_execution = False
+        self.pipeline_skip_reason = ""
+        self.experience_check_message = ""
+
+    def copy(self) -> "PipelineStateManager":
+        """
+        Copy of the state that can be rescored without changing this one. A spilled
+        text stays in (and is shared through) its content store.
+        """
+        state = self.__getstate__()
+        content_store = state.pop("_content_store")
+
+        clone = PipelineStateManager.__new__(PipelineStateManager)
+        clone.__setstate__(copy.deepcopy(state))
+        clone._content_store = content_store
+        return clone
+
+    def __getstate__(self):
+        # Derived views are cheap to rebuild, don't ship them between processes
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state["_content_views"] = {}
+        return state
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            setattr(self, name, value)
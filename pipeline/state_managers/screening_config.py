@@ -0,0 +1,73 @@
+import hashlib
+from dataclasses import dataclass
+from functools import cached_property
+from typing import NamedTuple, Tuple
+
+from pipeline.config import (
+    RESERVED_POINTS_FOR_MANDATORY_KEYWORDS,
+    RESERVED_POINTS_FOR_OPTIONAL_KEYWORDS,
+)
+from pipeline.state_managers.global_state_manager import GlobalStateManager
+
+
+class ScreeningGroup(NamedTuple):
+    """Optional keyword group of a screening config"""
+
+    name: str
+    weight: float
+    terms: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ScreeningConfig:
+    """
+    Immutable snapshot of everything a resume is screened and scored with.
+
+    Built once per run from the (mutable) global state of the app. Being frozen, a
+    config is safely shared by threads without locking, and being a small tree of
+    tuples it pickles cheaply to process workers. Equal configs hash equally, and
+    `fingerprint` identifies the config across processes, e.g. as a cache key.
+    """
+
+    mandatory_screening_params: Tuple[str, ...] = ()
+    optional_screening_params: Tuple[ScreeningGroup, ...] = ()
+    use_partial_matching: bool = True
+    use_case_sensitive: bool = False
+    use_strict_experience_check: bool = False
+    working_exp_criteria: float = 2.0
+    reserved_points_for_mandatory_params: float = RESERVED_POINTS_FOR_MANDATORY_KEYWORDS
+    reserved_points_for_optional_params: float = RESERVED_POINTS_FOR_OPTIONAL_KEYWORDS
+
+    @staticmethod
+    def from_global_state(global_state: GlobalStateManager) -> "ScreeningConfig":
+        """Snapshot the screening params and settings of a global state"""
+        return ScreeningConfig(
+            mandatory_screening_params=tuple(global_state.mandatory_screening_params),
+            optional_screening_params=tuple(
+                ScreeningGroup(group["name"], group["weight"], tuple(group["terms"]))
+                for group in global_state.optional_screening_params
+            ),
+            use_partial_matching=global_state.use_partial_matching,
+            use_case_sensitive=global_state.use_case_sensitive,
+            use_strict_experience_check=global_state.use_strict_experience_check,
+            working_exp_criteria=global_state.working_exp_criteria,
+            reserved_points_for_mandatory_params=global_state.reserved_points_for_mandatory_params,
+            reserved_points_for_optional_params=global_state.reserved_points_for_optional_params,
+        )
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """SHA-256 hex digest of the config, stable across processes"""
+        # The repr of the plain values, not of the config, which includes the
+        # class names
+        fields = (
+            self.mandatory_screening_params,
+            tuple(tuple(group) for group in self.optional_screening_params),
+            self.use_partial_matching,
+            self.use_case_sensitive,
+            self.use_strict_experience_check,
+            self.working_exp_criteria,
+            self.reserved_points_for_mandatory_params,
+            self.reserved_points_for_optional_params,
+        )
+        return hashlib.sha256(repr(fields).encode("utf-8")).hexdigest()
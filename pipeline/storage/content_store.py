@@ -0,0 +1,120 @@
+import hashlib
+import os
+import tempfile
+from typing import Dict, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+CONTENT_SCHEMA = pa.schema(
+    [
+        ("content_id", pa.string()),
+        ("text", pa.large_string()),
+    ]
+)
+
+
+class ContentStore:
+    """
+    Texts of the screened resumes, stored out of line from the results table.
+
+    Texts are keyed by the SHA-256 of their UTF-8 encoding, so the results table only
+    carries a short content id per resume and identical resumes (e.g. the same file
+    uploaded twice) are stored once. The texts are kept in memory, or spilled to a
+    directory with one file per text when the store is given one.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Args:
+            directory: Directory the texts are spilled to, None keeps them in memory
+        """
+        self.directory = directory
+
+        # Text per content id, None for texts spilled to the directory
+        self._texts: Dict[str, Optional[str]] = {}
+
+        # Set by `temporary`, removes the directory once the store is collected
+        self._temporary_directory = None
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def temporary() -> "ContentStore":
+        """Store spilling to a temporary directory that is removed with the store"""
+        temporary_directory = tempfile.TemporaryDirectory(prefix="resume_content_")
+        content_store = ContentStore(temporary_directory.name)
+        content_store._temporary_directory = temporary_directory
+        return content_store
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, content_id: str) -> bool:
+        return content_id in self._texts
+
+    @staticmethod
+    def digest(text: str) -> str:
+        """Return the content id of a text"""
+        return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def put(self, text: str) -> str:
+        """Store a text and return its content id"""
+        content_id = self.digest(text)
+        if content_id in self._texts:
+            return content_id
+
+        if self.directory is None:
+            self._texts[content_id] = text
+            return content_id
+
+        # Write to a temporary file first so readers never observe a partial text
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(text.encode("utf-8", "surrogatepass"))
+        os.replace(tmp_path, self._text_path(content_id))
+
+        self._texts[content_id] = None
+        return content_id
+
+    def get(self, content_id: str, default: str = "") -> str:
+        """Return the text of a content id, `default` if it is not stored"""
+        if content_id not in self._texts:
+            return default
+
+        text = self._texts[content_id]
+        if text is None:
+            with open(self._text_path(content_id), "rb") as f:
+                text = f.read().decode("utf-8", "surrogatepass")
+        return text
+
+    def to_table(self) -> pa.Table:
+        return pa.table(
+            [
+                list(self._texts.keys()),
+                [self.get(content_id) for content_id in self._texts],
+            ],
+            schema=CONTENT_SCHEMA,
+        )
+
+    def save(self, path: str):
+        """Write the texts to a Parquet file"""
+        pq.write_table(self.to_table(), path)
+
+    @staticmethod
+    def load(path: str) -> "ContentStore":
+        """Read the texts written by `save` into memory"""
+        table = pq.read_table(path, memory_map=True).cast(CONTENT_SCHEMA)
+
+        content_store = ContentStore()
+        content_store._texts = dict(
+            zip(
+                table.column("content_id").to_pylist(),
+                table.column("text").to_pylist(),
+            )
+        )
+        return content_store
+
+    def _text_path(self, content_id: str) -> str:
+        return os.path.join(self.directory, f"{content_id}.txt")
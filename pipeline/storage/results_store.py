@@ -0,0 +1,207 @@
+import io
+import os
+from typing import Iterable, List, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+from pipeline.storage.content_store import ContentStore
+
+# Keywords, group names and skip reasons repeat across resumes, so they are stored
+# once per column chunk and referenced by index
+DICTIONARY_STRING = pa.dictionary(pa.int32(), pa.string())
+
+# Columns set by the scoring stages, replaced when the results are rescored
+OUTCOME_SCHEMA = pa.schema(
+    [
+        ("score", pa.float64()),
+        ("mandatory_keywords_score", pa.float64()),
+        ("optional_keywords_score", pa.float64()),
+        ("passed", pa.bool_()),
+        ("skipped", pa.bool_()),
+        ("screening_outcome", DICTIONARY_STRING),
+        ("mandatory_keyword_matches", pa.list_(DICTIONARY_STRING)),
+        ("missing_mandatory_keywords", pa.list_(DICTIONARY_STRING)),
+        (
+            "matched_optional_groups",
+            pa.list_(
+                pa.struct(
+                    [
+                        ("group", DICTIONARY_STRING),
+                        ("terms", pa.list_(DICTIONARY_STRING)),
+                    ]
+                )
+            ),
+        ),
+    ]
+)
+
+RESULTS_SCHEMA = pa.schema(
+    [
+        ("resume", pa.string()),
+        ("view_path", pa.string()),
+        # Key of the processed text in the content store
+        ("content_id", pa.string()),
+        ("is_content_truncated", pa.bool_()),
+        ("is_scanned_document", pa.bool_()),
+        ("working_experience", pa.float64()),
+        ("email", pa.string()),
+        ("contact", pa.string()),
+        *OUTCOME_SCHEMA,
+    ]
+)
+
+RESULTS_FILE_NAME = "results.parquet"
+CONTENT_FILE_NAME = "content.parquet"
+
+
+class ResultsStore:
+    """
+    Columnar store of screening results, one row per resume.
+
+    Results are kept in an Arrow table instead of as pipeline states: scores and
+    flags are plain numeric columns, keyword lists are dictionary encoded and the
+    resume text lives out of line in a `ContentStore`. Rows are appended as results
+    arrive and batched into the table when it is read. The table can be saved to
+    and loaded from Parquet, and converted to pandas without copying its buffers.
+    """
+
+    def __init__(self, content_store: Optional[ContentStore] = None):
+        self.content_store = (
+            content_store if content_store is not None else ContentStore()
+        )
+        self._table = RESULTS_SCHEMA.empty_table()
+        self._pending_rows: List[dict] = []
+
+    def __len__(self) -> int:
+        return self._table.num_rows + len(self._pending_rows)
+
+    def append(
+        self,
+        resume_name: str,
+        state: PipelineStateManager,
+        view_path: Optional[str] = None,
+    ):
+        """
+        Add the result of a screened resume as the next row. A text the state already
+        spilled to the content store of the results is not hashed and stored again.
+        """
+        content_id = state.content_id
+        if content_id is None or content_id not in self.content_store:
+            content_id = self.content_store.put(state.processed_content_of_resume)
+
+        self._pending_rows.append(
+            {
+                "resume": resume_name,
+                "view_path": view_path,
+                "content_id": content_id,
+                "is_content_truncated": state.is_content_truncated,
+                "is_scanned_document": state.is_scanned_document,
+                "working_experience": state.extracted_working_exp,
+                "email": state.extracted_email,
+                "contact": state.extracted_contact,
+                **self._outcome_record(state),
+            }
+        )
+
+    @property
+    def table(self) -> pa.Table:
+        """All results as an Arrow table"""
+        if self._pending_rows:
+            self._table = pa.concat_tables(
+                [
+                    self._table,
+                    pa.Table.from_pylist(self._pending_rows, schema=RESULTS_SCHEMA),
+                ]
+            )
+            self._pending_rows = []
+        return self._table
+
+    def copy(self) -> "ResultsStore":
+        """
+        Copy of the results whose outcomes can be updated on their own. Arrow tables
+        are immutable and the content store only ever gains texts, so both are shared.
+        """
+        results_store = ResultsStore(self.content_store)
+        results_store._table = self.table
+        return results_store
+
+    def update_outcomes(self, states: Iterable[PipelineStateManager]):
+        """
+        Replace the scoring columns after the resumes were rescored
+
+        Args:
+            states: The rescored state of every row, in row order
+        """
+        outcomes = pa.Table.from_pylist(
+            [self._outcome_record(state) for state in states], schema=OUTCOME_SCHEMA
+        )
+        if outcomes.num_rows != len(self):
+            raise ValueError(
+                f"Expected {len(self)} rescored results, got {outcomes.num_rows}"
+            )
+
+        table = self.table
+        for field in OUTCOME_SCHEMA:
+            table = table.set_column(
+                table.schema.get_field_index(field.name), field, outcomes[field.name]
+            )
+        self._table = table
+
+    def rows(self, indexes: Sequence[int]) -> List[dict]:
+        """The given rows as dicts, in the order of `indexes`"""
+        return self.table.take(indexes).to_pylist()
+
+    def content(self, content_id: str) -> str:
+        """Processed text of a resume, by the content id of its row"""
+        return self.content_store.get(content_id)
+
+    def to_pandas(self, indexes: Optional[Sequence[int]] = None) -> pd.DataFrame:
+        """
+        The results (or the given rows) as a DataFrame backed by the Arrow buffers,
+        for display and export
+        """
+        table = self.table if indexes is None else self.table.take(indexes)
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    def to_parquet_bytes(self) -> bytes:
+        """The results table as a Parquet file, e.g. for a download"""
+        buffer = io.BytesIO()
+        pq.write_table(self.table, buffer)
+        return buffer.getvalue()
+
+    def save(self, directory: str):
+        """Write the results and the resume texts as Parquet files to a directory"""
+        os.makedirs(directory, exist_ok=True)
+        pq.write_table(self.table, os.path.join(directory, RESULTS_FILE_NAME))
+        self.content_store.save(os.path.join(directory, CONTENT_FILE_NAME))
+
+    @staticmethod
+    def load(directory: str) -> "ResultsStore":
+        """Read results written by `save`, the results file is memory mapped"""
+        results_store = ResultsStore(
+            ContentStore.load(os.path.join(directory, CONTENT_FILE_NAME))
+        )
+        results_store._table = pq.read_table(
+            os.path.join(directory, RESULTS_FILE_NAME), memory_map=True
+        ).cast(RESULTS_SCHEMA)
+        return results_store
+
+    @staticmethod
+    def _outcome_record(state: PipelineStateManager) -> dict:
+        return {
+            "score": state.score,
+            "mandatory_keywords_score": state.mandatory_keywords_score,
+            "optional_keywords_score": state.optional_keywords_score,
+            "passed": state.passed,
+            "skipped": state.skip_pipeline_from_execution,
+            "screening_outcome": state.screening_outcome or None,
+            "mandatory_keyword_matches": state.mandatory_keyword_matches,
+            "missing_mandatory_keywords": state.missing_mandatory_keywords,
+            "matched_optional_groups": [
+                {"group": group_name, "terms": matched_terms}
+                for group_name, matched_terms in state.matched_optional_groups.items()
+            ],
+        }
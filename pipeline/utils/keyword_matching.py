@@ -1,4 +1,15 @@
 import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Token a keyword needs in the resume for the prefilter to let it through
+VERSIONED_TOKEN = "versioned"  # the word followed by optional version digits
+JS_TOKEN = "js"  # the word, or the word directly followed by "js"
+EXACT_TOKEN = "exact"  # the word itself
+
+# State fields `find_screening_keyword_hits` reads and writes
+KEYWORD_HIT_FIELDS = ("keyword_hits", "keyword_hits_signature", "scanned_keyword_hits")
 
 # [TODO]
 # - Add support for fuzzy type matching by defining variations of the keyword
@@ -8,14 +19,27 @@ class KeywordMatchingUtils:
     """Utility class containing shared keyword matching logic."""
 
     @staticmethod
-    def build_keyword_matching_pattern(keyword: str) -> str:
-        """Generate the appropriate regex pattern based on keyword type"""
+    def split_keyword(keyword: str) -> Tuple[str, bool]:
+        """
+        Split a keyword into the literal part that is matched and whether it names a
+        JS technology, e.g. "HTML5" -> ("HTML", False), "Node.js" -> ("Node", True)
+        """
         # Strip version number from keyword for matching, e.g. HTML5 matches HTML, CSS3 matches CSS
         keyword_base = re.sub(r"\d+$", "", keyword)
 
         # (HACKY WAY TO HANDLE TECHNOLOGY NAMES)
         if keyword.endswith("js") or keyword.lower().endswith(".js"):
-            return rf"\b{re.escape(keyword_base.replace('.js', '').replace('js', ''))}(?:\.?js|\s+js)?\b"
+            return keyword_base.replace(".js", "").replace("js", ""), True
+
+        return keyword_base, False
+
+    @staticmethod
+    def build_keyword_matching_pattern(keyword: str) -> str:
+        """Generate the appropriate regex pattern based on keyword type"""
+        keyword_base, is_js_keyword = KeywordMatchingUtils.split_keyword(keyword)
+
+        if is_js_keyword:
+            return rf"\b{re.escape(keyword_base)}(?:\.?js|\s+js)?\b"
 
         # Default case - match base keyword with optional version number
         return rf"\b{re.escape(keyword_base)}\d*\b"
@@ -57,3 +81,265 @@ class KeywordMatchingUtils:
             if keyword in text:
                 return True, keyword
             return False, None
+
+    @staticmethod
+    def screening_keywords(screening_config) -> Tuple[str, ...]:
+        """All mandatory and optional terms of a screening config, as they are matched"""
+        keywords = list(screening_config.mandatory_screening_params)
+        for group in screening_config.optional_screening_params:
+            keywords.extend(term.strip() for term in group.terms)
+
+        return tuple(dict.fromkeys(keywords))
+
+    @staticmethod
+    def screening_matcher_signature(screening_config) -> tuple:
+        """(keywords, case_sensitive, use_partial_matching) of a screening config"""
+        return (
+            KeywordMatchingUtils.screening_keywords(screening_config),
+            screening_config.use_case_sensitive,
+            screening_config.use_partial_matching,
+        )
+
+    @staticmethod
+    def find_screening_keyword_hits(
+        state, screening_config
+    ) -> Dict[str, Tuple[str, ...]]:
+        """
+        Return the hits of every screening keyword in the processed resume content.
+
+        The text is scanned once per screening config, the hits are kept on the state
+        so that the mandatory and optional matchers share a single scan. Only the
+        first hit of each keyword is kept, the matchers don't read any other.
+        """
+        return KeywordMatchingUtils.find_keyword_hits(
+            state, KeywordMatchingUtils.screening_matcher_signature(screening_config)
+        )
+
+    @staticmethod
+    def find_keyword_hits(state, signature: tuple) -> Dict[str, Tuple[str, ...]]:
+        """
+        Like `find_screening_keyword_hits`, for a precomputed matcher signature.
+
+        The hits list every keyword of the signature, in that order. Keywords already
+        scanned for the same matching settings are not scanned again.
+        """
+        if state.keyword_hits_signature != signature:
+            keywords, case_sensitive, use_partial_matching = signature
+            scanned_hits = state.scanned_keyword_hits.setdefault(
+                (case_sensitive, use_partial_matching), {}
+            )
+
+            new_keywords = tuple(
+                keyword for keyword in keywords if keyword not in scanned_hits
+            )
+            if new_keywords:
+                matcher = CompiledKeywordMatcher.compile(
+                    new_keywords, case_sensitive, use_partial_matching
+                )
+                if case_sensitive:
+                    hits = matcher.find_all(state.processed_content_of_resume)
+                else:
+                    hits = matcher.find_all(state.lowered_content, text_is_lowered=True)
+                scanned_hits.update(
+                    (keyword, tuple(keyword_hits[:1]))
+                    for keyword, keyword_hits in hits.items()
+                )
+
+            state.keyword_hits = {
+                keyword: scanned_hits[keyword] for keyword in keywords
+            }
+            state.keyword_hits_signature = signature
+
+        return state.keyword_hits
+
+
+class CompiledKeywordMatcher:
+    """
+    Matches a set of keywords against a text in a single scan.
+
+    All keyword patterns are combined into one alternation wrapped in a lookahead,
+    which finds every position where some keyword starts. Only the keywords starting
+    with the character at such a position are then tried there, each with its own
+    compiled pattern. The hits are the same as running `regex_based_keyword_matcher`
+    per keyword - the first hit of a keyword is the text it returns - but the text is
+    lowercased and scanned once instead of once per keyword.
+
+    For case-insensitive partial matching, the token index of the pipeline state also
+    serves as a cheap first tier: a keyword whose leading word is not among the
+    resume's tokens can't match, so its pattern never has to run.
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        case_sensitive: bool = False,
+        use_partial_matching: bool = True,
+    ):
+        self.keywords = tuple(dict.fromkeys(keywords))
+        self.case_sensitive = case_sensitive
+        self.use_partial_matching = use_partial_matching
+
+        # Keywords sharing a pattern (e.g. "Docker" and "docker") are matched once
+        keywords_by_pattern: Dict[str, List[str]] = defaultdict(list)
+        first_char_by_pattern: Dict[str, Optional[str]] = {}
+        compiled_patterns: Dict[str, re.Pattern] = {}
+
+        # Compiled pattern and token prefilter, (word, token kind), per keyword
+        self._keyword_patterns: Dict[str, re.Pattern] = {}
+        self._token_filters: Dict[str, Tuple[str, str]] = {}
+
+        for keyword in self.keywords:
+            matched_keyword = keyword if case_sensitive else keyword.lower()
+
+            if use_partial_matching:
+                pattern = KeywordMatchingUtils.build_keyword_matching_pattern(
+                    matched_keyword
+                )
+                literal, _ = KeywordMatchingUtils.split_keyword(matched_keyword)
+            else:
+                pattern = re.escape(matched_keyword)
+                literal = matched_keyword
+
+            keywords_by_pattern[pattern].append(keyword)
+            # Keywords without a literal part (e.g. "js") can start at any position
+            first_char_by_pattern[pattern] = literal[0] if literal else None
+
+            if pattern not in compiled_patterns:
+                compiled_patterns[pattern] = re.compile(pattern)
+            self._keyword_patterns[keyword] = compiled_patterns[pattern]
+
+            # Tokens come from the lowered text and partial matches start on a word
+            # boundary, exact (substring) matches don't
+            if use_partial_matching and not case_sensitive:
+                token_filter = self._build_token_filter(matched_keyword)
+                if token_filter:
+                    self._token_filters[keyword] = token_filter
+
+        # Candidate keywords per first character, None holds those matching anywhere
+        self._candidates: Dict[Optional[str], List[Tuple[re.Pattern, List[str]]]] = (
+            defaultdict(list)
+        )
+        for pattern, pattern_keywords in keywords_by_pattern.items():
+            self._candidates[first_char_by_pattern[pattern]].append(
+                (compiled_patterns[pattern], pattern_keywords)
+            )
+        self._wildcard_candidates = self._candidates.pop(None, [])
+
+        alternation = "|".join(keywords_by_pattern) or "(?!)"
+        if self._wildcard_candidates:
+            scanner_pattern = f"(?=(?:{alternation}))"
+        else:
+            # Reject positions by their first character before trying the alternation
+            first_chars = "".join(re.escape(char) for char in self._candidates)
+            scanner_pattern = f"(?=[{first_chars}])(?=(?:{alternation}))"
+        self._scanner = re.compile(scanner_pattern)
+
+    @staticmethod
+    def _build_token_filter(keyword: str) -> Optional[Tuple[str, str]]:
+        """
+        Token the lowered keyword needs in the resume, as (word, token kind), or None
+        if the keyword can't be prefiltered (empty literal or starting with a non-word
+        character)
+        """
+        literal, is_js_keyword = KeywordMatchingUtils.split_keyword(keyword)
+        word_match = re.match(r"\w+", literal)
+        if not word_match:
+            return None
+
+        word = word_match.group()
+        if word != literal:
+            # A non-word character follows, so the word is a token of its own
+            return word, EXACT_TOKEN
+
+        return word, JS_TOKEN if is_js_keyword else VERSIONED_TOKEN
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def compile(
+        keywords: Tuple[str, ...],
+        case_sensitive: bool = False,
+        use_partial_matching: bool = True,
+    ) -> "CompiledKeywordMatcher":
+        """Return the shared matcher for the given keywords and matching settings"""
+        return CompiledKeywordMatcher(keywords, case_sensitive, use_partial_matching)
+
+    def find_all(
+        self, text: str, text_is_lowered: bool = False
+    ) -> Dict[str, List[str]]:
+        """
+        Find every hit of every keyword in the text
+
+        Args:
+            text: The text to search in
+            text_is_lowered: Whether the text is already lowercased, e.g. the
+                `lowered_content` view of the pipeline state
+
+        Returns:
+            Mapping of keyword to the matched texts in order of appearance, empty for
+            keywords that were not found
+        """
+        if not self.case_sensitive and not text_is_lowered:
+            text = text.lower()
+
+        hits: Dict[str, List[str]] = {keyword: [] for keyword in self.keywords}
+        for candidate_match in self._scanner.finditer(text):
+            position = candidate_match.start()
+            first_char = text[position : position + 1]
+            for candidates in (
+                self._candidates.get(first_char, ()),
+                self._wildcard_candidates,
+            ):
+                for pattern, keywords in candidates:
+                    match = pattern.match(text, position)
+                    if match:
+                        for keyword in keywords:
+                            hits[keyword].append(match.group(0))
+
+        return hits
+
+    def rejects(self, keywords: Iterable[str], state) -> bool:
+        """
+        First tier, True if any of the keywords is certainly not in the resume.
+
+        The substring checks run for every keyword before the token checks, so most
+        resumes are rejected without being tokenized.
+        """
+        keywords = list(keywords)
+        return not all(
+            self._contains_word(keyword, state) for keyword in keywords
+        ) or not all(self._has_token(keyword, state) for keyword in keywords)
+
+    def may_match(self, keyword: str, state) -> bool:
+        """First tier for a single keyword, False if it is certainly not in the resume"""
+        return self._contains_word(keyword, state) and self._has_token(keyword, state)
+
+    def first_hit(self, keyword: str, state) -> Optional[str]:
+        """Return the first matched text of a keyword in the resume, None if not found"""
+        if not self._contains_word(keyword, state):
+            return None
+
+        pattern = self._keyword_patterns[keyword]
+        if self.case_sensitive:
+            match = pattern.search(state.processed_content_of_resume)
+        else:
+            match = pattern.search(state.lowered_content)
+
+        return match.group(0) if match else None
+
+    def _contains_word(self, keyword: str, state) -> bool:
+        token_filter = self._token_filters.get(keyword)
+        return token_filter is None or token_filter[0] in state.lowered_content
+
+    def _has_token(self, keyword: str, state) -> bool:
+        token_filter = self._token_filters.get(keyword)
+        if token_filter is None:
+            return True
+
+        word, token_kind = token_filter
+        if word in state.token_set:
+            return True
+        if token_kind == VERSIONED_TOKEN:
+            return word in state.versionless_token_set
+        if token_kind == JS_TOKEN:
+            return word + "js" in state.token_set
+        return False
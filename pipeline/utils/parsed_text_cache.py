@@ -0,0 +1,177 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Optional, Tuple
+
+import pymupdf
+
+from pipeline.config import (
+    PARSED_TEXT_CACHE_DIR,
+    PARSED_TEXT_CACHE_MAX_BYTES,
+    RESUME_PARSER_VERSION,
+)
+
+# Fraction of `max_bytes` the cache is trimmed down to once it overflows, so that
+# a full cache does not trigger an eviction on every single write
+EVICTION_LOW_WATERMARK = 0.9
+
+
+class ParsedTextCache:
+    """
+    Disk-backed, content-addressed cache of the text extracted from resume PDFs.
+
+    Entries are keyed by the SHA-256 of the PDF bytes and namespaced by the PyMuPDF
+    and parser versions, so upgrading either one never serves stale text. The cache
+    is bounded in size and evicts the least recently used entries first.
+
+    Each entry is a single line of JSON metadata followed by the UTF-8 encoded text.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = PARSED_TEXT_CACHE_DIR,
+        max_bytes: int = PARSED_TEXT_CACHE_MAX_BYTES,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.version_tag = (
+            f"pymupdf-{pymupdf.VersionBind}-parser-{RESUME_PARSER_VERSION}"
+        )
+        self.entries_dir = os.path.join(cache_dir, self.version_tag)
+
+        # Hit/miss counters
+        self.hits: int = 0
+        self.misses: int = 0
+
+        # Total size of the cache on disk, computed lazily on the first write
+        self._size_in_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+        os.makedirs(self.entries_dir, exist_ok=True)
+
+    @staticmethod
+    def digest(content) -> str:
+        """Return the cache key for the given PDF bytes (bytes, memoryview, ...)"""
+        return hashlib.sha256(content).hexdigest()
+
+    def get(self, digest: str) -> Optional[Tuple[str, dict]]:
+        """
+        Look up the parsed text for a PDF
+
+        Args:
+            digest: Cache key, the SHA-256 hex digest of the PDF bytes
+
+        Returns:
+            (text, metadata) on a hit - the text may be empty for PDFs without a
+            text layer - or None on a miss
+        """
+        path = self._entry_path(digest)
+        try:
+            with open(path, "rb") as f:
+                header, _, data = f.read().partition(b"\n")
+            metadata = json.loads(header)
+            text = data.decode("utf-8", "surrogatepass")
+        except FileNotFoundError:
+            self._record_lookup(hit=False)
+            return None
+        except ValueError:
+            # Corrupt entry, treat it as a miss so that it gets rewritten
+            self._record_lookup(hit=False)
+            return None
+
+        # Refresh the modification time so that eviction treats the entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self._record_lookup(hit=True)
+        return text, metadata
+
+    def put(self, digest: str, text: str, metadata: dict = None):
+        """Store the parsed text for a PDF, evicting old entries if the cache is full"""
+        header = json.dumps(metadata or {}).encode("utf-8")
+        data = header + b"\n" + text.encode("utf-8", "surrogatepass")
+        path = self._entry_path(digest)
+
+        try:
+            # Rewriting an entry (e.g. after a corrupt read) replaces its old size
+            replaced_size = os.stat(path).st_size
+        except OSError:
+            replaced_size = 0
+
+        try:
+            # Write to a temporary file first so readers never observe a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.entries_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self._logger.warning(f"Failed to write parsed text cache entry: {str(e)}")
+            return
+
+        with self._lock:
+            if self._size_in_bytes is None:
+                self._size_in_bytes = sum(size for _, _, size in self._scan_entries())
+            else:
+                self._size_in_bytes += len(data) - replaced_size
+
+            if self._size_in_bytes > self.max_bytes:
+                self._evict()
+
+    def stats(self) -> dict:
+        """Return the hit/miss counters of this cache instance"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _entry_path(self, digest: str) -> str:
+        return os.path.join(self.entries_dir, f"{digest}.txt")
+
+    def _record_lookup(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _scan_entries(self):
+        """Yield (path, mtime, size) for every entry, including those of older versions"""
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".txt"):
+                    continue
+
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    # Evicted concurrently by another process
+                    continue
+                yield path, stat.st_mtime, stat.st_size
+
+    def _evict(self):
+        """Remove least recently used entries until the cache is below its low watermark"""
+        entries = sorted(self._scan_entries(), key=lambda entry: entry[1])
+        total_size = sum(size for _, _, size in entries)
+        target_size = self.max_bytes * EVICTION_LOW_WATERMARK
+
+        for path, _, size in entries:
+            if total_size <= target_size:
+                break
+
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+        self._size_in_bytes = total_size
@@ -1,11 +1,93 @@
 import re
+from functools import lru_cache
+
+DEFAULT_PRESERVE_CHARS = ".@+\\-,:/ "
+
+# Placeholder for characters that are replaced by a space, picked so that it never
+# collides with a preserved character
+PLACEHOLDER_CANDIDATES = "\x00\x01\x02\x03"
+
+SPACE_RUNS_REGEX = re.compile(r" {2,}")
+
+
+class _NormalizationTable(dict):
+    """
+    Translation table for `str.translate`, filled lazily per code point: whitespace
+    maps to a space, disallowed characters to the placeholder, the rest to itself
+    """
+
+    def __init__(self, allowed_char_pattern: re.Pattern, placeholder: str):
+        super().__init__()
+        self.allowed_char_pattern = allowed_char_pattern
+        self.placeholder = placeholder
+
+    def __missing__(self, code_point: int):
+        char = chr(code_point)
+        if char.isspace():
+            value = " "
+        elif self.allowed_char_pattern.match(char):
+            value = code_point
+        else:
+            value = self.placeholder
+
+        self[code_point] = value
+        return value
+
+
+class TextNormalizer:
+    """
+    Compiled text normalizer, built once per `preserve_chars` setting.
+
+    Produces the same output as collapsing whitespace runs into a single space and
+    then replacing every character that is neither alphanumeric, whitespace nor
+    preserved with a space. ASCII text takes a single translate pass plus one regex.
+    `str.translate` only has a fast path for ASCII, so other text (e.g. with bullets
+    or dashes) is split on whitespace and cleaned with one regex instead.
+    """
+
+    def __init__(self, preserve_chars: str = DEFAULT_PRESERVE_CHARS):
+        self.preserve_chars = preserve_chars
+        self.placeholder = next(
+            char for char in PLACEHOLDER_CANDIDATES if char not in preserve_chars
+        )
+        self._table = _NormalizationTable(
+            re.compile(f"[\\w{re.escape(preserve_chars)}]"), self.placeholder
+        )
+        self._disallowed_char_regex = re.compile(
+            f"[^\\w\\s{re.escape(preserve_chars)}]"
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def for_preserve_chars(preserve_chars: str = DEFAULT_PRESERVE_CHARS):
+        """Return the shared normalizer for the given `preserve_chars` setting"""
+        return TextNormalizer(preserve_chars)
+
+    def normalize(self, content: str) -> str:
+        if not content:
+            return ""
+
+        if not content.isascii():
+            return self._disallowed_char_regex.sub(
+                " ", " ".join(content.split())
+            ).strip()
+
+        # Whitespace becomes a space and disallowed characters the placeholder
+        content = content.translate(self._table)
+
+        # Collapse whitespace runs, placeholders keep their own space each
+        content = SPACE_RUNS_REGEX.sub(" ", content)
+
+        return content.replace(self.placeholder, " ").strip()
 
 
 class TextProcessingUtils:
     """Utility class for text processing operations"""
 
     @staticmethod
-    def process_content(content: str, preserve_chars: str = ".@+\\-,:/ ") -> str:
+    def process_content(
+        content: str, preserve_chars: str = DEFAULT_PRESERVE_CHARS
+    ) -> str:
         """
         Clean and normalize text content
 
@@ -16,18 +98,4 @@ class TextProcessingUtils:
         Returns:
             Cleaned and normalized text
         """
-        if not content:
-            return ""
-
-        # Replace multiple newlines with a single space
-        content = re.sub(r"\n+", " ", content)
-
-        # Replace multiple spaces with a single space
-        content = re.sub(r"\s+", " ", content)
-
-        # Remove any non-alphanumeric characters that aren't in the preserve list
-        pattern = f"[^\\w\\s{re.escape(preserve_chars)}]"
-        content = re.sub(pattern, " ", content)
-
-        # Final cleanup and normalization
-        return content.strip()
+        return TextNormalizer.for_preserve_chars(preserve_chars).normalize(content)
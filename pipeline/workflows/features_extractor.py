@@ -1,6 +1,6 @@
 from pipeline.pipeline import WorkflowUnit
 from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
-from pipeline.state_managers.global_state_manager import GlobalStateManager
+from pipeline.state_managers.screening_config import ScreeningConfig
 import re
 from pipeline.decorators import logger
 
@@ -13,27 +13,41 @@ MONTHS_REGEX = r"(\d+)\s*(?:months|month|mo)\s*(?:of\s+experience|exp|working)?"
 
 
 class DataExtractor(WorkflowUnit):
+    reads = ("processed_content_of_resume", "lowered_content")
+    writes = ("extracted_working_exp", "extracted_email", "extracted_contact")
 
     @logger
     def execute_workflow_unit(
-        self, state: PipelineStateManager, global_state: GlobalStateManager
+        self, state: PipelineStateManager, global_state: ScreeningConfig
     ) -> PipelineStateManager:
         """
         Extracts total years of experience, including decimal values and cases where only months are mentioned.
         """
 
         text = state.processed_content_of_resume
+        lowered_text = state.lowered_content
 
         max_experience = 0.0
 
+        # The substring checks on the lowered text skip regexes that can't match.
+        # (Case-insensitive "s" also matches "ſ", so the years check stops at "yr")
+
         # Find years of experience (supports decimals like "2.6 years")
-        years_match = re.findall(YEARS_REGEX, text, re.IGNORECASE)
+        years_match = (
+            re.findall(YEARS_REGEX, text, re.IGNORECASE)
+            if "year" in lowered_text or "yr" in lowered_text
+            else None
+        )
         if years_match:
             # Convert to float to handle decimals
             max_experience = max(map(float, years_match))
 
         # Find months of experience and convert to years
-        months_match = re.findall(MONTHS_REGEX, text, re.IGNORECASE)
+        months_match = (
+            re.findall(MONTHS_REGEX, text, re.IGNORECASE)
+            if "mo" in lowered_text
+            else None
+        )
         if months_match:
             # Convert months to fraction of a year
             months_experience = max(map(int, months_match)) / 12
@@ -44,7 +58,7 @@ class DataExtractor(WorkflowUnit):
         )
 
         # Extract email address
-        email_match = re.search(EMAIL_REGEX, text)
+        email_match = re.search(EMAIL_REGEX, text) if "@" in text else None
         if email_match:
             state.extracted_email = email_match.group(0)
 
@@ -60,7 +74,7 @@ class DataExtractor(WorkflowUnit):
         }
 
     def assert_prerequisites_for_workflow_unit(
-        self, state: PipelineStateManager, global_state: GlobalStateManager
+        self, state: PipelineStateManager, global_state: ScreeningConfig
     ):
         return (
             state.processed_content_of_resume
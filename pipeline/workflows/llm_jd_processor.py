@@ -3,9 +3,9 @@ from pipeline.pipeline import WorkflowUnit
 from pipeline.prompts.llm_jd_processing import PROMPT
 from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
 from pipeline.state_managers.global_state_manager import GlobalStateManager
+import asyncio
 import ollama
 import json
-import time
 from pipeline.config import __MOCK_LLM_MODE__
 
 
@@ -13,7 +13,7 @@ class LLMJobDescriptionProcessor(WorkflowUnit):
     """Uses LLM to process and optimize the job description"""
 
     @logger
-    def execute_workflow_unit(
+    async def execute_workflow_unit(
         self, state: PipelineStateManager, global_state: GlobalStateManager
     ) -> PipelineStateManager:
         """Process the job description with an LLM"""
@@ -27,12 +27,14 @@ class LLMJobDescriptionProcessor(WorkflowUnit):
             f.write(prompt)
 
         if __MOCK_LLM_MODE__:
-            time.sleep(5)
+            await asyncio.sleep(5)
             with open("llm_jd_processor_output.json", "r") as f:
                 output_from_llm = f.read()
         else:
-            output_from_llm = ollama.generate(
-                model="qwen2.5-coder", prompt=prompt, format="json"
+            output_from_llm = (
+                await ollama.AsyncClient().generate(
+                    model="qwen2.5-coder", prompt=prompt, format="json"
+                )
             ).response
 
         # Parse the JSON response and update state
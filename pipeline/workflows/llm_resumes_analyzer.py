@@ -1,3 +1,4 @@
+import asyncio
 import ollama
 from pipeline.config import __MOCK_LLM_MODE__
 from pipeline.decorators import logger
@@ -7,12 +8,11 @@ from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
 from pipeline.state_managers.global_state_manager import GlobalStateManager
 from pipeline.exceptions import PipelineFailedException
 import json
-import time
 
 
 class LLMResumesAnalyzer(WorkflowUnit):
     @logger
-    def execute_workflow_unit(
+    async def execute_workflow_unit(
         self,
         state: PipelineStateManager,
         global_state: GlobalStateManager = None,
@@ -42,7 +42,7 @@ class LLMResumesAnalyzer(WorkflowUnit):
             f.write(prompt)
 
         if __MOCK_LLM_MODE__:
-            time.sleep(5)
+            await asyncio.sleep(5)
             with open("llm_resumes_analyzer_output.json", "r") as f:
                 output_from_llm_analysis = f.read()
 
@@ -52,8 +52,10 @@ class LLMResumesAnalyzer(WorkflowUnit):
             except json.JSONDecodeError:
                 print("Failed to parse JSON, using raw string")
         else:
-            output_from_llm_analysis = ollama.generate(
-                model="qwen2.5-coder", prompt=prompt, format="json"
+            output_from_llm_analysis = (
+                await ollama.AsyncClient().generate(
+                    model="qwen2.5-coder", prompt=prompt, format="json"
+                )
             ).response
 
         if not __MOCK_LLM_MODE__:
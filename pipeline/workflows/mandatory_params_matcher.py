@@ -1,31 +1,79 @@
 from pipeline.decorators import logger
 from pipeline.pipeline import WorkflowUnit
 from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
-from pipeline.state_managers.global_state_manager import GlobalStateManager
-from pipeline.utils.keyword_matching import KeywordMatchingUtils
+from pipeline.state_managers.screening_config import ScreeningConfig
+from pipeline.utils.keyword_matching import (
+    CompiledKeywordMatcher,
+    KEYWORD_HIT_FIELDS,
+    KeywordMatchingUtils,
+)
 
 
 class MandatoryParamsMatcher(WorkflowUnit):
+    reads = ("processed_content_of_resume", "lowered_content", *KEYWORD_HIT_FIELDS)
+    # The token views are built (lazily) by the prefilter, no other unit reads them
+    writes = (
+        *KEYWORD_HIT_FIELDS,
+        "token_set",
+        "versionless_token_set",
+        "mandatory_keyword_matches",
+        "missing_mandatory_keywords",
+        "passed",
+        "mandatory_keywords_score",
+        "skip_pipeline_from_execution",
+        "pipeline_skip_reason",
+    )
 
     @logger
     def execute_workflow_unit(
-        self, state: PipelineStateManager, global_state: GlobalStateManager
+        self, state: PipelineStateManager, global_state: ScreeningConfig
     ) -> PipelineStateManager:
         """Check mandatory keywords and return results"""
         missing = []
         matched_keywords = []
 
-        for keyword in global_state.mandatory_screening_params:
-            exists, matched_text = KeywordMatchingUtils.regex_based_keyword_matcher(
-                keyword=keyword,
-                text=state.processed_content_of_resume,
-                case_sensitive=global_state.use_case_sensitive,
-                use_partial_matching=global_state.use_partial_matching,
-            )
+        signature = KeywordMatchingUtils.screening_matcher_signature(global_state)
+        _, case_sensitive, use_partial_matching = signature
+        matcher = CompiledKeywordMatcher.compile(*signature)
+        mandatory_keywords = global_state.mandatory_screening_params
+
+        # Hits stored by earlier runs (e.g. before a rescore) answer without the text,
+        # only the keywords not scanned yet go through the token prefilter
+        scanned_hits = state.scanned_keyword_hits.setdefault(
+            (case_sensitive, use_partial_matching), {}
+        )
+        unscanned_keywords = [
+            keyword for keyword in mandatory_keywords if keyword not in scanned_hits
+        ]
+        misses_stored_keyword = any(
+            scanned_hits.get(keyword) == () for keyword in mandatory_keywords
+        )
+
+        if misses_stored_keyword or matcher.rejects(unscanned_keywords, state):
+            # The resume is already rejected, skip the full scan and only look up
+            # the mandatory keywords, kept for the next run
+            for keyword in unscanned_keywords:
+                first_hit = matcher.first_hit(keyword, state)
+                scanned_hits[keyword] = () if first_hit is None else (first_hit,)
+            first_hits = {
+                keyword: next(iter(scanned_hits[keyword]), None)
+                for keyword in mandatory_keywords
+            }
+        else:
+            # Single scan for the mandatory and optional keywords, or the hits already
+            # stored for this config, which don't need the text at all
+            keyword_hits = KeywordMatchingUtils.find_keyword_hits(state, signature)
+            first_hits = {
+                keyword: hits[0] if hits else None
+                for keyword, hits in keyword_hits.items()
+            }
+
+        for keyword in mandatory_keywords:
+            first_hit = first_hits[keyword]
             matched_keyword = (
-                matched_text if global_state.use_partial_matching else keyword
+                first_hit if global_state.use_partial_matching else keyword
             )
-            if not exists:
+            if first_hit is None:
                 missing.append(keyword)
             else:
                 matched_keywords.append(matched_keyword.capitalize())
@@ -45,7 +93,7 @@ class MandatoryParamsMatcher(WorkflowUnit):
         return state, state.passed
 
     def assert_prerequisites_for_workflow_unit(
-        self, state: PipelineStateManager, global_state: GlobalStateManager
+        self, state: PipelineStateManager, global_state: ScreeningConfig
     ):
         if not global_state.mandatory_screening_params:
             raise ValueError(
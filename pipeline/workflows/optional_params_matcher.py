@@ -1,16 +1,29 @@
+from typing import List
+
+import numpy as np
+
 from pipeline.decorators import logger
 from pipeline.pipeline import WorkflowUnit
 from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
-from pipeline.state_managers.global_state_manager import GlobalStateManager
-from pipeline.utils.keyword_matching import KeywordMatchingUtils
+from pipeline.state_managers.screening_config import ScreeningConfig
+from pipeline.scoring.optional_group_scorer import OptionalGroupScorer
+from pipeline.utils.keyword_matching import KEYWORD_HIT_FIELDS, KeywordMatchingUtils
 
 
 class OptionalParamsMatcher(WorkflowUnit):
     """Pipeline stage that checks for optional keyword groups and calculates scores."""
 
+    reads = (
+        "processed_content_of_resume",
+        "lowered_content",
+        "extracted_working_exp",
+        *KEYWORD_HIT_FIELDS,
+    )
+    writes = (*KEYWORD_HIT_FIELDS, "optional_keywords_score", "matched_optional_groups")
+
     @logger
     def execute_workflow_unit(
-        self, state: PipelineStateManager, global_state: GlobalStateManager
+        self, state: PipelineStateManager, global_state: ScreeningConfig
     ) -> PipelineStateManager:
         """Calculate scores for optional keyword groups and update state"""
 
@@ -21,22 +34,22 @@ class OptionalParamsMatcher(WorkflowUnit):
         # Calculate experience factor for boosting
         experience_factor = min(1.5, 1 + (state.extracted_working_exp / 10))
 
+        # Reuses the scan of the mandatory matcher when it ran for the same config
+        keyword_hits = KeywordMatchingUtils.find_screening_keyword_hits(
+            state, global_state
+        )
+
         # First pass - calculate base scores without boost
         for group in global_state.optional_screening_params:
-            group_name = group["name"]
-            group_weight = group["weight"]
+            group_name = group.name
+            group_weight = group.weight
             total_weight += group_weight  # No factor here - just sum raw weights
 
             matched_terms = []
-            for term in group["terms"]:
-                exists, matched_text = KeywordMatchingUtils.regex_based_keyword_matcher(
-                    keyword=term.strip(),
-                    text=state.processed_content_of_resume,
-                    case_sensitive=global_state.use_case_sensitive,
-                    use_partial_matching=global_state.use_partial_matching,
-                )
-                if exists:
-                    matched_terms.append(matched_text.capitalize())
+            for term in group.terms:
+                hits = keyword_hits[term.strip()]
+                if hits:
+                    matched_terms.append(hits[0].capitalize())
 
             if matched_terms:
                 optional_score += group_weight / len(matched_terms)
@@ -66,13 +79,45 @@ class OptionalParamsMatcher(WorkflowUnit):
 
         return state, state.optional_keywords_score
 
+    @logger
+    def execute_workflow_unit_batch(
+        self, states: List[PipelineStateManager], global_state: ScreeningConfig
+    ) -> List[PipelineStateManager]:
+        """
+        Calculate the optional keyword scores of a batch of resumes in one go, with
+        the same results as running `execute_workflow_unit` on every state
+        """
+        scorer = OptionalGroupScorer.from_screening_config(global_state)
+        signature = KeywordMatchingUtils.screening_matcher_signature(global_state)
+
+        keyword_hits = [
+            KeywordMatchingUtils.find_keyword_hits(state, signature) for state in states
+        ]
+        working_experience = np.fromiter(
+            (state.extracted_working_exp for state in states),
+            dtype=np.float64,
+            count=len(states),
+        )
+        group_match_counts = scorer.group_match_counts(
+            scorer.presence_matrix(keyword_hits, signature[0])
+        )
+        scores = scorer.score(group_match_counts, working_experience)
+
+        for state, hits, counts, score in zip(
+            states, keyword_hits, group_match_counts.tolist(), scores.tolist()
+        ):
+            state.optional_keywords_score = score
+            state.matched_optional_groups = scorer.matched_groups(hits, counts)
+
+        return states, {"scored_resumes": len(states)}
+
     def assert_prerequisites_for_workflow_unit(
-        self, state: PipelineStateManager, global_state: GlobalStateManager
+        self, state: PipelineStateManager, global_state: ScreeningConfig
     ) -> bool:
         """Validate that the state has processed content and optional keywords."""
+        # Decided from the state's metadata, a spilled text is not read back for it
         return (
-            hasattr(state, "processed_content_of_resume")
-            and state.processed_content_of_resume
+            state.has_processed_content
             and hasattr(global_state, "optional_screening_params")
             and global_state.optional_screening_params
         )
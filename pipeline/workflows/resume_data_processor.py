@@ -1,15 +1,19 @@
 from pipeline.decorators import logger
 from pipeline.pipeline import WorkflowUnit
 from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
-from pipeline.state_managers.global_state_manager import GlobalStateManager
+from pipeline.state_managers.screening_config import ScreeningConfig
 from pipeline.utils.text_processing import TextProcessingUtils
 
 
 class ResumeDataProcessor(WorkflowUnit):
+    reads = ("raw_content_of_resume",)
+    # The raw text is released once processed. The lowered view is built here, as
+    # the units reading it next run concurrently
+    writes = ("processed_content_of_resume", "raw_content_of_resume", "lowered_content")
 
     @logger
     def execute_workflow_unit(
-        self, state: PipelineStateManager, global_state: GlobalStateManager = None
+        self, state: PipelineStateManager, global_state: ScreeningConfig = None
     ) -> PipelineStateManager:
         """
         Clean and preprocess the resume content
@@ -17,10 +21,14 @@ class ResumeDataProcessor(WorkflowUnit):
         content = TextProcessingUtils.process_content(state.raw_content_of_resume)
 
         state.processed_content_of_resume = content.strip()
+        state.build_lowered_content()
+
+        # The later stages only read the processed content
+        state.release_raw_content()
 
         return state, "Resume processed successfully"
 
     def assert_prerequisites_for_workflow_unit(
-        self, state: PipelineStateManager, global_state: GlobalStateManager = None
+        self, state: PipelineStateManager, global_state: ScreeningConfig = None
     ) -> bool:
         return state.raw_content_of_resume and type(state.raw_content_of_resume) is str
@@ -1,60 +1,253 @@
 import os
+from typing import List, Optional, Tuple
 import pymupdf
 
+from pipeline.config import (
+    RESUME_PARSER_MAX_CHARACTERS,
+    RESUME_PARSER_MAX_PAGES,
+)
 from pipeline.decorators import logger
 from pipeline.pipeline import WorkflowUnit
-from pipeline.state_managers.global_state_manager import GlobalStateManager
+from pipeline.state_managers.screening_config import ScreeningConfig
 from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
 from pipeline.exceptions import PipelineFailedException
+from pipeline.utils.parsed_text_cache import ParsedTextCache
+
+# Per the PDF specification the header must appear within the first 1024 bytes
+PDF_HEADER = b"%PDF-"
+PDF_HEADER_SEARCH_WINDOW = 1024
+
+SCANNED_RESUME_SKIP_REASON = "Cannot extract text from resume. This may be because the resume is a scanned PDF document. Please ensure the resume contains selectable text."
+
+
+def extract_page_range(source: str | bytes, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop), run by the workers of the extraction engine"""
+    if isinstance(source, str):
+        doc = pymupdf.open(source)
+    else:
+        doc = pymupdf.open(stream=source, filetype="pdf")
+
+    with doc:
+        return [doc[page_number].get_text() for page_number in range(start, stop)]
 
 
 class ResumeParser(WorkflowUnit):
+    """
+    Extracts the text of the resume PDF given by `state.resume_source`, either the
+    path of a file on disk or an in-memory buffer (bytes, memoryview or mmap) which
+    is read without touching disk. The parser keeps nothing per resume, one instance
+    serves every resume of a run.
 
-    def __init__(self, path: str):
+    Before extracting, the pages are triaged for font resources: documents without
+    any (scanned images) are flagged on the state and skipped right away.
+    Extraction stops after `max_pages` pages or `max_characters` characters, in which
+    case the state is marked as truncated.
+
+    With `page_parallel_min_pages` set, documents with at least that many pages to
+    extract are not extracted page by page. The parser sets `state.pages_to_split`
+    and skips the pipeline instead, for the caller (the extraction engine) to
+    extract the pages in ranges on its pool and run the pipeline again with their
+    texts in `state.page_texts`.
+    """
+
+    reads = ("resume_source", "resume_file_name", "page_texts")
+    writes = (
+        "resume_source",
+        "resume_digest",
+        "page_texts",
+        "pages_to_split",
+        "raw_content_of_resume",
+        "is_content_truncated",
+        "content_truncation_reason",
+        "is_scanned_document",
+        "skip_pipeline_from_execution",
+        "pipeline_skip_reason",
+    )
+
+    def __init__(
+        self,
+        cache: ParsedTextCache = None,
+        max_pages: int = RESUME_PARSER_MAX_PAGES,
+        max_characters: int = RESUME_PARSER_MAX_CHARACTERS,
+        page_parallel_min_pages: Optional[int] = None,
+    ):
 
-        self.path = path
+        self.cache = cache
+        self.max_pages = max_pages
+        self.max_characters = max_characters
+        self.page_parallel_min_pages = page_parallel_min_pages
 
     @logger
     def execute_workflow_unit(
         self,
         state: PipelineStateManager,
-        global_state: GlobalStateManager = None,
+        global_state: ScreeningConfig = None,
     ) -> PipelineStateManager:
         """
         Extract text from a PDF file using PyMuPDF
         """
-        text = ""
-        if not self.path.endswith(".pdf"):
-            logger.info(f"File {self.path} is not a PDF file, skipping...")
-            return state, "File is not a PDF file, skipping..."
-
-        try:
-            # Open the PDF file
-            with pymupdf.open(self.path) as doc:
-                # Extract text from each page
-                for page in doc:
-                    text += page.get_text()
-        except Exception as e:
-            raise Exception(f"Error extracting text from PDF: {str(e)}")
+        path = state.resume_source if isinstance(state.resume_source, str) else None
+        if path is None:
+            # Wrap the buffer without copying it, PyMuPDF and hashlib both accept a memoryview
+            content = memoryview(state.resume_source)
+        else:
+            try:
+                with open(path, "rb") as f:
+                    content = f.read()
+            except Exception as e:
+                raise Exception(f"Error reading PDF file: {str(e)}")
+        state.release_resume_source()
+        state.resume_digest = ParsedTextCache.digest(content)
+        page_texts, state.page_texts = state.page_texts, None
+
+        # Serve the text from the cache if this exact PDF has been parsed with the same budgets
+        cache_key = None
+        cached_entry = None
+        if self.cache is not None:
+            cache_key = (
+                f"{state.resume_digest}-{self.max_pages}p-{self.max_characters}c"
+            )
+            cached_entry = self.cache.get(cache_key)
+
+        if cached_entry is not None:
+            text, metadata = cached_entry
+        else:
+            try:
+                text, metadata = self._extract_text(content, page_texts)
+            except Exception as e:
+                raise Exception(f"Error extracting text from PDF: {str(e)}")
+
+            if metadata.get("pages_to_split"):
+                state.pages_to_split = metadata["pages_to_split"]
+                state.skip_pipeline_from_execution = True
+                return (
+                    state,
+                    f"Resume has {state.pages_to_split} pages to extract, splitting them into page ranges...",
+                )
+
+            if self.cache is not None:
+                self.cache.put(cache_key, text, metadata)
+
+        if metadata.get("is_scanned_document"):
+            # Routed here by the triage, callers can pick these up for a slower OCR lane
+            state.is_scanned_document = True
+            state.skip_pipeline_from_execution = True
+            state.pipeline_skip_reason = SCANNED_RESUME_SKIP_REASON
+            return state, "Resume has no text layer, skipping pipeline..."
 
         if len(text) == 0:
             state.skip_pipeline_from_execution = True
-            state.pipeline_skip_reason = "Cannot extract text from resume. This may be because the resume is a scanned PDF document. Please ensure the resume contains selectable text."
+            state.pipeline_skip_reason = SCANNED_RESUME_SKIP_REASON
             return state, "Resume is empty, skipping pipeline..."
 
         state.raw_content_of_resume = text
+        if metadata.get("truncation_reason"):
+            state.is_content_truncated = True
+            state.content_truncation_reason = metadata["truncation_reason"]
+
+        if cached_entry is not None:
+            return state, "Resume parsed successfully (served from parsed text cache)"
 
         return state, "Resume parsed successfully"
 
+    def _extract_text(
+        self, content: bytes | memoryview, page_texts: Optional[List[str]] = None
+    ) -> Tuple[str, dict]:
+        """
+        Extract the text of the document within the page and character budgets
+
+        Args:
+            content: Content of the PDF
+            page_texts: Texts of the pages to extract, if they were extracted in ranges
+
+        Returns:
+            (text, metadata) - metadata holds `truncation_reason` (empty if nothing
+            was cut) and `is_scanned_document`, or `pages_to_split` if the pages are
+            to be extracted in ranges first
+        """
+        truncation_reason = ""
+
+        with pymupdf.open(stream=content, filetype="pdf") as doc:
+            if self._is_image_only_document(doc):
+                return "", {"truncation_reason": "", "is_scanned_document": True}
+
+            page_count = doc.page_count
+            pages_to_extract = min(page_count, self.max_pages)
+            if page_count > self.max_pages:
+                truncation_reason = f"Only the first {self.max_pages} of {page_count} pages were extracted"
+
+            # Long documents are handed back to be extracted in page ranges
+            if page_texts is None and (
+                self.page_parallel_min_pages is not None
+                and pages_to_extract >= self.page_parallel_min_pages
+            ):
+                return "", {"pages_to_split": pages_to_extract}
+
+            if page_texts is None:
+                page_texts = []
+                extracted_characters = 0
+                for page_number in range(pages_to_extract):
+                    page_text = doc[page_number].get_text()
+                    page_texts.append(page_text)
+
+                    # Stop as soon as the character budget is exhausted
+                    extracted_characters += len(page_text)
+                    if extracted_characters > self.max_characters:
+                        break
+
+        text = "".join(page_texts)
+        if len(text) > self.max_characters:
+            text = text[: self.max_characters]
+            truncation_reason = (
+                f"Only the first {self.max_characters} characters were extracted"
+            )
+
+        return text, {
+            "truncation_reason": truncation_reason,
+            "is_scanned_document": False,
+        }
+
+    def _is_image_only_document(self, doc: pymupdf.Document) -> bool:
+        """
+        Cheap triage for scanned PDFs: text can only be drawn with a font, so if none
+        of the pages within the page budget reference a font resource there is no text
+        layer to extract. Documents with text are usually settled on the first page, a
+        scanned cover letter in front of a typed resume only costs a few more lookups.
+        """
+        for page_number in range(min(doc.page_count, self.max_pages)):
+            if doc.get_page_fonts(page_number):
+                return False
+
+        return True
+
     def assert_prerequisites_for_workflow_unit(
-        self, state: PipelineStateManager, global_state: GlobalStateManager = None
+        self, state: PipelineStateManager, global_state: ScreeningConfig = None
     ):
-        if not os.path.exists(self.path):
-            self.abort_workflow_unit_from_execution(f"File not found at {self.path}")
+        source = state.resume_source
+        if source is None:
+            raise PipelineFailedException("No resume to parse, skipping...")
+
+        if not isinstance(source, str):
+            file_name = state.resume_file_name or "in-memory resume"
+            if state.resume_file_name and not file_name.lower().endswith(".pdf"):
+                raise PipelineFailedException(
+                    f"File `{file_name}` is not a PDF file, skipping..."
+                )
+
+            header = bytes(memoryview(source)[:PDF_HEADER_SEARCH_WINDOW])
+            if PDF_HEADER not in header:
+                raise PipelineFailedException(
+                    f"File `{file_name}` is not a valid PDF document, skipping..."
+                )
+
+            return True
+
+        if not os.path.exists(source):
+            self.abort_workflow_unit_from_execution(f"File not found at {source}")
 
-        if not self.path.endswith(".pdf"):
+        if not source.endswith(".pdf"):
             raise PipelineFailedException(
-                f"File `{self.path}` is not a PDF file, skipping..."
+                f"File `{source}` is not a PDF file, skipping..."
             )
 
         return True
@@ -1,17 +1,20 @@
 from pipeline.decorators import logger
 from pipeline.pipeline import WorkflowUnit
 from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
-from pipeline.state_managers.global_state_manager import GlobalStateManager
+from pipeline.state_managers.screening_config import ScreeningConfig
 
 
 class ScoreAggregator(WorkflowUnit):
     """Pipeline stage that calculates the final score based on keyword matching results."""
 
+    reads = ("mandatory_keywords_score", "optional_keywords_score")
+    writes = ("score",)
+
     @logger
     def execute_workflow_unit(
         self,
         state: PipelineStateManager,
-        global_state: GlobalStateManager = None,
+        global_state: ScreeningConfig = None,
     ) -> PipelineStateManager:
         """Aggregate the scores from the mandatory and optional keyword matching results"""
 
@@ -20,7 +23,7 @@ class ScoreAggregator(WorkflowUnit):
         return state, state.score
 
     def assert_prerequisites_for_workflow_unit(
-        self, state: PipelineStateManager, global_state: GlobalStateManager = None
+        self, state: PipelineStateManager, global_state: ScreeningConfig = None
     ) -> bool:
         """Validate that the state has mandatory keywords score and optional keywords score."""
         return hasattr(state, "mandatory_keywords_score") and hasattr(
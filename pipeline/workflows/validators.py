@@ -1,20 +1,21 @@
 from pipeline.decorators import logger
 from pipeline.pipeline import WorkflowUnit
 from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
-from pipeline.state_managers.global_state_manager import GlobalStateManager
+from pipeline.state_managers.screening_config import ScreeningConfig
 
 
 class PreScreeningValidator(WorkflowUnit):
+    reads = ("extracted_working_exp",)
+    writes = ("experience_check_message",)
 
     @logger
     def execute_workflow_unit(
-        self, state: PipelineStateManager, global_state: GlobalStateManager
+        self, state: PipelineStateManager, global_state: ScreeningConfig
     ) -> PipelineStateManager:
         """Validate experience requirements and return appropriate message"""
         if state.extracted_working_exp == 0.0:
             message = "Failed to extract experience from resume, continuing with further evaluation..."
-            state.skip_pipeline = True
-            state.pipeline_skip_reason = message
+            state.experience_check_message = message
             return state, message
 
         if (
@@ -22,13 +23,12 @@ class PreScreeningValidator(WorkflowUnit):
             and state.extracted_working_exp < global_state.working_exp_criteria
         ):
             message = f"Experience is less than the required experience! Required experience: {global_state.working_exp_criteria} years, but found experience: {state.extracted_working_exp} years"
-            state.skip_pipeline = True
-            state.pipeline_skip_reason = message
+            state.experience_check_message = message
             return state, message
 
         return state, "Experience matched! Proceeding with further evaluation..."
 
     def assert_prerequisites_for_workflow_unit(
-        self, state: PipelineStateManager, global_state: GlobalStateManager
+        self, state: PipelineStateManager, global_state: ScreeningConfig
     ):
         return True
@@ -1,39 +1,17 @@
-from pipeline.pipeline import PipelineOrchestrator
-from pipeline.workflows.validators import PreScreeningValidator
-from pipeline.workflows.mandatory_params_matcher import MandatoryParamsMatcher
-from pipeline.workflows.optional_params_matcher import OptionalParamsMatcher
-from pipeline.workflows.score_aggregator import ScoreAggregator
-from pipeline.workflows.resume_parser import ResumeParser
-from pipeline.workflows.resume_data_processor import ResumeDataProcessor
-from pipeline.workflows.features_extractor import DataExtractor
-from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+from pipeline.engines.archive_ingest import ArchiveIngestor, is_archive
+from pipeline.engines.extraction_engine import ResumeExtractionEngine
 from pipeline.state_managers.global_state_manager import GlobalStateManager
+from pipeline.state_managers.screening_config import ScreeningConfig
 from pipeline.config import ROLE_MATCHING_DEFINITIONS, JOB_DESC_FOR_JAVA_DEVELOPER
+import itertools
 import os
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
-import multiprocessing
 
 storage_path = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "./__storage__/JAVA")
 )
 
 
-def process_resume(file, storage_path, global_state):
-    pipeline_orchestrator = PipelineOrchestrator(
-        [
-            ("Resume Parser", ResumeParser(path=os.path.join(storage_path, file))),
-            ("Resume Data Processor", ResumeDataProcessor()),
-            ("Data Extractor", DataExtractor()),
-            ("Pre-screening Validator", PreScreeningValidator()),
-            ("Mandatory Keywords Matcher", MandatoryParamsMatcher()),
-            ("Optional Keywords Matcher", OptionalParamsMatcher()),
-            ("Score Aggregator", ScoreAggregator()),
-        ]
-    )
-    return pipeline_orchestrator.orchestrate(PipelineStateManager(), global_state)
-
-
 def main():
     try:
         global_state = GlobalStateManager(
@@ -46,20 +24,44 @@ def main():
             ],
             job_description=JOB_DESC_FOR_JAVA_DEVELOPER,
         )
-        results = []
-        with ProcessPoolExecutor(max_workers=multiprocessing.cpu_count()) as executor:
-            futures = [
-                executor.submit(process_resume, file, storage_path, global_state)
-                for file in os.listdir(storage_path)
-            ]
-            results = [future.result() for future in as_completed(futures)]
-        return results
+        # Snapshot shared by all workers of the run
+        screening_config = ScreeningConfig.from_global_state(global_state)
+        files = os.listdir(storage_path)
+        resumes = [
+            (file, os.path.join(storage_path, file))
+            for file in files
+            if not is_archive(file)
+        ]
+        archives = [
+            os.path.join(storage_path, file) for file in files if is_archive(file)
+        ]
+        screened_resumes = 0
+        with ResumeExtractionEngine() as engine:
+            # Archives (e.g. agency zips) are screened member by member without unpacking
+            ingestor = ArchiveIngestor(engine)
+            outcomes = itertools.chain(
+                engine.process(resumes, screening_config),
+                *(ingestor.ingest(archive, screening_config) for archive in archives),
+            )
+            # Results are printed as they complete rather than collected, so memory
+            # doesn't grow with the number of resumes
+            for resume_name, state, error in outcomes:
+                if error:
+                    print(f"Error processing {resume_name}: {error}")
+                    continue
+                print(
+                    f"{resume_name}: score {state.score:.2f}, "
+                    f"{'passed' if state.passed else 'not passed'}"
+                )
+                screened_resumes += 1
+        return screened_resumes
     except Exception as e:
         print(f"Error: {e}")
 
 
 if __name__ == "__main__":
     start_time = time.time()
-    results = main()
+    screened_resumes = main()
     end_time = time.time()
+    print(f"Screened {screened_resumes} resumes")
     print(f"Time taken: {end_time - start_time} seconds")
@@ -0,0 +1,98 @@
+import io
+import tarfile
+import unittest
+import zipfile
+
+from pipeline.engines.archive_ingest import ArchiveIngestor, is_archive
+from pipeline.state_managers.screening_config import ScreeningConfig
+
+
+class RecordingEngine:
+    """Stands in for the extraction engine, "screens" every resume it is given"""
+
+    def __init__(self):
+        self.max_in_flight_bytes = None
+
+    def process(
+        self, resumes, screening_config, max_in_flight_bytes=None, cancel_event=None
+    ):
+        self.max_in_flight_bytes = max_in_flight_bytes
+        for resume_name, content in resumes:
+            yield resume_name, bytes(content), None
+
+
+def build_zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        for name, content in members.items():
+            zip_file.writestr(name, content)
+    buffer.seek(0)
+    return buffer
+
+
+def build_tar(members):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar_file:
+        for name, content in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar_file.addfile(info, io.BytesIO(content))
+    buffer.seek(0)
+    return buffer
+
+
+MEMBERS = {
+    "agency/alice.pdf": b"%PDF- alice",
+    "agency/bob.PDF": b"%PDF- bob",
+    "agency/notes.txt": b"not a resume",
+    "__MACOSX/agency/._alice.pdf": b"resource fork",
+    "agency/.hidden.pdf": b"%PDF- hidden",
+    "agency/portfolio.pdf": b"%PDF- " + b"x" * 100,
+}
+
+
+class ArchiveIngestorTest(unittest.TestCase):
+    def ingest(self, archive, max_member_bytes=50):
+        engine = RecordingEngine()
+        ingestor = ArchiveIngestor(
+            engine, max_member_bytes=max_member_bytes, max_in_flight_bytes=1000
+        )
+        results = list(ingestor.ingest(archive, ScreeningConfig()))
+        return engine, results
+
+    def assert_ingested(self, results):
+        screened = {name: content for name, content, error in results if not error}
+        rejected = {name: error for name, _, error in results if error}
+
+        self.assertEqual(
+            screened,
+            {"agency/alice.pdf": b"%PDF- alice", "agency/bob.PDF": b"%PDF- bob"},
+        )
+        # Oversized members are reported rather than silently dropped
+        self.assertEqual(list(rejected), ["agency/portfolio.pdf"])
+        self.assertIn("the limit is 50 bytes", rejected["agency/portfolio.pdf"])
+
+    def test_zip_members(self):
+        engine, results = self.ingest(build_zip(MEMBERS))
+
+        self.assert_ingested(results)
+        self.assertEqual(engine.max_in_flight_bytes, 1000)
+
+    def test_tar_members(self):
+        _, results = self.ingest(build_tar(MEMBERS))
+
+        self.assert_ingested(results)
+
+    def test_count_resumes(self):
+        self.assertEqual(ArchiveIngestor.count_resumes(build_zip(MEMBERS)), 3)
+        # TAR archives would have to be read in full to be counted
+        self.assertIsNone(ArchiveIngestor.count_resumes(build_tar(MEMBERS)))
+
+    def test_is_archive(self):
+        self.assertTrue(is_archive("resumes.ZIP"))
+        self.assertTrue(is_archive("resumes.tar.gz"))
+        self.assertFalse(is_archive("resume.pdf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import threading
+import unittest
+from concurrent.futures import Future
+
+from pipeline.engines.extraction_engine import ResumeExtractionEngine
+from pipeline.engines.job_runner import ScreeningJobRunner
+from pipeline.scoring.leaderboard import ResumeLeaderboard
+from pipeline.state_managers.screening_config import ScreeningConfig
+from pipeline.storage.content_store import ContentStore
+from pipeline.storage.results_store import ResultsStore
+
+RESUMES = [("a.pdf", b"%PDF- a"), ("b.pdf", b"%PDF- b"), ("c.pdf", b"%PDF- c")]
+
+
+class StalledEngine(ResumeExtractionEngine):
+    """Engine whose resumes are never done screening"""
+
+    def __init__(self):
+        super().__init__(max_workers=1, max_total_in_flight=2)
+        self.submitted = []
+
+    def submit(self, resume_name, source, screening_config):
+        future = Future()
+        self.submitted.append(future)
+        return future
+
+
+class CancelTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = StalledEngine()
+        self.addCleanup(self.engine.shutdown)
+
+    def consume_in_background(self, results):
+        consumer = threading.Thread(target=list, args=(results,), daemon=True)
+        consumer.start()
+        return consumer
+
+    def assert_budget_is_free(self):
+        for _ in range(2):
+            self.assertTrue(self.engine._in_flight_budget.acquire(blocking=False))
+
+    def test_cancel_while_waiting_for_results(self):
+        cancel_event = threading.Event()
+        consumer = self.consume_in_background(
+            self.engine.process(RESUMES, ScreeningConfig(), cancel_event=cancel_event)
+        )
+        consumer.join(0.3)
+        self.assertEqual(len(self.engine.submitted), 2)
+
+        cancel_event.set()
+        consumer.join(2)
+
+        self.assertFalse(consumer.is_alive())
+        self.assertTrue(all(future.cancelled() for future in self.engine.submitted))
+        self.assert_budget_is_free()
+
+    def test_cancel_while_waiting_for_the_budget(self):
+        # Another batch holds the whole budget
+        for _ in range(2):
+            self.engine._in_flight_budget.acquire()
+        cancel_event = threading.Event()
+        consumer = self.consume_in_background(
+            self.engine.process(RESUMES, ScreeningConfig(), cancel_event=cancel_event)
+        )
+        consumer.join(0.3)
+
+        cancel_event.set()
+        consumer.join(2)
+
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(self.engine.submitted, [])
+
+    def test_cancelled_job_stops_right_away(self):
+        job = ScreeningJobRunner(self.engine).submit(
+            RESUMES,
+            [],
+            ScreeningConfig(mandatory_screening_params=("Java",)),
+            ResumeLeaderboard(),
+            ResultsStore(ContentStore()),
+            len(RESUMES),
+        )
+        self.assertFalse(job.wait(0.3))
+
+        job.cancel()
+
+        self.assertTrue(job.wait(2))
+        self.assertEqual(job.processed_resumes, 0)
+        self.assert_budget_is_free()
+
+
+if __name__ == "__main__":
+    unittest.main()
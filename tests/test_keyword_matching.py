@@ -0,0 +1,99 @@
+import random
+import unittest
+
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+from pipeline.utils.keyword_matching import CompiledKeywordMatcher, KeywordMatchingUtils
+
+KEYWORDS = (
+    # JS-style
+    "Node.js",
+    "ReactJS",
+    "vue.js",
+    # Versioned
+    "HTML5",
+    "CSS3",
+    "Python3",
+    # Only "js", matches anywhere
+    "js",
+    # Plain, with non-word characters and differing only in case
+    "Java",
+    "JavaScript",
+    "C++",
+    ".NET",
+    "C#",
+    "Spring Boot",
+    "Docker",
+    "docker",
+)
+
+# Variants of the keywords as they are written in resumes, plus near misses
+RESUME_WORDS = (
+    "node.js nodejs node js Node.JS NodeJS node reactjs React.js react js ReactJS "
+    "Vue.js vue vuejs html html5 HTML5 html4 xhtml css css3 CSS3 scss python "
+    "python3 Python2 py js JS json jsx java Java8 javascript JavaScript c++ C++ c "
+    "cpp .net .NET asp.net dotnet c# C# spring boot Spring Boot springboot docker "
+    "Docker dockerfile senior developer"
+).split()
+RESUME_PUNCTUATION = ("", "", "", ",", ".", ":", "(", ")", "/", "-")
+
+
+def build_text(rng: random.Random) -> str:
+    return " ".join(
+        rng.choice(RESUME_WORDS) + rng.choice(RESUME_PUNCTUATION)
+        for _ in range(rng.randint(0, 12))
+    )
+
+
+class CompiledKeywordMatcherTest(unittest.TestCase):
+    """The compiled matcher gives the hits of `regex_based_keyword_matcher`"""
+
+    def assert_same_hits(self, case_sensitive: bool, use_partial_matching: bool):
+        matcher = CompiledKeywordMatcher(KEYWORDS, case_sensitive, use_partial_matching)
+
+        rng = random.Random(0)
+        for _ in range(500):
+            text = build_text(rng)
+            state = PipelineStateManager()
+            state.processed_content_of_resume = text
+
+            hits = matcher.find_all(text)
+            for keyword in KEYWORDS:
+                _, expected_hit = KeywordMatchingUtils.regex_based_keyword_matcher(
+                    keyword, text, case_sensitive, use_partial_matching
+                )
+                message = f"{keyword!r} in {text!r}"
+
+                self.assertEqual(
+                    hits[keyword][0] if hits[keyword] else None, expected_hit, message
+                )
+                self.assertEqual(
+                    matcher.first_hit(keyword, state), expected_hit, message
+                )
+                # The prefilter never rejects a keyword that is in the text
+                if expected_hit is not None:
+                    self.assertTrue(matcher.may_match(keyword, state), message)
+                    self.assertFalse(matcher.rejects([keyword], state), message)
+
+    def test_partial_matching(self):
+        self.assert_same_hits(case_sensitive=False, use_partial_matching=True)
+
+    def test_case_sensitive_partial_matching(self):
+        self.assert_same_hits(case_sensitive=True, use_partial_matching=True)
+
+    def test_exact_matching(self):
+        self.assert_same_hits(case_sensitive=False, use_partial_matching=False)
+
+    def test_case_sensitive_exact_matching(self):
+        self.assert_same_hits(case_sensitive=True, use_partial_matching=False)
+
+    def test_find_all_lists_every_hit_in_order(self):
+        matcher = CompiledKeywordMatcher(("HTML5", "Node.js"))
+
+        hits = matcher.find_all("HTML, NodeJS and html5 with node js")
+
+        self.assertEqual(hits["HTML5"], ["html", "html5"])
+        self.assertEqual(hits["Node.js"], ["nodejs", "node js"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import random
+import unittest
+
+from pipeline.scoring.leaderboard import ResumeLeaderboard
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+
+
+def scored_state(score: float, experience: float = 0.0) -> PipelineStateManager:
+    state = PipelineStateManager()
+    state.score = score
+    state.extracted_working_exp = experience
+    return state
+
+
+def ranked_names(entries):
+    return [resume_name for resume_name, _, _ in entries]
+
+
+class ResumeLeaderboardTest(unittest.TestCase):
+    def build_leaderboard(self, top_k=3, count=10, seed=0):
+        rng = random.Random(seed)
+        leaderboard = ResumeLeaderboard(top_k)
+        for number in range(count):
+            # Few distinct values, so that scores and experiences tie
+            state = scored_state(rng.choice((10.0, 50.0, 90.0)), rng.choice((1.0, 3.0)))
+            leaderboard.add(f"r{number}.pdf", state)
+        return leaderboard
+
+    def expected_ranking(self, leaderboard):
+        ranked = sorted(
+            enumerate(leaderboard.entries),
+            key=lambda item: (
+                -item[1][1].score,
+                -item[1][1].extracted_working_exp,
+                item[0],
+            ),
+        )
+        return [entry[0] for _, entry in ranked]
+
+    def test_ranking_order(self):
+        leaderboard = ResumeLeaderboard()
+        leaderboard.add("low.pdf", scored_state(10.0, 9.0))
+        leaderboard.add("first_tie.pdf", scored_state(50.0, 2.0))
+        leaderboard.add("senior.pdf", scored_state(50.0, 5.0))
+        leaderboard.add("second_tie.pdf", scored_state(50.0, 2.0))
+
+        self.assertEqual(
+            ranked_names(leaderboard.top()),
+            ["senior.pdf", "first_tie.pdf", "second_tie.pdf", "low.pdf"],
+        )
+
+    def test_pages_within_and_beyond_the_top_k(self):
+        for seed in range(20):
+            leaderboard = self.build_leaderboard(seed=seed)
+
+            pages = [ranked_names(leaderboard.page(number, 4)) for number in range(4)]
+
+            self.assertEqual(len(leaderboard.top()), 3)
+            self.assertEqual(
+                [name for page in pages for name in page],
+                self.expected_ranking(leaderboard),
+            )
+            self.assertEqual([len(page) for page in pages], [4, 4, 2, 0])
+
+    def test_page_indexes_point_at_the_entries(self):
+        leaderboard = self.build_leaderboard()
+
+        self.assertEqual(
+            [leaderboard.entries[index] for index in leaderboard.page_indexes(1, 4)],
+            leaderboard.page(1, 4),
+        )
+
+    def test_pages_follow_added_resumes(self):
+        leaderboard = self.build_leaderboard()
+        leaderboard.page(2, 4)
+
+        leaderboard.add("best.pdf", scored_state(100.0))
+        leaderboard.add("worst.pdf", scored_state(0.0))
+
+        self.assertEqual(ranked_names(leaderboard.page(0, 1)), ["best.pdf"])
+        self.assertEqual(ranked_names(leaderboard.page(11, 1)), ["worst.pdf"])
+
+    def test_refresh_and_copy(self):
+        leaderboard = self.build_leaderboard()
+        copy = leaderboard.copy()
+
+        for _, state, _ in copy.entries:
+            state.score = 100.0 - state.score
+        copy.refresh()
+
+        self.assertEqual(ranked_names(copy.page(0, 10)), self.expected_ranking(copy))
+        self.assertEqual(
+            ranked_names(leaderboard.page(0, 10)), self.expected_ranking(leaderboard)
+        )
+        self.assertNotEqual(
+            ranked_names(copy.page(0, 10)), ranked_names(leaderboard.page(0, 10))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pipeline.utils.parsed_text_cache import ParsedTextCache
+
+TEXT = "x" * 30  # entries of 33 bytes, with the "{}\n" header
+
+
+class ParsedTextCacheTest(unittest.TestCase):
+    def setUp(self):
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.cache_dir = temporary_directory.name
+
+    def test_entries_are_keyed_by_content(self):
+        cache = ParsedTextCache(self.cache_dir)
+        digest = ParsedTextCache.digest(b"%PDF- resume")
+
+        self.assertIsNone(cache.get(digest))
+        cache.put(digest, "Java developer", {"is_content_truncated": True})
+
+        self.assertEqual(
+            cache.get(ParsedTextCache.digest(memoryview(b"%PDF- resume"))),
+            ("Java developer", {"is_content_truncated": True}),
+        )
+        self.assertIsNone(cache.get(ParsedTextCache.digest(b"%PDF- other")))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    def test_corrupt_entry_is_a_miss(self):
+        cache = ParsedTextCache(self.cache_dir)
+        with open(os.path.join(cache.entries_dir, "digest.txt"), "wb") as f:
+            f.write(b"not json\ntext")
+
+        self.assertIsNone(cache.get("digest"))
+
+    def test_parser_version_namespaces_the_entries(self):
+        ParsedTextCache(self.cache_dir).put("digest", "old text")
+
+        with mock.patch(
+            "pipeline.utils.parsed_text_cache.RESUME_PARSER_VERSION", "next"
+        ):
+            cache = ParsedTextCache(self.cache_dir)
+
+        self.assertIn("parser-next", cache.version_tag)
+        self.assertIsNone(cache.get("digest"))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = ParsedTextCache(self.cache_dir, max_bytes=100)
+        for age, digest in enumerate(("a", "b", "c")):
+            cache.put(digest, TEXT)
+            os.utime(cache._entry_path(digest), (1000 + age, 1000 + age))
+
+        # Reading "a" makes it the most recently used
+        self.assertIsNotNone(cache.get("a"))
+        # Over the limit, evicted down to 90% of it: "b" and then "c" go
+        cache.put("d", TEXT)
+
+        remaining = [
+            digest for digest in "abcd" if os.path.exists(cache._entry_path(digest))
+        ]
+        self.assertEqual(remaining, ["a", "d"])
+
+
+if __name__ == "__main__":
+    unittest.main()
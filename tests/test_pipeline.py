@@ -0,0 +1,102 @@
+import unittest
+
+from pipeline.pipeline import PIPELINE_SKIP_FIELD, PipelineOrchestrator, WorkflowUnit
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+
+
+class RecordingUnit(WorkflowUnit):
+    """
+    Unit with the given declarations, recording that it ran and skipping the pipeline
+    for the states `skips` returns True for
+    """
+
+    def __init__(self, log, reads=(), writes=(), skips=None):
+        self.log = log
+        self.reads = reads
+        self.writes = writes
+        self.skips = skips
+
+    def execute_workflow_unit(self, state, global_state=None):
+        self.log.append(self)
+        if self.skips is not None and self.skips(state):
+            state.skip_pipeline_from_execution = True
+        return state, None
+
+    def assert_prerequisites_for_workflow_unit(self, state, global_state=None):
+        return True
+
+
+def build_pipeline(*declarations):
+    """Pipeline of recording units, from (reads, writes) pairs"""
+    log = []
+    units = [RecordingUnit(log, reads, writes) for reads, writes in declarations]
+    return PipelineOrchestrator([(None, unit) for unit in units]), units, log
+
+
+class DependencyResolutionTest(unittest.TestCase):
+    def test_reader_waits_for_the_writer_listed_after_it(self):
+        pipeline, _, _ = build_pipeline((("x",), ("y",)), ((), ("x",)))
+
+        self.assertEqual(pipeline.dependencies, [frozenset({1}), frozenset()])
+        self.assertEqual(pipeline.execution_levels, [[1], [0]])
+
+    def test_independent_units_share_a_level(self):
+        pipeline, _, _ = build_pipeline(
+            ((), ("a",)), ((), ("b",)), (("a", "b"), ("c",))
+        )
+
+        self.assertEqual(pipeline.execution_levels, [[0, 1], [2]])
+
+    def test_writers_of_the_same_field_keep_their_order(self):
+        pipeline, _, _ = build_pipeline((("a",), ("x",)), (("b",), ("x",)))
+
+        self.assertEqual(pipeline.execution_levels, [[0], [1]])
+
+    def test_undeclared_units_keep_their_place(self):
+        pipeline, _, _ = build_pipeline(((), ("a",)), (None, None), ((), ("b",)))
+
+        self.assertEqual(pipeline.execution_levels, [[0], [1], [2]])
+
+    def test_cyclic_dependencies_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, "cyclic dependencies"):
+            build_pipeline((("y",), ("x",)), (("x",), ("y",)))
+
+
+class SkipFieldOrderingTest(unittest.TestCase):
+    def test_units_after_a_skipping_unit_wait_for_it(self):
+        pipeline, _, _ = build_pipeline(
+            ((), ("a",)), ((), ("b", PIPELINE_SKIP_FIELD)), ((), ("c",))
+        )
+
+        # Units listed before the one that may skip don't wait for it
+        self.assertEqual(pipeline.execution_levels, [[0, 1], [2]])
+
+    def test_skip_halts_the_units_after_it(self):
+        pipeline, units, log = build_pipeline(
+            ((), ("a",)), ((), ("b", PIPELINE_SKIP_FIELD)), ((), ("c",))
+        )
+        units[1].skips = lambda state: True
+
+        state = pipeline.orchestrate(PipelineStateManager())
+
+        self.assertTrue(state.skip_pipeline_from_execution)
+        self.assertCountEqual(log, units[:2])
+
+    def test_skip_halts_only_the_skipped_states_of_a_batch(self):
+        pipeline, units, log = build_pipeline(
+            ((), ("b", PIPELINE_SKIP_FIELD)), ((), ("c",))
+        )
+        units[0].skips = lambda state: state.resume_file_name == "skip.pdf"
+
+        pipeline.orchestrate_many(
+            [
+                PipelineStateManager(resume_file_name="skip.pdf"),
+                PipelineStateManager(resume_file_name="keep.pdf"),
+            ]
+        )
+
+        self.assertEqual(log, [units[0], units[0], units[1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
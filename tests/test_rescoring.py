@@ -0,0 +1,169 @@
+import unittest
+
+from pipeline.engines.extraction_engine import build_resume_scoring_stages
+from pipeline.engines.rescoring import ResumeRescorer
+from pipeline.pipeline import PipelineOrchestrator
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+from pipeline.state_managers.screening_config import ScreeningConfig, ScreeningGroup
+from pipeline.storage.content_store import ContentStore
+
+RESUME_TEXTS = (
+    "Java developer, Spring Boot, Docker and AWS",
+    "Python and Django developer",
+    "Java, Kubernetes and Node.js",
+)
+
+JAVA_CONFIG = ScreeningConfig(
+    mandatory_screening_params=("Java",),
+    optional_screening_params=(
+        ScreeningGroup("Cloud", 1.0, ("AWS", "Kubernetes")),
+        ScreeningGroup("Frontend", 1.0, ("ReactJS", "Node.js")),
+    ),
+)
+
+
+class CountingContentStore(ContentStore):
+    """Content store counting how often a spilled text is read back"""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def get(self, content_id: str, default: str = "") -> str:
+        self.reads += 1
+        return super().get(content_id, default)
+
+
+def spilled_states(content_store):
+    states = []
+    for text in RESUME_TEXTS:
+        state = PipelineStateManager(resume_file_name="resume.pdf")
+        state.processed_content_of_resume = text
+        state.extracted_working_exp = 3.0
+        state.spill_processed_content(content_store)
+        states.append(state)
+    return states
+
+
+def outcomes(states):
+    return [
+        (
+            state.score,
+            state.passed,
+            state.screening_outcome,
+            state.mandatory_keyword_matches,
+            state.matched_optional_groups,
+        )
+        for state in states
+    ]
+
+
+def score(states, screening_config):
+    for state in states:
+        state.reset_screening_outcome()
+        state.release_content_views()
+    PipelineOrchestrator(build_resume_scoring_stages()).orchestrate_many(
+        states, screening_config
+    )
+    return outcomes(states)
+
+
+class ScreeningConfigFingerprintTest(unittest.TestCase):
+    def test_equal_configs_have_equal_fingerprints(self):
+        def build_config():
+            return ScreeningConfig(
+                mandatory_screening_params=("Java",),
+                optional_screening_params=(ScreeningGroup("Cloud", 1.0, ("AWS",)),),
+            )
+
+        self.assertEqual(build_config().fingerprint, build_config().fingerprint)
+        self.assertEqual(len(build_config().fingerprint), 64)
+
+    def test_every_setting_changes_the_fingerprint(self):
+        fingerprints = {
+            config.fingerprint
+            for config in (
+                JAVA_CONFIG,
+                ScreeningConfig(mandatory_screening_params=("Python",)),
+                ScreeningConfig(mandatory_screening_params=("Java",)),
+                ScreeningConfig(
+                    mandatory_screening_params=("Java",), use_partial_matching=False
+                ),
+                ScreeningConfig(
+                    mandatory_screening_params=("Java",), use_case_sensitive=True
+                ),
+                ScreeningConfig(
+                    mandatory_screening_params=("Java",), working_exp_criteria=5.0
+                ),
+            )
+        }
+
+        self.assertEqual(len(fingerprints), 6)
+
+
+class StoredKeywordHitsTest(unittest.TestCase):
+    """The keyword matchers answer from the hits stored on the state"""
+
+    def test_same_config_doesnt_read_the_spilled_texts(self):
+        content_store = CountingContentStore()
+        states = spilled_states(content_store)
+
+        first_outcomes = score(states, JAVA_CONFIG)
+        self.assertEqual(content_store.reads, len(states))
+
+        self.assertEqual(score(states, JAVA_CONFIG), first_outcomes)
+        self.assertEqual(content_store.reads, len(states))
+
+    def test_rescored_outcomes_match_fresh_ones(self):
+        python_config = ScreeningConfig(mandatory_screening_params=("Python",))
+        states = spilled_states(CountingContentStore())
+
+        score(states, JAVA_CONFIG)
+        rescored = score(states, python_config)
+        # Back to keywords that were all scanned already
+        rescored_back = score(states, JAVA_CONFIG)
+
+        self.assertEqual(rescored, score(spilled_states(ContentStore()), python_config))
+        self.assertEqual(
+            rescored_back, score(spilled_states(ContentStore()), JAVA_CONFIG)
+        )
+        self.assertEqual([outcome[1] for outcome in rescored_back], [True, False, True])
+
+
+class ResumeRescorerTest(unittest.TestCase):
+    def test_round_trip(self):
+        content_store = CountingContentStore()
+        states = spilled_states(content_store)
+        # A scanned document, its (empty) text was spilled as well
+        scanned_state = PipelineStateManager(resume_file_name="scan.pdf")
+        scanned_state.spill_processed_content(content_store)
+        rescorer = ResumeRescorer()
+
+        # Rescorability is decided without reading the texts back
+        self.assertEqual(
+            [rescorer.can_be_rescored(state) for state in [*states, scanned_state]],
+            [True, True, True, False],
+        )
+        self.assertEqual(content_store.reads, 0)
+
+        self.assertEqual(rescorer.rescore([*states, scanned_state], JAVA_CONFIG), 3)
+        java_outcomes = outcomes(states)
+        self.assertEqual(content_store.reads, len(states))
+
+        # A new keyword is looked up in the texts, known ones are not
+        rescorer.rescore(
+            states, ScreeningConfig(mandatory_screening_params=("Python",))
+        )
+        self.assertEqual(content_store.reads, 2 * len(states))
+        rescorer.rescore(states, JAVA_CONFIG)
+        self.assertEqual(content_store.reads, 2 * len(states))
+
+        self.assertEqual(outcomes(states), java_outcomes)
+        self.assertEqual(
+            java_outcomes, score(spilled_states(ContentStore()), JAVA_CONFIG)
+        )
+        self.assertEqual(scanned_state.score, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import io
+import tempfile
+import unittest
+
+import pyarrow.parquet as pq
+
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+from pipeline.storage.content_store import ContentStore
+from pipeline.storage.results_store import RESULTS_SCHEMA, ResultsStore
+
+
+class CountingContentStore(ContentStore):
+    """Content store counting the texts put in it"""
+
+    def __init__(self):
+        super().__init__()
+        self.puts = 0
+
+    def put(self, text: str) -> str:
+        self.puts += 1
+        return super().put(text)
+
+
+def scored_state(text: str, score: float, passed: bool = True) -> PipelineStateManager:
+    state = PipelineStateManager(resume_file_name="resume.pdf")
+    state.processed_content_of_resume = text
+    state.score = score
+    state.passed = passed
+    state.mandatory_keyword_matches = ["Java"] if passed else []
+    state.missing_mandatory_keywords = [] if passed else ["Java"]
+    state.matched_optional_groups = {"Cloud": ["Aws"]}
+    if not passed:
+        state.skip_pipeline_from_execution = True
+        state.pipeline_skip_reason = "Mandatory Parameters not matched."
+    return state
+
+
+class ResultsStoreTest(unittest.TestCase):
+    def build_results_store(self):
+        results_store = ResultsStore()
+        results_store.append("a.pdf", scored_state("Java and AWS", 80.0), "view/a.pdf")
+        results_store.append("b.pdf", scored_state("Python", 0.0, passed=False))
+        return results_store
+
+    def test_rows(self):
+        results_store = self.build_results_store()
+
+        a, b = results_store.rows([0, 1])
+        self.assertEqual(len(results_store), 2)
+        self.assertEqual(
+            (a["resume"], a["view_path"], a["score"]), ("a.pdf", "view/a.pdf", 80.0)
+        )
+        self.assertEqual(
+            a["matched_optional_groups"], [{"group": "Cloud", "terms": ["Aws"]}]
+        )
+        self.assertEqual(results_store.content(a["content_id"]), "Java and AWS")
+        self.assertEqual(
+            (b["skipped"], b["screening_outcome"]),
+            (True, "Mandatory Parameters not matched."),
+        )
+        self.assertEqual(b["missing_mandatory_keywords"], ["Java"])
+
+    def test_spilled_text_is_stored_once(self):
+        content_store = CountingContentStore()
+        results_store = ResultsStore(content_store)
+        state = scored_state("Java and AWS", 80.0)
+
+        content_id = state.spill_processed_content(content_store)
+        results_store.append("a.pdf", state)
+
+        self.assertEqual(content_store.puts, 1)
+        self.assertEqual(results_store.rows([0])[0]["content_id"], content_id)
+
+    def test_text_spilled_elsewhere_is_copied(self):
+        results_store = ResultsStore()
+        state = scored_state("Java and AWS", 80.0)
+        state.spill_processed_content(ContentStore())
+
+        results_store.append("a.pdf", state)
+
+        content_id = results_store.rows([0])[0]["content_id"]
+        self.assertEqual(results_store.content(content_id), "Java and AWS")
+
+    def test_update_outcomes_leaves_copies_alone(self):
+        results_store = self.build_results_store()
+        copy = results_store.copy()
+
+        copy.update_outcomes([scored_state("", 10.0), scored_state("", 20.0)])
+
+        self.assertEqual(copy.table.column("score").to_pylist(), [10.0, 20.0])
+        self.assertEqual(results_store.table.column("score").to_pylist(), [80.0, 0.0])
+        with self.assertRaises(ValueError):
+            copy.update_outcomes([scored_state("", 10.0)])
+
+    def test_save_and_load(self):
+        results_store = self.build_results_store()
+
+        with tempfile.TemporaryDirectory() as directory:
+            results_store.save(directory)
+            loaded = ResultsStore.load(directory)
+
+            self.assertTrue(loaded.table.equals(results_store.table))
+            content_id = loaded.rows([1])[0]["content_id"]
+            self.assertEqual(loaded.content(content_id), "Python")
+
+    def test_parquet_export(self):
+        results_store = self.build_results_store()
+
+        table = pq.read_table(io.BytesIO(results_store.to_parquet_bytes()))
+
+        self.assertTrue(table.cast(RESULTS_SCHEMA).equals(results_store.table))
+        self.assertEqual(list(results_store.to_pandas([1])["resume"]), ["b.pdf"])
+
+
+if __name__ == "__main__":
+    unittest.main()
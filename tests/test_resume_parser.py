@@ -0,0 +1,79 @@
+import unittest
+
+import pymupdf
+
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+from pipeline.workflows.resume_parser import ResumeParser, extract_page_range
+
+
+def build_pdf(page_texts):
+    doc = pymupdf.open()
+    for page_text in page_texts:
+        page = doc.new_page()
+        if page_text:
+            page.insert_text((50, 50), page_text)
+        else:
+            # Image-only page, e.g. a scanned cover letter
+            page.draw_rect(pymupdf.Rect(10, 10, 100, 100), fill=(0, 0, 0))
+    return doc.tobytes()
+
+
+def parse(parser, content, page_texts=None):
+    state = PipelineStateManager(resume_source=content, resume_file_name="resume.pdf")
+    state.page_texts = page_texts
+    state, _ = parser.execute_workflow_unit(state)
+    return state
+
+
+class ResumeParserTest(unittest.TestCase):
+    def test_page_budget_truncates(self):
+        content = build_pdf([f"Page {number}" for number in range(5)])
+
+        state = parse(ResumeParser(max_pages=3), content)
+
+        self.assertEqual(state.raw_content_of_resume, "Page 0\nPage 1\nPage 2\n")
+        self.assertTrue(state.is_content_truncated)
+
+    def test_scanned_pages_in_front_of_text_are_extracted(self):
+        content = build_pdf(["", "", "", "Java developer"])
+
+        state = parse(ResumeParser(), content)
+
+        self.assertFalse(state.is_scanned_document)
+        self.assertEqual(state.raw_content_of_resume, "Java developer\n")
+
+    def test_image_only_document_is_skipped(self):
+        state = parse(ResumeParser(), build_pdf(["", ""]))
+
+        self.assertTrue(state.is_scanned_document)
+        self.assertTrue(state.skip_pipeline_from_execution)
+
+    def test_long_document_is_handed_back_for_page_ranges(self):
+        page_texts = [f"Page {number}" for number in range(12)]
+        content = build_pdf(page_texts)
+        parser = ResumeParser(page_parallel_min_pages=10)
+
+        state = parse(parser, content)
+        self.assertEqual(state.pages_to_split, 12)
+        self.assertTrue(state.skip_pipeline_from_execution)
+        self.assertEqual(state.raw_content_of_resume, "")
+
+        # The texts of the ranges give the text of the sequential extraction
+        ranges = [(0, 5), (5, 10), (10, 12)]
+        extracted_page_texts = [
+            page_text
+            for start, stop in ranges
+            for page_text in extract_page_range(content, start, stop)
+        ]
+        state = parse(parser, content, extracted_page_texts)
+
+        self.assertFalse(state.skip_pipeline_from_execution)
+        self.assertIsNone(state.page_texts)
+        self.assertEqual(
+            state.raw_content_of_resume,
+            parse(ResumeParser(), content).raw_content_of_resume,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from pipeline.engines.screening_job import ScreeningJob
+from pipeline.scoring.leaderboard import ResumeLeaderboard
+from pipeline.state_managers.pipeline_state_manager import PipelineStateManager
+from pipeline.storage.content_store import ContentStore
+from pipeline.storage.results_store import ResultsStore
+
+
+def screened_state(text: str, digest: str, score: float) -> PipelineStateManager:
+    state = PipelineStateManager(resume_file_name="resume.pdf")
+    state.processed_content_of_resume = text
+    state.resume_digest = digest
+    state.score = score
+    return state
+
+
+class ScreeningJobTest(unittest.TestCase):
+    def run_job(self, results, view_paths=None):
+        job = ScreeningJob(
+            iter(results),
+            ResumeLeaderboard(),
+            ResultsStore(ContentStore()),
+            len(results),
+            view_paths,
+        )
+        job.start().wait(10)
+        return job
+
+    def test_view_paths_follow_the_content_not_the_name(self):
+        job = self.run_job(
+            [
+                ("cv.pdf", screened_state("java", "digest-a", 80.0), None),
+                ("cv.pdf", screened_state("python", "digest-b", 90.0), None),
+            ],
+            view_paths={"digest-a": "viewer/a.pdf", "digest-b": "viewer/b.pdf"},
+        )
+
+        rows = job.results_store.rows(job.leaderboard.page_indexes(0, 10))
+        self.assertEqual(
+            [row["view_path"] for row in rows], ["viewer/b.pdf", "viewer/a.pdf"]
+        )
+
+    def test_errors_are_counted_apart(self):
+        job = self.run_job(
+            [
+                ("a.pdf", screened_state("java", "digest-a", 80.0), None),
+                ("b.pdf", None, "Not a PDF"),
+            ]
+        )
+
+        self.assertEqual(job.processed_resumes, 2)
+        self.assertEqual(job.completed_resumes, 1)
+        self.assertEqual(job.errors, [("b.pdf", "Not a PDF")])
+        self.assertEqual(len(job.leaderboard), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
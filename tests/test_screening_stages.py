@@ -0,0 +1,27 @@
+import unittest
+
+from pipeline.engines.extraction_engine import (
+    build_resume_scoring_stages,
+    build_resume_screening_stages,
+)
+from pipeline.pipeline import PipelineOrchestrator
+
+
+class ScreeningStageSchedulingTest(unittest.TestCase):
+    """The declared reads/writes of the screening units let independent units overlap"""
+
+    def test_screening_pipeline_levels(self):
+        pipeline = PipelineOrchestrator(build_resume_screening_stages())
+
+        # [Parser], [Processor], [Data Extractor, Mandatory], [Validator, Optional], [Aggregator]
+        self.assertEqual(pipeline.execution_levels, [[0], [1], [2, 4], [3, 5], [6]])
+
+    def test_scoring_pipeline_levels(self):
+        pipeline = PipelineOrchestrator(build_resume_scoring_stages())
+
+        # [Validator, Mandatory], [Optional], [Aggregator]
+        self.assertEqual(pipeline.execution_levels, [[0, 1], [2], [3]])
+
+
+if __name__ == "__main__":
+    unittest.main()
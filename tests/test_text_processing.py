@@ -0,0 +1,52 @@
+import random
+import re
+import unittest
+
+from pipeline.utils.text_processing import DEFAULT_PRESERVE_CHARS, TextProcessingUtils
+
+# Characters the random texts are drawn from: words, preserved punctuation, other
+# punctuation, ASCII and Unicode whitespace, bullets, accents and the placeholders
+ALPHABET = "abcXYZ019_ .@+-,:/\\;()[]*#\n\t\r\x0b\x0c\xa0  •–éß\x00\x01\x02"
+
+
+def process_content_with_regex_passes(
+    content: str, preserve_chars: str = DEFAULT_PRESERVE_CHARS
+) -> str:
+    """The normalization `TextNormalizer` replaced, the reference for its output"""
+    if not content:
+        return ""
+
+    content = re.sub(r"\n+", " ", content)
+    content = re.sub(r"\s+", " ", content)
+    content = re.sub(f"[^\\w\\s{re.escape(preserve_chars)}]", " ", content)
+    return content.strip()
+
+
+class ProcessContentTest(unittest.TestCase):
+    def test_same_output_as_the_regex_passes(self):
+        rng = random.Random(0)
+        for preserve_chars in (DEFAULT_PRESERVE_CHARS, "", ".", "\x00-", "•"):
+            for _ in range(2000):
+                length = rng.randint(0, 40)
+                text = "".join(rng.choice(ALPHABET) for _ in range(length))
+                # Half of the texts ASCII only, they take the translate path
+                if rng.random() < 0.5:
+                    text = text.encode("ascii", "ignore").decode()
+
+                self.assertEqual(
+                    TextProcessingUtils.process_content(text, preserve_chars),
+                    process_content_with_regex_passes(text, preserve_chars),
+                    f"{text!r} with {preserve_chars!r}",
+                )
+
+    def test_resume_text(self):
+        text = "  John Doe\n\n• Java, Spring Boot – 5+ years\t(AWS)  john@x.com  "
+
+        self.assertEqual(
+            TextProcessingUtils.process_content(text),
+            "John Doe   Java, Spring Boot   5+ years  AWS  john@x.com",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()